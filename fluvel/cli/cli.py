@@ -7,6 +7,7 @@ from fluvel import __version__
 from .commands.build import build
 from .commands.demo import demo
 from .commands.generate_stubs import generate_stubs
+from .commands.lint import lint
 from .commands.run import run
 from .commands.startproject import startproject
 
@@ -33,6 +34,8 @@ def main() -> None:
     - ``startproject``: Initializes a new Fluvel project structure.
 
     - ``build``: Prepares and optimizes the application for production use.
+
+    - ``lint``: Validates the inline styles of the project in parallel.
     """
     pass
 
@@ -42,6 +45,7 @@ main.add_command(startproject)
 main.add_command(run)
 main.add_command(demo)
 main.add_command(build)
+main.add_command(lint)
 main.add_command(generate_stubs, "generate-stubs")
 
 
@@ -3,19 +3,26 @@
 
 import re
 import shutil
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any
 
 import click
 
 from fluvel.cli.tools.ClickStyled import echo
 
 # Flvuel Utils
-from fluvel.core.tools import dump_json, load_style_sheet
+from fluvel.core.tools import dump_json, load_fluml
 
 # Expect Handler
 from fluvel.core.tools.expect_handler import expect
 
 # Fluvel Core
+from fluvel.engines import FlumlParser, XMLMenuParser
+from fluvel.engines.qss.ThemeCache import ThemeCache
+from fluvel.i18n.I18nBinaryCatalog import I18nBinaryCatalog
 from fluvel.i18n.I18nLoader import I18nLoader
 from fluvel.user.UserSettings import Settings
 from fluvel.utils.minify_qss import minify_qss
@@ -27,16 +34,26 @@ from fluvel.utils.paths import (
     THEMES_DIR,
 )
 
+# (language, kind, file)
+I18nTask = tuple[str, str, Path]
+
 
 @click.command
-def build() -> None:
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of worker processes used to compile the languages (defaults to the CPUs).",
+)
+def build(workers: int | None) -> None:
     """
     Builds the application for production mode.
 
     This command performs three main tasks:
 
     1. Compiles dynamic content (menus, static text) into optimized JSON files
-       for each language.\n
+       for each language, in parallel worker processes (see ``--workers``).\n
     2. Consolidates multi-file QSS themes into single, optimized QSS files.\n
     3. Switches the application's configuration from development mode to
        production mode by modifying the ``DEV_MODE`` key in ``config.toml``.
@@ -49,51 +66,139 @@ def build() -> None:
 
     PROD_STATIC_DIR.mkdir(parents=True)
 
-    generate_json_files()
+    generate_json_files(workers)
     generate_themes()
     change_dev_mode()
 
     echo("[green]([DONE]) Build completed successfully.")
 
 
-def generate_json_files() -> None:
+def generate_json_files(workers: int | None = None) -> None:
     """
     Generates optimized JSON files for static content and menus.
 
-    It iterates through all language folders in the development content directory
-    and uses :class:`fluvel.controllers.ContentHandler` to compile the
-    dynamic content into two static JSON files per language in the
-    production content directory:
+    The ``.fluml`` and ``.xml`` files of every language folder in the development
+    content directory are compiled in parallel worker processes (one task per file),
+    and merged per language into two static JSON files in the production content
+    directory:
 
     - ``menus/menus.json``: Contains all menu definitions.
     - ``<lang>.json``: Contains all static textual content.
+    - ``<lang>.flcat``: The same content as a memory-mapped binary catalog
+      (see :class:`~fluvel.i18n.I18nBinaryCatalog.I18nBinaryCatalog`).
 
-    This optimization speeds up content loading in production mode.
+    The files of a language are merged in sorted order, so the output doesn't depend
+    on the order in which the workers finish. This optimization speeds up content
+    loading in production mode.
 
+    :param workers: Number of worker processes (defaults to the number of CPUs).
+    :type workers: int | None
     :raises IOError: If there are issues creating directories or writing files.
     """
 
-    load_content = I18nLoader.load
-
     if not I18N_DIR.exists():
         return
 
-    for lang in I18N_DIR.iterdir():
-        prod_lang_dir = PROD_STATIC_DIR / lang.name
-        prod_lang_dir.mkdir(parents=True, exist_ok=True)
+    languages = sorted(folder.name for folder in I18N_DIR.iterdir() if folder.is_dir())
+
+    # (language, kind, file) in a deterministic order
+    tasks: list[I18nTask] = []
 
-        menus_folder = prod_lang_dir / "menus"
-        menus_folder.mkdir(parents=True, exist_ok=True)
+    for lang in languages:
+        menu_files, text_files = I18nLoader.get_files(I18N_DIR / lang, ("fluml", "xml"))
+        tasks.extend((lang, "menus", f) for f in sorted(menu_files))
+        tasks.extend((lang, "texts", f) for f in sorted(text_files))
 
-        raw = load_content(lang, False)
+    results: dict[int, dict[str, Any]] = {}
+    pending = Counter(lang for lang, _, _ in tasks)
+    done = 0
 
-        menus_json = menus_folder / "menus.json"
-        content_json = prod_lang_dir / f"{lang.name}.json"
+    def finish(lang: str) -> None:
+        nonlocal done
+        done += 1
 
-        dump_json(menus_json, raw.MENUS, indent=False)
-        dump_json(content_json, raw.TEXTS, indent=False)
+        parts = [(task, results[i]) for i, task in enumerate(tasks) if task[0] == lang]
+        write_language(lang, parts)
 
-        echo(f"[green]([LANG]) [blue]({lang.name}) successfully optimized.")
+        progress = f"{done}/{len(languages)}"
+        echo(f"[green]([LANG]) [blue]({lang}) successfully optimized. [black+]({progress})")
+
+    # Languages without files are still generated (empty)
+    for lang in languages:
+        if not pending[lang]:
+            finish(lang)
+
+    # A single file doesn't compensate the cost of starting the workers
+    if len(tasks) <= 1 or workers == 1:
+        completed = ((i, compile_i18n_file(kind, f)) for i, (_, kind, f) in enumerate(tasks))
+        _merge_results(completed, tasks, results, pending, finish)
+        return
+
+    echo(f"[blue]([LANG] Compiling {len(tasks)} files of {len(languages)} languages...)")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(compile_i18n_file, kind, f): i for i, (_, kind, f) in enumerate(tasks)
+        }
+        completed = ((futures[future], future.result()) for future in as_completed(futures))
+        _merge_results(completed, tasks, results, pending, finish)
+
+
+def _merge_results(
+    completed: Iterable[tuple[int, dict[str, Any]]],
+    tasks: list[I18nTask],
+    results: dict[int, dict[str, Any]],
+    pending: Counter,
+    finish: Callable[[str], None],
+) -> None:
+    for i, result in completed:
+        results[i] = result
+        lang = tasks[i][0]
+        pending[lang] -= 1
+
+        # The language is written as soon as all its files are compiled
+        if not pending[lang]:
+            finish(lang)
+
+
+def compile_i18n_file(kind: str, file: Path) -> dict[str, Any]:
+    """
+    Compiles a single i18n file (runs in a worker process).
+
+    :param kind: ``"menus"`` for ``.xml`` menu files or ``"texts"`` for ``.fluml`` files.
+    :type kind: str
+    :param file: The file to compile.
+    :type file: :class:`~pathlib.Path`
+    :returns: The menu structure or the ``{id: html}`` texts of the file.
+    :rtype: dict[str, Any]
+    """
+    if kind == "menus":
+        return XMLMenuParser.parse(file)
+
+    # The texts are formatted by I18nMessage in production (see I18nLoader)
+    return FlumlParser.parse(load_fluml(file), icu=True)
+
+
+def write_language(lang: str, parts: list[tuple[I18nTask, dict[str, Any]]]) -> None:
+    """
+    Merges the compiled files of a language (in task order) and writes its JSON files.
+    """
+    menus: dict[str, Any] = {}
+    texts: dict[str, str] = {}
+
+    for (_, kind, file), data in parts:
+        if kind == "menus":
+            menus[file.stem] = data
+        else:
+            texts.update(data)
+
+    prod_lang_dir = PROD_STATIC_DIR / lang
+    menus_folder = prod_lang_dir / "menus"
+    menus_folder.mkdir(parents=True, exist_ok=True)
+
+    dump_json(menus_folder / "menus.json", menus, indent=False)
+    dump_json(prod_lang_dir / f"{lang}.json", texts, indent=False)
+    I18nBinaryCatalog.write(prod_lang_dir / f"{lang}.flcat", texts)
 
 
 @expect.IOError()
@@ -102,10 +207,10 @@ def generate_themes() -> None:
     Consolidates QSS theme files into single production files.
 
     It iterates through all theme folders in the development themes directory.
-    For each theme, it recursively finds all ``.qss`` files, concatenates their
-    content using :func:`fluvel.core.tools.load_style_sheet`, and writes the
-    result to a single ``<theme_name>.qss`` file in the production themes
-    directory.
+    Each theme is consolidated through the :class:`~fluvel.engines.qss.ThemeCache.ThemeCache`,
+    so themes that did not change since the last ``fluvel run`` or build are not read
+    again, and the minified result is written to a single ``<theme_name>.qss`` file
+    in the production themes directory.
 
     :raises IOError: If there are issues creating directories or writing files.
     """
@@ -118,11 +223,14 @@ def generate_themes() -> None:
 
         theme_file = PROD_THEMES_DIR / f"{theme.name}.qss"
 
-        qss_content = "\n".join(load_style_sheet(f) for f in theme.rglob("*.qss"))
-        qss = minify_qss(qss_content)
+        compiled = ThemeCache.load(theme)
 
         with open(theme_file, "w", encoding="utf-8") as f:
-            f.write(qss)
+            f.write(minify_qss(compiled.qss))
+
+        # The variables are still needed by the inline styles ('bg[$primary]')
+        if compiled.variables:
+            dump_json(PROD_THEMES_DIR / f"{theme.name}.json", compiled.variables)
 
         echo(f"[green]([THEME]) [blue]({theme.name}) consolidated and minified.")
 
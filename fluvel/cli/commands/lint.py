@@ -0,0 +1,142 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import ast
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import click
+
+from fluvel.cli.tools.ClickStyled import echo
+
+# Fluvel Core
+from fluvel.engines.qss.qss import QSSProcessor
+from fluvel.engines.qss.ThemeCache import ThemeCache
+from fluvel.user.UserSettings import Settings
+from fluvel.utils.paths import CONFIG_PATH, PROJECT_ROOT, THEMES_DIR, UI_DIR
+
+# (file, line, style, errors), the style is empty if the module could not be analyzed
+LintIssue = tuple[str, int, str, tuple[str, ...]]
+
+
+@click.command
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of worker processes (defaults to the number of CPUs).",
+)
+def lint(workers: int | None) -> None:
+    """
+    Validates the inline styles of the project without running it.
+
+    Every ``style="..."`` literal (and ``widget["style"] = "..."`` assignment) found
+    in the modules of ``ui/`` is extracted statically and validated in parallel
+    worker processes. With this check in place, the runtime lint can be disabled
+    with ``lint = false`` in the ``[fluvel]`` section of the configuration.
+    """
+
+    if not UI_DIR.exists():
+        echo("[red]([ERROR]) The [blue!](ui/) folder was not found.")
+        sys.exit(1)
+
+    files = sorted(UI_DIR.rglob("*.py"))
+    variables = _theme_variables()
+
+    issues: list[LintIssue] = []
+
+    # A single module doesn't compensate the cost of starting the workers
+    if len(files) <= 1 or workers == 1:
+        for file in files:
+            issues.extend(lint_module(file, variables))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(lint_module, files, [variables] * len(files)):
+                issues.extend(result)
+
+    for file, line, style, errors in issues:
+        echo(f"[yellow]({file}:{line}) [black+]({style})" if style else f"[yellow]({file}:{line})")
+
+        for error in errors:
+            echo(f"  > [red]({error})")
+
+    if issues:
+        echo(f"\n[red]([LINT]) {len(issues)} problems in {len(files)} modules.")
+        sys.exit(1)
+
+    echo(f"[green]([LINT]) {len(files)} modules checked, no problems found.")
+
+
+def _theme_variables() -> frozenset[str]:
+    Settings.init_config(CONFIG_PATH)
+
+    # Without a theme, any '$variable' is undefined
+    theme = Settings.get("ui.theme")
+
+    if not theme or not (theme_dir := THEMES_DIR / theme).is_dir():
+        return frozenset()
+
+    return frozenset(ThemeCache.load(theme_dir).variables)
+
+
+def lint_module(file: Path, variables: frozenset[str]) -> list[LintIssue]:
+    """
+    Extracts the style literals of a module and validates them (runs in a worker process).
+
+    :param file: The Python module to analyze.
+    :type file: :class:`~pathlib.Path`
+    :param variables: The names of the variables of the configured theme.
+    :type variables: frozenset[str]
+    :returns: The invalid styles found in the module, or the error that prevented
+              analyzing it.
+    :rtype: list[LintIssue]
+    """
+    relative_path = os.path.relpath(file, PROJECT_ROOT)
+
+    # A module that cannot be analyzed is reported, its styles are not validated
+    try:
+        tree = ast.parse(file.read_bytes().decode("utf-8"), filename=str(file))
+    except SyntaxError as error:
+        return [(relative_path, error.lineno or 1, "", (f"SyntaxError: {error.msg}",))]
+    except UnicodeDecodeError as error:
+        line = error.object.count(b"\n", 0, error.start) + 1
+        return [(relative_path, line, "", (f"UnicodeDecodeError: {error.reason}",))]
+    except OSError as error:
+        return [(relative_path, 1, "", (f"{error.__class__.__name__}: {error.strerror or error}",))]
+
+    issues = []
+
+    for line, style in sorted(extract_styles(tree)):
+        if errors := QSSProcessor.check(style, variables):
+            issues.append((relative_path, line, style, errors))
+
+    return issues
+
+
+def extract_styles(tree: ast.AST):
+    """
+    Yields ``(line, style)`` for every style string literal of a module.
+    """
+    for node in ast.walk(tree):
+        # v.Button(style="...")
+        if isinstance(node, ast.Call):
+            for keyword in node.keywords:
+                if keyword.arg == "style" and _is_string(keyword.value):
+                    yield keyword.value.lineno, keyword.value.value
+
+        # widget["style"] = "..."
+        elif isinstance(node, ast.Assign) and _is_string(node.value):
+            for target in node.targets:
+                if (
+                    isinstance(target, ast.Subscript)
+                    and _is_string(target.slice)
+                    and target.slice.value == "style"
+                ):
+                    yield node.value.lineno, node.value.value
+
+
+def _is_string(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and isinstance(node.value, str)
@@ -11,7 +11,9 @@ import click
 from fluvel.cli.reloader.HReloader import HReloader
 from fluvel.cli.tools.ClickStyled import echo
 from fluvel.core.tools.expect_handler import expect
+from fluvel.reactive.BindingInspector import BindingInspector
 from fluvel.user.UserSettings import Settings
+from fluvel.utils.cache_registry import CacheRegistry
 
 # Fluvel
 from fluvel.utils.paths import MAINPY_ROOT
@@ -41,14 +43,36 @@ def initialize_app(debug: bool) -> tuple["App", HReloader] | tuple["App", None]:
     return app_root, None
 
 
+def print_bindings_report() -> None:
+    echo("\n[yellow](--- BINDINGS REPORT ---)")
+    echo(BindingInspector.format_report())
+
+
+def print_cache_report() -> None:
+    echo("\n[yellow](--- CACHE REPORT ---)")
+    echo(CacheRegistry.format_report())
+
+
 @click.command()
 @click.option("--debug", "-d", is_flag=True, help="Enable hot-reloading for development mode.")
-def run(debug: bool) -> None:
+@click.option(
+    "--inspect-bindings",
+    is_flag=True,
+    help="Record update counts and timings per binding and print a report on exit.",
+)
+@click.option(
+    "--cache-report",
+    is_flag=True,
+    help="Print the hits, misses, evictions and memory of the internal caches on exit.",
+)
+def run(debug: bool, inspect_bindings: bool, cache_report: bool) -> None:
     """
     Starts the Fluvel application by running 'app.py'.
 
     This is the primary command for development. It executes the user's
     main application script. Use the --debug flag to enable Hot Reloading.
+    Use the --inspect-bindings flag to find the hottest bindings of your views.
+    Use the --cache-report flag to size the caches in the [fluvel.cache] section.
     """
 
     # Check if the main application file exists
@@ -58,6 +82,10 @@ def run(debug: bool) -> None:
         )
         sys.exit(1)
 
+    # Bindings are instrumented when they are created, so it must be enabled before the views
+    if inspect_bindings:
+        BindingInspector.enable()
+
     # Execute the application logic
     try:
         app, _reloader = initialize_app(debug)
@@ -87,6 +115,14 @@ def run(debug: bool) -> None:
             echo("[white](────────────────────────────────)")
             echo("[blue]([HMR] Enabled. Monitoring:) [cyan](ui/) [blue](and) [cyan](static/)")
 
+        if inspect_bindings:
+            echo("[blue]([Bindings] Inspector enabled. The report is printed on exit.)")
+            app.aboutToQuit.connect(print_bindings_report)
+
+        if cache_report:
+            echo("[blue]([Cache] The report of the internal caches is printed on exit.)")
+            app.aboutToQuit.connect(print_cache_report)
+
         app.run()
 
     except Exception as e:
@@ -167,7 +167,7 @@ class HReloader:
     def restart_ui(self) -> None:
         # Forzamos al Loader a olvidar el lenguaje actual
         # para que cargue los archivos actualizados
-        I18nLoader.current_language = None
+        I18nLoader.clear()
 
         # Recarga física de los diccionarios.
         # No se crearán nuevos objetos I18nVars
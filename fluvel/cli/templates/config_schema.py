@@ -14,6 +14,47 @@ CONFIG_SCHEMA = """{
                     "type": "boolean", 
                     "default": false,
                     "description": "When `true`, the app uses optimized assets from `rsrc/`. When `false`, it enables development features and uses `static/`."
+                },
+                "lint": {
+                    "type": "boolean",
+                    "default": true,
+                    "description": "Validates the inline styles of each widget at runtime (development only). Set to `false` when using the `fluvel lint` command."
+                },
+                "frame_budget": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "default": 16,
+                    "description": "Interval (ms) in which frame-synchronized bindings (`|frame` or `Model, frame_sync=True`) apply their latest value."
+                },
+                "palette_styles": {
+                    "type": "boolean",
+                    "default": false,
+                    "description": "Applies inline styles that only use `bg[...]` and `fg[...]` through the widget palette instead of a stylesheet."
+                },
+                "shared_styles": {
+                    "type": "boolean",
+                    "default": false,
+                    "description": "Emits one rule per unique inline style (and widget class) in the page stylesheet, shared by its widgets, instead of one rule per widget."
+                },
+                "lazy_i18n": {
+                    "type": "boolean",
+                    "default": true,
+                    "description": "In development, renders each `.fluml` text to HTML on its first use instead of rendering the whole catalog when the language is loaded."
+                },
+                "cache": {
+                    "type": "object",
+                    "description": "Maximum number of entries of the internal caches (a negative value means unbounded). Use `fluvel run --cache-report` to size them.",
+                    "properties": {
+                        "qss_parse_styles": {"type": "integer", "default": 2048},
+                        "qss_lint": {"type": "integer", "default": 2048},
+                        "qss_gradient_stops": {"type": "integer", "default": 128},
+                        "qss_palette": {"type": "integer", "default": 2048},
+                        "qss_variable_refs": {"type": "integer", "default": 2048},
+                        "i18n_messages": {"type": "integer", "default": 4096},
+                        "i18n_languages": {"type": "integer", "default": 3},
+                        "binding_paths": {"type": "integer", "default": 256}
+                    },
+                    "additionalProperties": false
                 }
             }
         },
@@ -63,9 +104,19 @@ CONFIG_SCHEMA = """{
                     "type": "string", 
                     "description": "Name of the folder in `./static/themes/` containig QSS styles."
                 },
+                "prewarm_themes": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Alternative themes loaded in the background at startup, so switching to them is near-instant."
+                },
                 "language": {
                     "type": "string", 
                     "description": "Name of the language folder in `./static/i18n/` to use in the application."
+                },
+                "prewarm_languages": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Alternative languages loaded in the background at startup, so switching to them is near-instant (`*` loads all of them). At most `i18n_languages` in `[fluvel.cache]` languages are kept in memory."
                 }
             }
         },
@@ -29,6 +29,7 @@ ActionProperties = Literal[
 class MenuBar(QMenuBar, FWidget):
     def __getattr__(self, name: {name}) -> FAction: ...
     def get_item(self, item_name: {name}) -> FAction: ...
+    def materialize(self) -> None: ...
     def bind_action(
         self, 
         menu_option: {name}, 
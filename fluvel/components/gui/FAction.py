@@ -9,6 +9,7 @@ from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QWidget
 
 # Fluvel
+from fluvel.i18n.I18nTextRegistry import I18nTextRegistry
 from fluvel.i18n.I18nTextVar import I18nMenuTextVar
 
 
@@ -27,8 +28,6 @@ class FAction(QAction):
     def configure(self, **kwargs: Unpack[FActionKwargs]) -> None:
         if text := kwargs.get("text"):
             if isinstance(text, I18nMenuTextVar):
-                text.setParent(self)
-                text.valueChanged.connect(self.setText)
-                text = text.value
+                text = I18nTextRegistry.bind(text, self, "setText")
 
             self.setText(text)
@@ -10,6 +10,7 @@ from PySide6.QtWidgets import QMenu, QMenuBar
 
 # Fluvel
 from fluvel.components.gui.FAction import FAction
+from fluvel.i18n.I18nTextRegistry import I18nTextRegistry
 from fluvel.i18n.I18nTextVar import I18nMenuTextVar
 from fluvel.i18n.ResourceManager import er
 
@@ -22,11 +23,23 @@ class FMenuKwargs(TypedDict, total=False):
 
 
 class FMenu(QMenu):
+    """
+    A menu built from a menu structure (see :class:`~fluvel.engines.XMLMenuParser`).
+
+    The contents of each submenu are created the first time it is shown (or when
+    one of its items is requested, see :meth:`find`), so large menu trees don't
+    create their actions and texts on startup.
+    """
+
     def __init__(self, **kwargs: Unpack[FMenuKwargs]) -> None:
         super().__init__(kwargs.get("parent"))
 
         self._registry = kwargs.get("registry", {})
 
+        # (elements, path) of the contents that are not created yet
+        self._contents: tuple[dict, str] | None = None
+        self._submenus: list[FMenu] = []
+
         self.configure(**kwargs)
 
         if "menu_structure" in kwargs:
@@ -35,12 +48,46 @@ class FMenu(QMenu):
     def configure(self, **kwargs: Unpack[FMenuKwargs]) -> None:
         if menu_title := kwargs.get("menu_title"):
             if isinstance(menu_title, I18nMenuTextVar):
-                menu_title.setParent(self)
-                menu_title.valueChanged.connect(self.setTitle)
-                menu_title = menu_title.value
+                menu_title = I18nTextRegistry.bind(menu_title, self, "setTitle")
 
             self.setTitle(menu_title)
 
+    def materialize(self, recursive: bool = False) -> None:
+        """
+        Creates the contents of the menu, if they were not created yet.
+
+        :param recursive: If True, also creates the contents of every submenu.
+        :type recursive: bool
+        """
+        if self._contents is not None:
+            elements, prefix = self._contents
+            self._contents = None
+
+            self._structure_menu(self, elements, self._registry, prefix)
+
+        if recursive:
+            for submenu in self._submenus:
+                submenu.materialize(recursive=True)
+
+    def find(self, path: str) -> "FAction | FMenu | None":
+        """
+        Returns the item of ``path`` (e.g., ``"file.recent.clear"``), creating the
+        contents of the menus that lead to it.
+
+        :rtype: :class:`~fluvel.components.gui.FAction` | :class:`FMenu` | None
+        """
+        parts = path.split(".")
+
+        for i in range(1, len(parts)):
+            menu = self._registry.get(".".join(parts[:i]))
+
+            if not isinstance(menu, FMenu):
+                return None
+
+            menu.materialize()
+
+        return self._registry.get(path)
+
     def _create_menu(self, parent, structure: dict):
         parent_menu = self if not isinstance(parent, QMenuBar) else parent
         self._structure_menu(parent_menu, structure, self._registry)
@@ -58,7 +105,10 @@ class FMenu(QMenu):
                 new_menu = self._add_menu(parent_menu, _id, element_dict)
                 registry[path] = new_menu
 
-                self._structure_menu(new_menu, elements, registry, path)
+                # Its contents are created when it is shown for the first time
+                new_menu._contents = (elements, path)
+                new_menu.aboutToShow.connect(new_menu.materialize)
+                self._submenus.append(new_menu)
             else:
                 action = self._add_action(parent_menu, _id, element_dict)
                 registry[path] = action
@@ -7,6 +7,9 @@ from typing import TypeVar
 
 from PySide6.QtWidgets import QWidget
 
+# Fluvel
+from fluvel.utils.cache_registry import CacheRegistry
+
 # Tip-helpers
 from fluvel.utils.tip_helpers import AllWidgetsTypes
 
@@ -44,7 +47,10 @@ class Factory:
             :type widget_target: str
             """
 
-            if widget_target not in Factory._stock:
+            if widget_target in Factory._stock:
+                _stock_counter.hits += 1
+            else:
+                _stock_counter.misses += 1
                 widget_module = importlib.import_module(
                     f"fluvel.components.widgets.{widget_target}"
                 )
@@ -54,6 +60,9 @@ class Factory:
             self.WidgetClass = Factory._stock[widget_target]
 
 
+_stock_counter = CacheRegistry.register_mapping("factory_stock", Factory._stock)
+
+
 def Component(target: AllWidgetsTypes):
     """
     A decorator that turns a configuration function into a component factory.
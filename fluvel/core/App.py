@@ -15,10 +15,12 @@ from PySide6.QtWidgets import QApplication
 from fluvel.core.Router import Router
 from fluvel.core.tools.core_process import configure_process
 from fluvel.core.tools.expect_handler import expect
+from fluvel.engines import StyleManager
 
 # I18n
 from fluvel.i18n.ResourceManager import er
 from fluvel.user.UserSettings import Settings
+from fluvel.utils.cache_registry import CacheRegistry
 
 # Utils
 from fluvel.utils.paths import CONFIG_PATH, PAGES_DIR
@@ -28,6 +30,7 @@ class AppRegisterKwargs(TypedDict, total=False):
     initial: str
     pages: list[str] | None
     animation: str
+    prefetch: list[str]
 
 
 class AppKwargs(TypedDict, total=False):
@@ -154,6 +157,11 @@ class App(QApplication):
         # Build the data model of the Settings class according to the configuration file
         Settings.init_config(filename)
 
+        # Sizes of the internal caches ([fluvel.cache])
+        if cache_sizes := Settings.get("fluvel.cache"):
+            for warning in CacheRegistry.configure(vars(cache_sizes)):
+                print(f"Fluvel [ConfigWarning] {warning}")
+
         # The loading of the static content of the application is initialized (i18n)
         self._set_static_content()
 
@@ -192,6 +200,10 @@ class App(QApplication):
         :param animation: The name of a pre-configured animation to use when displaying the initial view.
         :type animation: Optional[str]
 
+        :param prefetch: Routes to build in idle time after the initial view is shown, in order
+                         (besides the ones marked with ``@route(..., prefetch=True)``).
+        :type prefetch: Optional[List[str]]
+
         :raises ValueError: If the required argument ``initial`` is not provided.
         """
         initial_view = kwargs.get("initial")
@@ -213,6 +225,9 @@ class App(QApplication):
         # Show initial view
         Router.show(initial_view, animation)
 
+        # The rest of the heavy views are built ahead of navigation
+        Router.prefetch(kwargs.get("prefetch"))
+
     @staticmethod
     def _get_pages_to_import() -> list[str]:
         """
@@ -296,30 +311,46 @@ class App(QApplication):
         # Loading static text content from views
         self._set_content()
 
+        # This provides a consistent appearance across all platforms before applying QSS styles.
+        # It is set once: a new application style re-polishes every widget again.
+        self.setStyle("Fusion")
+
         # Applying themes and styles to components
         self._set_theme()
 
+        # The alternative themes are prepared in the background for instant switching
+        if themes := Settings.get("ui.prewarm_themes"):
+            er.prewarm_themes(themes)
+
+        # The same for the alternative languages
+        if languages := Settings.get("ui.prewarm_languages"):
+            er.prewarm_languages(languages)
+
     def _set_theme(self) -> None:
         """
         Loads and applies the global QSS theme to the application.
 
-        It sets the "Fusion" style for consistency and then applies the
-        theme specified in ``appconfig.toml``.
+        It applies the theme specified in ``appconfig.toml`` on top of the "Fusion"
+        style set at startup.
         """
 
-        # This provides a consistent appearance across all platforms before applying QSS styles.
-        self.setStyle("Fusion")
-
         qss_content: str = er._load_theme()
 
         # Loading theme to UI
         self.setStyleSheet(qss_content)
+
+        # The stylesheet engine ignores the palette styles ('palette_styles')
+        if qss_content:
+            StyleManager.drop_palettes()
         self.setPalette(self.style().standardPalette())
 
     def change_theme(self, new_theme: str) -> None:
         """
         Dynamically changes the application's visual theme at runtime.
 
+        Themes listed in ``ui.prewarm_themes`` are already prepared, so the new
+        stylesheet is applied without reading from disk.
+
         :param new_theme: The name of the new theme to apply. This should
                           correspond to a theme folder in your project.
         :type new_theme: str
@@ -345,7 +376,9 @@ class App(QApplication):
         Dynamically changes the application's language at runtime.
 
         This will reload all text content from the ``.fluml`` files
-        corresponding to the new language.
+        corresponding to the new language. Only the texts of the window (menus
+        included) and of the visible page are updated immediately, the rest of
+        the pages are updated the next time they are shown.
 
         :param new_language: The code for the new language (e.g., "en", "es").
         :type new_language: str
@@ -353,5 +386,10 @@ class App(QApplication):
 
         Settings.set("ui.language", new_language)
 
-        # Update text content
-        self._set_content()
\ No newline at end of file
+        # Hidden pages are refreshed the next time they are shown
+        Router.defer_texts()
+
+        # Update text content, the visible texts are repainted once
+        self.main_window.setUpdatesEnabled(False)
+        self._set_content()
+        self.main_window.setUpdatesEnabled(True)
\ No newline at end of file
@@ -0,0 +1,92 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from collections import deque
+from collections.abc import Callable, Iterable
+
+# PySide6
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, QTimer
+
+
+class IdleQueue(QObject):
+    """
+    Runs a list of tasks in idle slices of the event loop, one task per slice.
+
+    A zero-interval timer runs the next task once the pending events have been
+    processed, so the application keeps painting and responding between tasks.
+    If ``cancel_on_input`` is True, the remaining tasks are discarded as soon as
+    the user presses a key, clicks, scrolls or touches the screen.
+
+    :param tasks: The functions to run, in order.
+    :type tasks: Iterable[Callable[[], None]]
+    :param delay: Milliseconds to wait before the first task.
+    :type delay: int
+    :param cancel_on_input: Whether user input cancels the remaining tasks.
+    :type cancel_on_input: bool
+    """
+
+    INPUT_EVENTS: frozenset[QEvent.Type] = frozenset(
+        {
+            QEvent.Type.KeyPress,
+            QEvent.Type.MouseButtonPress,
+            QEvent.Type.Wheel,
+            QEvent.Type.TouchBegin,
+        }
+    )
+
+    def __init__(
+        self, tasks: Iterable[Callable[[], None]], delay: int = 0, cancel_on_input: bool = True
+    ) -> None:
+        super().__init__()
+
+        self._tasks = deque(tasks)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._run_next)
+
+        # Watching every event of the application is only done while tasks are pending
+        self._app = QCoreApplication.instance() if cancel_on_input else None
+
+        if self._app is not None:
+            self._app.installEventFilter(self)
+
+        self._timer.start(delay)
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def cancel(self) -> None:
+        """
+        Discards the remaining tasks.
+        """
+        self._tasks.clear()
+        self._finish()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() in self.INPUT_EVENTS:
+            self.cancel()
+
+        return False
+
+    def _run_next(self) -> None:
+        if not self._tasks:
+            return self._finish()
+
+        task = self._tasks.popleft()
+
+        # The next task runs after the events queued by this one
+        if self._tasks:
+            self._timer.start(0)
+        else:
+            self._finish()
+
+        task()
+
+    def _finish(self) -> None:
+        self._timer.stop()
+
+        if self._app is not None:
+            self._app.removeEventFilter(self)
+            self._app = None
@@ -58,7 +58,9 @@ class MenuBar(QMenuBar, FWidget):
     :meth:`bind_action`, :meth:`set_property`, and the centralized :meth:`config` method.
 
     The actual menu structure (menus, sub-menus, and actions) is built internally
-    by :class:`~fluvel.components.widgets.FMenu` based on content files.
+    by :class:`~fluvel.components.widgets.FMenu` based on content files. The contents
+    of each sub-menu are created the first time it is shown, or when one of its items
+    is requested with :meth:`get_item` (see also :meth:`materialize`).
     """
 
     _QT_PROPERTY_MAP = {}
@@ -88,7 +90,8 @@ class MenuBar(QMenuBar, FWidget):
         """
         Retrieves a menu item (either a menu or an action) by its string name.
 
-        The item is accessed as an attribute of the :class:`MenuBar` instance.
+        The item is accessed as an attribute of the :class:`MenuBar` instance. If its
+        sub-menu was not shown yet, the contents of the sub-menus of its path are created.
 
         :param item_name: The name of the menu item (action or submenu) to retrieve.
         :type item_name: :class:`~fluvel.user.MenuOptions`
@@ -96,7 +99,19 @@ class MenuBar(QMenuBar, FWidget):
         :returns: The corresponding :class:`~fluvel.components.gui.FAction` or :class:`~fluvel.components.widgets.FMenu` object.
         :rtype: :class:`~fluvel.components.gui.FAction` or :class:`~fluvel.components.widgets.FMenu`
         """
-        return self._actions.get(item_name)
+        if (item := self._actions.get(item_name)) is None:
+            item = self.menu.find(item_name)
+
+        return item
+
+    def materialize(self) -> None:
+        """
+        Creates the contents of every sub-menu (e.g., to make the whole tree
+        available to code that iterates over the actions of the menus).
+
+        :rtype: None
+        """
+        self.menu.materialize(recursive=True)
 
     def bind_action(
         self, menu_option: str, signal: ActionSignalTypes, controller: Callable
@@ -12,8 +12,10 @@ from PySide6.QtWidgets import QStackedWidget
 # Fluvel
 from fluvel.core.abstract.AbstractPage import AbstractPage
 from fluvel.core.AppWindow import AppWindow
-from fluvel.engines import PageStyles
+from fluvel.core.IdleQueue import IdleQueue
+from fluvel.engines import Breakpoints, PageStyles, StyleManager
 from fluvel.core.exceptions.exceptions import RouteNotFoundError
+from fluvel.i18n.I18nTextRegistry import I18nTextRegistry
 
 # Composer
 from fluvel.composer.Animator import Animator
@@ -44,15 +46,33 @@ class Router:
 
         :ivar page_instance: The actual instance of the view after it has been shown for the first time.
         :type page_instance: :class:`~fluvel.core.abstract.AbstractPage.AbstractPage`
+
+        :ivar texts_stale: If True, the texts of the view must be refreshed (e.g., after a
+                           language switch) before being shown.
+        :type texts_stale: bool
+
+        :ivar prefetch: If True, the view is built in the background after the initial
+                        view is shown.
+        :type prefetch: bool
+
+        :ivar priority: Prefetched views with a higher priority are built first.
+        :type priority: int
         """
 
         path: str
         page_class: type[AbstractPage]
         page_instance: AbstractPage = None
+        texts_stale: bool = False
+        prefetch: bool = False
+        priority: int = 0
+
+    PREFETCH_DELAY_MS: int = 100
+    """Milliseconds between the initial view and the first prefetched view."""
 
     _window: AppWindow
     _routes: dict[str, Route] = {}
     _current_route: Route = None
+    _prefetch_queue: IdleQueue | None = None
 
     @classmethod
     def init(cls, app: "App", main_window: AppWindow) -> None:
@@ -102,16 +122,12 @@ class Router:
         central_widget: QStackedWidget = cls._window.central_widget
 
         if not route.page_instance:
-            # Instantiate the view
-            route.page_instance = route.page_class()
-            route.page_instance.build()
-
-            # Load styles after build()
-            styles = PageStyles.getall()
-            route.page_instance.setStyleSheet(styles)
+            cls._mount(route)
 
-            # Add view container to QStackedWidget stack
-            central_widget.addWidget(route.page_instance)
+        if route.texts_stale:
+            # Deferred language switch (see Router.defer_texts)
+            route.texts_stale = False
+            cls._refresh_texts(route.page_instance)
 
         if cls._current_route != route:
             # Set current route
@@ -126,6 +142,122 @@ class Router:
                 anim = getattr(Animator, animation)(target_widget)
                 anim.start()
 
+    @classmethod
+    def _mount(cls, route: Route) -> None:
+        """
+        Builds the view of ``route`` and adds it to the central widget (hidden).
+        """
+
+        # Collect the styles of the view while it is built
+        PageStyles.begin()
+
+        try:
+            # Instantiate the view
+            page = route.page_class()
+            page.build()
+
+            # Load styles after build(), later changes are patched per widget
+            styles = StyleManager.commit(page)
+        finally:
+            # A failed build must not leave the buffer open for the next views
+            PageStyles.end()
+
+        route.page_instance = page
+        route.page_instance.setStyleSheet(styles)
+
+        # Breakpoint variants ('md::p[16px]') follow the width of the page
+        Breakpoints.watch(route.page_instance)
+
+        # Add view container to QStackedWidget stack
+        cls._window.central_widget.addWidget(route.page_instance)
+        route.texts_stale = False
+
+    @classmethod
+    def prefetch(cls, paths: list[str] | None = None, cancel_on_input: bool = True) -> None:
+        """
+        Builds views ahead of navigation, one per idle slice of the event loop.
+
+        The views of ``paths`` (in that order) and the views registered with
+        ``@route(..., prefetch=True)`` that are not built yet are queued, sorted by
+        their ``priority`` (highest first). Each one is built and added to the
+        central widget without being shown, so its first :meth:`show` is immediate.
+
+        :param paths: The paths of the views to prefetch, besides the marked ones.
+        :type paths: list[str] | None
+        :param cancel_on_input: If True (default), user input (keys, clicks, scroll)
+                                cancels the views that are still queued.
+        :type cancel_on_input: bool
+
+        :raises RouteNotFoundError: If a path was not found in the registered routes.
+        :rtype: None
+        """
+        paths = list(paths or [])
+
+        for path in paths:
+            if path not in cls._routes:
+                raise RouteNotFoundError(
+                    f"The @route '{path}' to prefetch is not associated with any page."
+                )
+
+        marked = [path for path, route in cls._routes.items() if route.prefetch]
+        queue = [cls._routes[path] for path in dict.fromkeys([*paths, *marked])]
+
+        # Stable sort: the listed order breaks the ties
+        queue.sort(key=lambda route: -route.priority)
+
+        cls.cancel_prefetch()
+
+        tasks = [partial(cls._prefetch, route) for route in queue if not route.page_instance]
+
+        if tasks:
+            cls._prefetch_queue = IdleQueue(tasks, cls.PREFETCH_DELAY_MS, cancel_on_input)
+
+    @classmethod
+    def cancel_prefetch(cls) -> None:
+        """
+        Discards the views that are still queued by :meth:`prefetch`.
+
+        :rtype: None
+        """
+        if cls._prefetch_queue is not None:
+            cls._prefetch_queue.cancel()
+            cls._prefetch_queue = None
+
+    @classmethod
+    def _prefetch(cls, route: Route) -> None:
+        # It may have been shown since it was queued
+        if not route.page_instance:
+            cls._mount(route)
+
+    @classmethod
+    def defer_texts(cls) -> None:
+        """
+        Excludes the hidden views from the next language switch.
+
+        The texts of the widgets of the views that are not visible are not updated
+        when the language changes, and their routes are marked as stale to be
+        updated the next time they are displayed with :meth:`show`.
+
+        :rtype: None
+        """
+        hidden = []
+
+        for route in cls._routes.values():
+            if route is cls._current_route or not route.page_instance:
+                continue
+
+            hidden.append(route.page_instance)
+            route.texts_stale = True
+
+        I18nTextRegistry.defer(hidden)
+
+    @staticmethod
+    def _refresh_texts(page: AbstractPage) -> None:
+        # The texts of the view are repainted once
+        page.setUpdatesEnabled(False)
+        I18nTextRegistry.flush(page)
+        page.setUpdatesEnabled(True)
+
     @classmethod
     def as_show(cls, path: str, animation: str | None = "fade_in") -> Callable[[], None]:
         """
@@ -143,7 +275,7 @@ class Router:
         """
         return partial(cls.show, path, animation)
 
-def route(path: str):
+def route(path: str, prefetch: bool = False, priority: int = 0):
     """
     Decorator used to register a view class with the :class:`Router`.
 
@@ -153,6 +285,11 @@ def route(path: str):
 
     :param path: The unique path used to identify the view in the router (e.g., "login").
     :type path: str
+    :param prefetch: If True, the view is built in idle time after the initial view
+                     is shown (see :meth:`Router.prefetch`).
+    :type prefetch: bool
+    :param priority: Prefetched views with a higher priority are built first.
+    :type priority: int
     :returns: A wrapper that accepts the view class.
     :rtype: callable
 
@@ -167,13 +304,21 @@ def route(path: str):
             def build(self):
                 # ... UI implementation ...
                 pass
+
+        @route("reports", prefetch=True, priority=10)
+        class ReportsPage(Page): ...
     """
 
     def wrapper(page_class: type[AbstractPage]):
         if path in Router._routes:
-            Router._routes[path].page_class = page_class
+            registered = Router._routes[path]
+            registered.page_class = page_class
+            registered.prefetch = prefetch
+            registered.priority = priority
         else:
-            Router._routes[path] = Router.Route(path, page_class)
+            Router._routes[path] = Router.Route(
+                path, page_class, prefetch=prefetch, priority=priority
+            )
         return page_class
 
     return wrapper
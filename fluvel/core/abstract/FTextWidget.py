@@ -4,6 +4,7 @@
 from typing import Any, Final
 
 # Fluvel I18n
+from fluvel.i18n.I18nTextRegistry import I18nTextRegistry
 from fluvel.i18n.I18nTextVar import I18nTextVar
 
 MAPPING: Final[dict[str, str]] = {
@@ -43,11 +44,9 @@ class FTextWidget:
 
     def _link_to_string_var(self, text: str, method: str) -> str:
         """
-        If the text is an I18nTextVar, connect its signal to the widget's 
-        setter method and return the string value.
+        If the text is an I18nTextVar, bind it to the widget's setter method
+        and return the string value.
         """
         if isinstance(text, I18nTextVar):
-            text.setParent(self)
-            text.valueChanged.connect(getattr(self, method))
-            return text.value
+            return I18nTextRegistry.bind(text, self, method)
         return text
@@ -19,7 +19,7 @@ from fluvel.core.enums import (
 from fluvel.core.tools.core_process import configure_process
 
 # Fluvel
-from fluvel.engines import PageStyles, QSSProcessor
+from fluvel.engines import StyleManager
 
 # State Manager
 from fluvel.reactive.StateManager import StateManager
@@ -92,8 +92,9 @@ class FWidgetMixin:
 
         The style is configured by setting the object's ``class`` property (to
         handle multiple classes) and then processing the entire style string through
-        :class:`QSSProcessor` to apply the visual style using
-        :meth:`PySide6.QtWidgets.QWidget.setStyleSheet`.
+        :class:`QSSProcessor`. While the page is built, the rules are collected into the
+        page stylesheet; afterwards, they are patched into the widget by the
+        :class:`~fluvel.engines.qss.StyleManager.StyleManager`.
 
         :param style: String of QSS classes to apply.
         :type style: str
@@ -112,9 +113,33 @@ class FWidgetMixin:
 
         if full_style:
             self.setProperty("class", full_style)
-            parsed_styles = QSSProcessor.process(full_style, self.class_name, self.obj_name)
-            PageStyles.add(parsed_styles)
-            # self.setStyleSheet(parsed_styles)
+            StyleManager.apply(self, full_style)
+
+    def replace_style(self, style: str) -> None:
+        """
+        Replaces all the QSS styles of the component, instead of merging them
+        with the current ones as :meth:`set_style` does.
+
+        Only the component and its children are re-polished.
+
+        :param style: String of QSS classes to apply.
+        :type style: str
+        :rtype: None
+        """
+        if not style:
+            return self.clear_style()
+
+        self.setProperty("class", style)
+        StyleManager.apply(self, style)
+
+    def clear_style(self) -> None:
+        """
+        Removes the QSS styles of the component applied through :meth:`set_style`.
+
+        :rtype: None
+        """
+        self.setProperty("class", "")
+        StyleManager.remove(self)
 
     def bind(self, binding_string: str) -> None:
         """
@@ -5,6 +5,7 @@ from PySide6.QtWidgets import QLayout
 
 # Fluvel
 from fluvel.core.exceptions.exceptions import InvalidLayoutOperationError
+from fluvel.utils.cache_registry import CacheRegistry
 from fluvel.components.widgets.containers import (
     FContainer,
     FGroupBox,
@@ -13,12 +14,16 @@ from fluvel.components.widgets.containers import (
 )
 
 _L_CACHE = {}
+_L_COUNTER = CacheRegistry.register_mapping("layout_classes", _L_CACHE)
 
 def _get_layout(layout: str):
     """Gets the layout class and caches the import."""
     try:
-        return _L_CACHE[layout]
+        layout_class = _L_CACHE[layout]
+        _L_COUNTER.hits += 1
+        return layout_class
     except KeyError:
+        _L_COUNTER.misses += 1
         from fluvel.components.layouts import GridLayout, HBoxLayout, VBoxLayout
         _L_CACHE['grid'] = GridLayout
         _L_CACHE['horizontal'] = HBoxLayout
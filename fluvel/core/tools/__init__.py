@@ -7,7 +7,6 @@ from fluvel.core.tools.io_helpers import (
     load_file,
     load_fluml,
     load_style_sheet,
-    load_theme,
 )
 
 __all__ = [
@@ -15,6 +14,5 @@ __all__ = [
     "dump_json",
     "load_style_sheet",
     "load_fluml",
-    "load_theme",
     "configure_process",
 ]
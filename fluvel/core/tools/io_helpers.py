@@ -95,26 +95,3 @@ def load_style_sheet(file_path: Path) -> str:
     with open(file_path, encoding="utf-8") as f:
         return f.read()
 
-
-def load_theme(folder: Path, theme: str) -> str:
-    """
-    Loads and concatenates the contents of all QSS files for a theme.
-
-    This function recursively scans a specific theme folder
-    within the base directory (``folder``) for all files
-    with the `.qss` extension and concatenates their contents into a single string.
-
-    :param folder: Base directory where the theme folders are located.
-    :type folder: :class:`pathlib.Path`
-    :param theme: Name of the subfolder containing the theme's QSS files.
-    :type theme: str
-    :returns: Text string containing the combined QSS of all the theme's files.
-    :rtype: str
-    """
-
-    if not folder.exists():
-        return ""
-
-    qss_files = (folder / theme).rglob("*.qss")
-
-    return "\n".join(load_style_sheet(f) for f in qss_files)
@@ -2,13 +2,19 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from fluvel.engines.fluml import FlumlParser, convert_FLUML_to_HTML
+from fluvel.engines.qss.Breakpoints import Breakpoints
 from fluvel.engines.qss.PageStyles import PageStyles
 from fluvel.engines.qss.qss import QSSProcessor
+from fluvel.engines.qss.StyleManager import StyleManager
+from fluvel.engines.qss.ThemeVariables import ThemeVariables
 from fluvel.engines.xml import XMLMenuParser
 
 __all__ = [
     "QSSProcessor",
+    "Breakpoints",
     "PageStyles",
+    "StyleManager",
+    "ThemeVariables",
     "FlumlParser",
     "convert_FLUML_to_HTML",
     "XMLMenuParser"   
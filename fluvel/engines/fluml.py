@@ -10,56 +10,232 @@ class FlumlParser:
     # Pattern to detect the start of a block: ".. id: fluml-content"
     BLOCK_PATTERN = re.compile(r"^\s*\.\.\s*(?P<id>[^:]+):\s*(?P<content>.*)$")
 
-    # Compiled re.sub Patterns
-    STYLE_RULES: ClassVar[list[tuple[str, str]]] = [
-        # COLOR & OPACITY
-        # Syntax: [ color | content ] -> [red|Alert] or [rgba(0,0,0,0.5)|Ghost]
-        (r"\[\s*([#a-zA-Z0-9(),\.\s%]+)\s*\|\s*([^\]]+)\s*\]", r"<span style='color:\1;'>\2</span>"),
+    # Single-pass tokenizer of the inline syntax (applied to the HTML-escaped text)
+    TOKEN_PATTERN = re.compile(
+        r"""
+        (?P<escape>\\[{}\[\]])                               # \{ \} \[ \]
+        | (?P<br>\\n)                                        # Line break
+        | \[\s*(?P<color>[#a-zA-Z0-9(),\.\s%]+)\s*\|\s*      # [ color | content ]
+            (?P<colored>[^\]]+)\s*\]
+        | (?<!\\)\{\s*(?P<text>[^\s|{}](?:[^|{}]*[^\s|{}])?)  # { content | href }
+            \s*\|\s*(?P<href>[^\s|{}]+)\s*\}
+        | (?P<delimiter>\*+|_+|-+|\^+|~+)                     # Typography and decoration
+        """,
+        re.VERBOSE,
+    )
 
-        # LINKS: { content | href }
-        (r"(?<!\\)\{\s*([^\s|{}](?:[^|{}]*[^\s|{}])?)\s*\|\s*([^\s|{}]+)\s*\}", r"<a href='\2'>\1</a>"),
+    # Quick check for blocks without inline syntax (most of the entries of a catalog)
+    SYNTAX_PATTERN = re.compile(r"[*_\-^~\[{\\]")
 
+    ESCAPES: ClassVar[dict[str, str]] = {"{": "{", "}": "}", "[": "[", "]": "]"}
+
+    # In the texts formatted by I18nMessage, escaped braces are written as entities so they
+    # are not parsed as placeholders (I18nMessage turns them back into literal braces)
+    ICU_ESCAPES: ClassVar[dict[str, str]] = {**ESCAPES, "{": "&#123;", "}": "&#125;"}
+
+    DELIMITERS: ClassVar[dict[str, tuple[str, str]]] = {
         # --- TYPOGRAPHY ---
-        # Bold + Italic: ***content***
-        (r"\*\*\*(.+?)\*\*\*", r"<b><i>\1</i></b>"),
-        # Bold: **content**
-        (r"\*\*(.+?)\*\*", r"<b>\1</b>"),
-        # Italic: *content*
-        (r"\*(.+?)\*", r"<i>\1</i>"),
-        
+        "***": ("<b><i>", "</i></b>"),
+        "**": ("<b>", "</b>"),
+        "*": ("<i>", "</i>"),
         # --- DECORATION ---
-        # Underline: __content__
-        (r"__(.+?)__", r"<u>\1</u>"),
-        # Strike: --content--
-        (r"(?<!-)--([^\s-].*?[^\s-])--(?!-)", r"<s>\1</s>"),
-        # Super: ^^content^^
-        (r"\^\^(.+?)\^\^", r"<sup>\1</sup>"),
-        # Sub: ~~content~
-        (r"~~(.+?)~~", r"<sub>\1</sub>"),
-
-        # --- UTILS ---
-        # Line break
-        (r"\\n", r"<br>"),
-
-        # Escapes
-        (r"\\\{", "{"),
-        (r"\\\}", "}"),
-        (r"\\\[", "["),
-        (r"\\\]", "]"),
-    ]
-
-    # Pre-compile patterns once
-    COMPILED_STYLES = [(re.compile(p), r) for p, r in STYLE_RULES]
+        "__": ("<u>", "</u>"),
+        "--": ("<s>", "</s>"),
+        "^^": ("<sup>", "</sup>"),
+        "~~": ("<sub>", "</sub>"),
+    }
 
     @classmethod
-    def _apply_styles(cls, text: str) -> str:
+    def _apply_styles(cls, text: str, icu: bool = False) -> str:
+        """
+        Renders the inline syntax of a block into RichText in a single pass.
+
+        The text is tokenized once and rendered by a small state machine: colors and
+        links are atomic tokens (their content is rendered recursively and ``href``
+        is kept verbatim), and each delimiter closes the last open delimiter of the
+        same kind. Runs of three asterisks are split against the open ``*`` and ``**``
+        runs, from the innermost one. Delimiters that are never closed (or closed out
+        of order) are kept as literal text, so the output is always well nested.
+
+        :param text: The raw content of a block.
+        :type text: str
+        :param icu: If True, escaped braces are written as :attr:`ICU_ESCAPES`.
+        :type icu: bool
+        :rtype: str
+        """
         text = html.escape(text, quote=False)
-        for pattern, replacement in cls.COMPILED_STYLES:
-            text = pattern.sub(replacement, text)
-        return text
+
+        if not cls.SYNTAX_PATTERN.search(text):
+            return text
+
+        return cls._render(text, cls.ICU_ESCAPES if icu else cls.ESCAPES)
 
     @classmethod
-    def parse(cls, text: str) -> dict[str, str]:
+    def _render(cls, text: str, escapes: dict[str, str]) -> str:
+        parts: list[str] = []
+        # (delimiter, index of its literal in 'parts', end position in 'text')
+        stack: list[tuple[str, int, int]] = []
+        delimiters = cls.DELIMITERS
+        position = 0
+
+        for token in cls.TOKEN_PATTERN.finditer(text):
+            start, end = token.span()
+
+            if start > position:
+                parts.append(text[position:start])
+
+            position = end
+            kind = token.lastgroup
+
+            if kind == "escape":
+                parts.append(escapes[token.group()[1]])
+
+            elif kind == "br":
+                parts.append("<br>")
+
+            elif kind == "colored":
+                colored = cls._render(token["colored"], escapes)
+                parts.append(f"<span style='color:{token['color']};'>{colored}</span>")
+
+            elif kind == "href":
+                parts.append(f"<a href='{token['href']}'>{cls._render(token['text'], escapes)}</a>")
+
+            elif (delimiter := token.group()) not in delimiters:
+                parts.append(delimiter)
+
+            else:
+                cls._delimit(text, delimiter, start, end, parts, stack)
+
+        parts.append(text[position:])
+
+        return "".join(parts)
+
+    @classmethod
+    def _delimit(
+        cls,
+        text: str,
+        delimiter: str,
+        start: int,
+        end: int,
+        parts: list[str],
+        stack: list[tuple[str, int, int]],
+    ) -> None:
+        if cls._close(text, delimiter, start, parts, stack):
+            return
+
+        # Mixed asterisk runs ('***' against '*' and '**') are split
+        if delimiter[0] == "*" and (delimiter := cls._split(delimiter, parts, stack)) == "":
+            return
+
+        # Strike through must be followed by content
+        if delimiter == "--" and (end == len(text) or text[end].isspace()):
+            parts.append(delimiter)
+            return
+
+        stack.append((delimiter, len(parts), end))
+        parts.append(delimiter)
+
+    @classmethod
+    def _close(
+        cls,
+        text: str,
+        delimiter: str,
+        start: int,
+        parts: list[str],
+        stack: list[tuple[str, int, int]],
+    ) -> bool:
+        # Closes the last open delimiter of the same kind
+        for depth in range(len(stack) - 1, -1, -1):
+            if stack[depth][0] != delimiter:
+                continue
+
+            _, index, content_start = stack[depth]
+            content = text[content_start:start]
+
+            # Strike through needs content that doesn't start or end with a space
+            if delimiter == "--" and (len(content) < 2 or content[-1].isspace()):
+                continue
+
+            opening, closing = cls.DELIMITERS[delimiter]
+            parts[index] = opening
+            parts.append(closing)
+
+            # The delimiters opened inside and not closed remain literal text
+            del stack[depth:]
+            return True
+
+        return False
+
+    @classmethod
+    def _split(cls, delimiter: str, parts: list[str], stack: list[tuple[str, int, int]]) -> str:
+        """
+        Closes the open asterisk runs from the innermost one, when the closing run
+        or the opening run is ``***`` (e.g., ``**bold *and italic***``). Returns the
+        asterisks of ``delimiter`` that were not used.
+        """
+        remaining = len(delimiter)
+
+        while remaining:
+            depth = len(stack) - 1
+
+            while depth >= 0 and stack[depth][0][0] != "*":
+                depth -= 1
+
+            if depth < 0:
+                break
+
+            opener, index, content_start = stack[depth]
+
+            if len(delimiter) != 3 and len(opener) != 3:
+                break
+
+            used = min(len(opener), remaining)
+            opening, closing = cls.DELIMITERS["*" * used]
+            parts.append(closing)
+            remaining -= used
+
+            if used == len(opener):
+                parts[index] = opening
+                del stack[depth:]
+            else:
+                # The innermost asterisks of the run are used, the outer ones stay open
+                parts[index] = opener[used:]
+                parts.insert(index + 1, opening)
+                stack[depth] = (opener[used:], index, content_start)
+                del stack[depth + 1 :]
+
+        return "*" * remaining
+
+    @classmethod
+    def render(cls, raw: str, icu: bool = False) -> str:
+        """
+        Renders the raw content of a block (see :meth:`index`) into RichText.
+
+        :param raw: The raw content of a block.
+        :type raw: str
+        :param icu: If True, the text is rendered to be formatted by
+                    :class:`~fluvel.i18n.I18nMessage.I18nMessage` (see :attr:`ICU_ESCAPES`).
+        :type icu: bool
+        :rtype: str
+        """
+        return cls._apply_styles(raw, icu)
+
+    @classmethod
+    def parse(cls, text: str, icu: bool = False) -> dict[str, str]:
+        return {
+            block_id: cls._apply_styles(raw, icu) for block_id, raw in cls.index(text).items()
+        }
+
+    @classmethod
+    def index(cls, text: str) -> dict[str, str]:
+        """
+        Splits a FLUML document into blocks without rendering them.
+
+        :param text: The content of a ``.fluml`` file.
+        :type text: str
+        :returns: The raw content (lines joined with a space) of each block ID.
+        :rtype: dict[str, str]
+        """
         blocks: dict[str, list[str]] = {}
         current_id: str = None
 
@@ -78,8 +254,7 @@ class FlumlParser:
                 # If it's not an ID match, it's text that belongs to the current ID
                 blocks[current_id].append(clean_line)
 
-        # Build and return the ID: html_content
-        return {block_id: cls._apply_styles(" ".join(lines)) for block_id, lines in blocks.items()}
+        return {block_id: " ".join(lines) for block_id, lines in blocks.items()}
 
 
 def convert_FLUML_to_HTML(fluml_content: str) -> dict[str, str]:
@@ -0,0 +1,91 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+# PySide6
+from PySide6.QtCore import QEvent, QObject, Qt
+from PySide6.QtWidgets import QWidget
+
+# Fluvel
+from fluvel.engines.qss.StyleManager import StyleManager
+from fluvel.reactive.RateLimiter import Debouncer
+
+
+class Breakpoints(QObject):
+    """
+    Switches the breakpoint variants of the styles of a page (``md::p[16px] lg::fs[18px]``)
+    when its width changes.
+
+    The variants are compiled to QSS once, like any other rule, under selectors that
+    require the ``breakpoint`` property of the page (``*[breakpoint~="md"] ...`` for its
+    widgets, ``...[breakpoint~="md"]`` for the page itself). When the page crosses a
+    breakpoint, the property is flipped and only the widgets that have breakpoint
+    variants are re-polished. Resize bursts are debounced.
+
+    Breakpoints are mobile-first: at 1100px, the page property is ``"sm md lg"``, and the
+    variants are emitted from the smallest to the largest, so the largest one wins.
+
+    :param page: The page to watch (it becomes the parent of the watcher).
+    :type page: :class:`~PySide6.QtWidgets.QWidget`
+    """
+
+    WIDTHS: dict[str, int] = {"sm": 640, "md": 768, "lg": 1024, "xl": 1280}
+    """Minimum width (in pixels) of the page for each breakpoint."""
+
+    DEBOUNCE_MS: int = 50
+
+    PROPERTY = "breakpoint"
+
+    def __init__(self, page: QWidget) -> None:
+        super().__init__(page)
+
+        self._page = page
+        self._debouncer = Debouncer(self._switch, self.DEBOUNCE_MS, self)
+
+        page.installEventFilter(self)
+        self._switch(page.width())
+
+    @classmethod
+    def watch(cls, page: QWidget) -> "Breakpoints":
+        """
+        Sets the initial breakpoints of ``page`` and follows its resizes.
+
+        :rtype: :class:`Breakpoints`
+        """
+        return cls(page)
+
+    @classmethod
+    def active(cls, width: int) -> str:
+        """
+        Returns the breakpoints active for ``width`` (e.g., ``"sm md"`` for 800px).
+
+        :rtype: str
+        """
+        return " ".join(name for name, min_width in cls.WIDTHS.items() if width >= min_width)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Resize:
+            width = event.size().width()
+
+            # A hidden page is not painted, so it is switched before being shown
+            if self._page.isVisible():
+                self._debouncer.push(width)
+            else:
+                self._switch(width)
+
+        return False
+
+    def _switch(self, width: int) -> None:
+        value = self.active(width)
+        page = self._page
+
+        if page.property(self.PROPERTY) == value:
+            return
+
+        page.setProperty(self.PROPERTY, value)
+
+        # Qt doesn't re-evaluate the selectors on property changes
+        for widget in StyleManager.responsive(page):
+            if widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+                style = widget.style()
+                style.unpolish(widget)
+                style.polish(widget)
@@ -2,14 +2,53 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 class PageStyles:
-    _styles: list[str] = []
+    """
+    Build buffer of the styles of the page that is being built.
+
+    While a page is built (between :meth:`begin` and the commit made by the
+    :class:`~fluvel.engines.qss.StyleManager.StyleManager`), the rules of every styled
+    widget are collected here and applied all at once as the page stylesheet.
+    Outside a build, styles are patched directly into the widget.
+    """
+
+    _styles: dict[str, str] = {}
+    building: bool = False
+
+    @classmethod
+    def begin(cls) -> None:
+        """
+        Starts collecting the styles of a new page.
+        """
+        cls._styles.clear()
+        cls.building = True
+
+    @classmethod
+    def add(cls, style: str, widget_id: str | None = None) -> None:
+        # A widget styled more than once during the build keeps only its last rules
+        cls._styles[widget_id or str(len(cls._styles))] = style
+
+    @classmethod
+    def discard(cls, widget_id: str) -> None:
+        # The widget no longer needs rules in the page sheet (e.g., palette styles)
+        cls._styles.pop(widget_id, None)
 
     @classmethod
-    def add(cls, style: str) -> None:
-        cls._styles.append(style)
+    def take(cls) -> dict[str, str]:
+        """
+        Ends the build and returns the collected rules indexed by widget id.
+        """
+        styles, cls._styles = cls._styles, {}
+        cls.building = False
+        return styles
+
+    @classmethod
+    def end(cls) -> None:
+        """
+        Ends the build, discarding the styles that were not taken (e.g., the build failed).
+        """
+        cls._styles = {}
+        cls.building = False
 
     @classmethod
     def getall(cls) -> str:
-        styles = "".join(cls._styles)
-        cls._styles.clear()
-        return styles
\ No newline at end of file
+        return "".join(cls.take().values())
@@ -0,0 +1,358 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from functools import partial
+from weakref import WeakSet
+
+# PySide6
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QApplication, QWidget
+
+# Fluvel
+from fluvel.engines.qss.PageStyles import PageStyles
+from fluvel.engines.qss.qss import QSSProcessor
+from fluvel.engines.qss.ThemeVariables import ThemeVariables
+from fluvel.user.UserSettings import Settings
+
+
+class StyleManager:
+    """
+    Static class that applies the styles of the widgets and patches them at runtime.
+
+    During a page build, the rules are collected by :class:`PageStyles` and applied once
+    as the page stylesheet. After that, changing the style of a single widget must not
+    reset the sheet of the whole page (which re-polishes every child), so runtime changes
+    are applied to the widget's own stylesheet, re-polishing only its subtree.
+
+    A per-page index ``{widget_id: rules}`` records which widgets still have rules in
+    their page sheet. Page rules are scoped with the dynamic property ``page_style``:
+    the first time one of those widgets is patched, the property is cleared so the
+    stale page rule no longer matches it (its object name is kept). Every change is
+    O(1) with respect to the size of the page.
+
+    It also records which widgets use theme variables (``bg[$primary]``), so a theme
+    switch re-emits only the rules that depend on the variables that changed.
+
+    With ``palette_styles = true`` in the ``[fluvel]`` section, styles that only set
+    colors (``bg[...]`` and ``fg[...]``) are applied through the widget's ``QPalette``,
+    so the widget keeps the native style instead of being polished by the stylesheet
+    engine. The stylesheet engine ignores the palette, so this only applies to widgets
+    that no stylesheet (theme, page or ancestor) reaches. Any other style falls back to QSS.
+
+    With ``shared_styles = true``, the widgets of a page built with the same class and
+    style share a single rule, matched through the dynamic property ``shared_style``
+    instead of one rule per object name, so the page sheet grows with the number of
+    unique styles rather than with the number of widgets.
+    """
+
+    PALETTE_ROLES: dict[str, tuple[QPalette.ColorRole, ...]] = {
+        "bg": (QPalette.ColorRole.Window, QPalette.ColorRole.Base, QPalette.ColorRole.Button),
+        "fg": (
+            QPalette.ColorRole.WindowText,
+            QPalette.ColorRole.Text,
+            QPalette.ColorRole.ButtonText,
+        ),
+    }
+
+    PAGE_PROPERTY: str = "page_style"
+    """Dynamic property of the widgets whose rules are in the page sheet."""
+
+    PAGE_SELECTOR: str = '{id}[page_style="true"]'
+
+    # {(class name, style): key of the shared rule}, see 'shared_styles'
+    _shared_keys: dict[tuple[str, str], str] = {}
+
+    _pages: dict[int, dict[str, str]] = {}
+    _owners: dict[str, int] = {}
+    _dependents: dict[str, dict[int, QWidget]] = {}
+    _responsive: dict[int, QWidget] = {}
+    _tracked: set[int] = set()
+
+    # Widgets styled through their palette
+    _palette_widgets: "WeakSet[QWidget]" = WeakSet()
+
+    @classmethod
+    def commit(cls, page: QWidget) -> str:
+        """
+        Closes the build of ``page``, indexes its rules and returns the page stylesheet.
+
+        :param page: The page whose ``build()`` has just finished.
+        :type page: :class:`~PySide6.QtWidgets.QWidget`
+        :returns: The stylesheet to be applied to the page.
+        :rtype: str
+        """
+        rules = PageStyles.take()
+        key = id(page)
+
+        # The page has a stylesheet, so the palette styles of its widgets would be ignored
+        if rules or cls._under_stylesheet(page):
+            cls._palettes_to_rules(page, rules)
+
+        cls._pages[key] = rules
+        cls._owners.update(dict.fromkeys(rules, key))
+
+        # The index dies with the page (e.g., Hot Reload rebuilds)
+        page.destroyed.connect(partial(cls._release, key))
+
+        # Shared rules are identical for all their widgets, so they are emitted once
+        return "".join(dict.fromkeys(rules.values()))
+
+    @classmethod
+    def apply(cls, widget: QWidget, style: str) -> None:
+        """
+        Sets (or replaces) the Fluvel styles of a widget.
+
+        :param widget: A Fluvel widget with ``class_name`` and ``obj_name``.
+        :type widget: :class:`~PySide6.QtWidgets.QWidget`
+        :param style: The Fluvel style string (e.g., ``"bg[red] fg[white]"``).
+        :type style: str
+        :rtype: None
+        """
+        if variables := ThemeVariables.references(style):
+            cls._track(widget, variables)
+
+        # Widgets with breakpoint variants are re-polished when their page crosses a breakpoint
+        if QSSProcessor.breakpoints(style):
+            cls._responsive[id(widget)] = widget
+            cls._watch(widget)
+        else:
+            cls._responsive.pop(id(widget), None)
+
+        if cls._apply_palette(widget, style):
+            if PageStyles.building:
+                PageStyles.discard(widget.obj_name)
+            else:
+                cls._unstyle(widget)
+
+            return
+
+        cls._reset_palette(widget)
+
+        if PageStyles.building:
+            if Settings.get("fluvel.shared_styles", False):
+                key = cls._shared_key(widget.class_name, style)
+                widget.setProperty(QSSProcessor.SHARED_PROPERTY, key)
+
+                rules = QSSProcessor.process(style, widget.class_name, key, shared=True)
+            else:
+                selector = cls.PAGE_SELECTOR.format(id=widget.obj_name)
+                widget.setProperty(cls.PAGE_PROPERTY, True)
+
+                rules = QSSProcessor.process(style, widget.class_name, selector)
+
+            PageStyles.add(rules, widget.obj_name)
+            return
+
+        cls._detach(widget)
+
+        # 'setStyleSheet' on the widget only re-polishes the widget and its children
+        widget.setStyleSheet(QSSProcessor.process(style, widget.class_name, widget.obj_name))
+
+    @classmethod
+    def remove(cls, widget: QWidget) -> None:
+        """
+        Removes the Fluvel styles of a widget, re-polishing only its subtree.
+
+        :rtype: None
+        """
+        cls._reset_palette(widget)
+
+        if PageStyles.building:
+            PageStyles.add("", widget.obj_name)
+            return
+
+        cls._unstyle(widget)
+
+    @classmethod
+    def _unstyle(cls, widget: QWidget) -> None:
+        # Removes the widget's rules from its own stylesheet or from the page sheet
+        detached = cls._detach(widget)
+
+        if widget.styleSheet():
+            widget.setStyleSheet("")
+
+        elif detached:
+            # The page rule no longer matches, but the widget must be polished again
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+
+    @classmethod
+    def refresh(cls, variables: set[str]) -> None:
+        """
+        Re-emits the styles of the widgets that use any of the given theme variables.
+
+        :param variables: The names of the variables whose value changed.
+        :type variables: set[str]
+        :rtype: None
+        """
+        widgets = {}
+
+        for name in variables:
+            widgets.update(cls._dependents.get(name, {}))
+
+        for widget in widgets.values():
+            if style := widget.property("class"):
+                cls.apply(widget, style)
+
+    @classmethod
+    def responsive(cls, page: QWidget) -> list[QWidget]:
+        """
+        Returns the widgets of ``page`` (the page included) whose styles have
+        breakpoint variants.
+
+        :rtype: list[:class:`~PySide6.QtWidgets.QWidget`]
+        """
+        return [
+            widget
+            for widget in cls._responsive.values()
+            if widget is page or page.isAncestorOf(widget)
+        ]
+
+    @classmethod
+    def rules(cls, widget: QWidget) -> str:
+        """
+        Returns the rules currently applied to the widget.
+
+        :rtype: str
+        """
+        if (key := cls._owners.get(widget.obj_name)) is not None:
+            return cls._pages[key][widget.obj_name]
+
+        return widget.styleSheet()
+
+    @classmethod
+    def drop_palettes(cls) -> None:
+        """
+        Re-applies through QSS the styles set through the palette, once a stylesheet
+        reaches their widgets (e.g., a theme has been applied to the application).
+
+        :rtype: None
+        """
+        for widget in list(cls._palette_widgets):
+            if cls._under_stylesheet(widget):
+                cls._reset_palette(widget)
+
+                if style := widget.property("class"):
+                    cls.apply(widget, style)
+
+    @classmethod
+    def _palettes_to_rules(cls, page: QWidget, rules: dict[str, str]) -> None:
+        for widget in list(cls._palette_widgets):
+            if not page.isAncestorOf(widget) or not (style := widget.property("class")):
+                continue
+
+            cls._reset_palette(widget)
+            widget.setProperty(cls.PAGE_PROPERTY, True)
+
+            selector = cls.PAGE_SELECTOR.format(id=widget.obj_name)
+            rules[widget.obj_name] = QSSProcessor.process(style, widget.class_name, selector)
+
+    @staticmethod
+    def _under_stylesheet(widget: QWidget) -> bool:
+        # The application (theme) or an ancestor has a stylesheet
+        if (app := QApplication.instance()) is not None and app.styleSheet():
+            return True
+
+        parent = widget.parentWidget()
+
+        while parent is not None:
+            if parent.styleSheet():
+                return True
+
+            parent = parent.parentWidget()
+
+        return False
+
+    @classmethod
+    def _apply_palette(cls, widget: QWidget, style: str) -> bool:
+        if not Settings.get("fluvel.palette_styles", False):
+            return False
+
+        if (tokens := QSSProcessor.palette_tokens(style)) is None:
+            return False
+
+        # During a build the page sheet is not known yet (see 'commit')
+        if cls._under_stylesheet(widget):
+            return False
+
+        # A fresh palette only overrides these roles, the rest are inherited from the parent
+        palette = QPalette()
+        resolve_variables = ThemeVariables.resolve
+
+        for token, value in tokens:
+            color = QColor.fromString(resolve_variables(value) if "$" in value else value)
+
+            # e.g., 'rgb(...)' or undefined variables are left to the stylesheet engine
+            if not color.isValid():
+                return False
+
+            for role in cls.PALETTE_ROLES[token]:
+                palette.setColor(role, color)
+
+        widget.setPalette(palette)
+        widget.setAutoFillBackground(any(token == "bg" for token, _value in tokens))
+        cls._palette_widgets.add(widget)
+
+        return True
+
+    @classmethod
+    def _reset_palette(cls, widget: QWidget) -> None:
+        if widget in cls._palette_widgets:
+            cls._palette_widgets.discard(widget)
+            widget.setPalette(QPalette())
+            widget.setAutoFillBackground(False)
+
+    @classmethod
+    def _detach(cls, widget: QWidget) -> bool:
+        # Only widgets with a rule in the page sheet need to be detached
+        if (key := cls._owners.pop(widget.obj_name, None)) is None:
+            return False
+
+        del cls._pages[key][widget.obj_name]
+
+        # The stale page rule no longer matches, without touching the page sheet
+        if widget.property(QSSProcessor.SHARED_PROPERTY):
+            widget.setProperty(QSSProcessor.SHARED_PROPERTY, "")
+        else:
+            widget.setProperty(cls.PAGE_PROPERTY, False)
+
+        return True
+
+    @classmethod
+    def _shared_key(cls, class_name: str, style: str) -> str:
+        if (key := cls._shared_keys.get((class_name, style))) is None:
+            key = cls._shared_keys[class_name, style] = f"s{len(cls._shared_keys)}"
+
+        return key
+
+    @classmethod
+    def _track(cls, widget: QWidget, variables: frozenset[str]) -> None:
+        key = id(widget)
+
+        for name in variables:
+            cls._dependents.setdefault(name, {})[key] = widget
+
+        cls._watch(widget)
+
+    @classmethod
+    def _watch(cls, widget: QWidget) -> None:
+        # The references to the widget are removed when it is destroyed
+        key = id(widget)
+
+        if key not in cls._tracked:
+            cls._tracked.add(key)
+            widget.destroyed.connect(partial(cls._forget, key))
+
+    @classmethod
+    def _forget(cls, key: int, *args) -> None:
+        cls._tracked.discard(key)
+        cls._responsive.pop(key, None)
+
+        for widgets in cls._dependents.values():
+            widgets.pop(key, None)
+
+    @classmethod
+    def _release(cls, key: int, *args) -> None:
+        for widget_id in cls._pages.pop(key, {}):
+            cls._owners.pop(widget_id, None)
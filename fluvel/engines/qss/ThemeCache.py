@@ -0,0 +1,148 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+# Fluvel
+from fluvel import __version__
+from fluvel.core.tools import dump_json, load_style_sheet
+from fluvel.engines.qss.ThemeVariables import ThemeVariables
+from fluvel.utils.paths import THEME_CACHE_DIR
+
+
+@dataclass(slots=True)
+class CompiledTheme:
+    """
+    A theme consolidated and resolved, as stored in the cache.
+
+    :ivar key: Fingerprint of the source files and the Fluvel version.
+    :vartype key: str
+    :ivar qss: The consolidated stylesheet (minified only by ``fluvel build``).
+    :vartype qss: str
+    :ivar variables: The ``@name: value;`` definitions of the theme, already resolved.
+    :vartype variables: dict[str, str]
+    """
+
+    key: str
+    qss: str
+    variables: dict[str, str]
+
+
+class ThemeCache:
+    """
+    Static class that compiles the QSS themes of the project into ``.fluvel/cache/themes``.
+
+    Reading a theme in development requires scanning its folder and reading and joining every
+    ``.qss`` file, on each start and on each hot reload. The compiled result is stored
+    with a fingerprint of the sources (relative path, size and modification time of
+    each file) and the Fluvel version, so an unchanged theme is loaded with a single read.
+
+    The same cache is shared by ``fluvel run``, the hot reloader and ``fluvel build``.
+    Loading is serialized, as themes are also prewarmed in a background thread.
+    """
+
+    FORMAT_VERSION: int = 4
+    """Version of the cache layout, part of the fingerprint to discard outdated caches."""
+
+    _memory: dict[str, CompiledTheme] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def load(cls, theme_dir: Path) -> CompiledTheme:
+        """
+        Returns the compiled theme of ``theme_dir``, compiling it only if its sources changed.
+
+        :param theme_dir: The folder of the theme (e.g., ``static/themes/dark``).
+        :type theme_dir: :class:`~pathlib.Path`
+        :rtype: :class:`CompiledTheme`
+        """
+        with cls._lock:
+            return cls._load(theme_dir)
+
+    @classmethod
+    def _load(cls, theme_dir: Path) -> CompiledTheme:
+        files = sorted(theme_dir.rglob("*.qss"))
+        key = cls.fingerprint(theme_dir, files)
+
+        # 1. Memory (hot reload without changes in the styles)
+        if (theme := cls._memory.get(theme_dir.name)) and theme.key == key:
+            return theme
+
+        # 2. Disk cache
+        cache_file = THEME_CACHE_DIR / f"{theme_dir.name}.json"
+
+        if (data := cls._read(cache_file)) and data.get("key") == key:
+            theme = CompiledTheme(key, data["qss"], data["variables"])
+
+        # 3. Compilation
+        else:
+            theme = cls.compile(files, key)
+            cls._save(cache_file, theme)
+
+        cls._memory[theme_dir.name] = theme
+
+        return theme
+
+    @classmethod
+    def compile(cls, files: list[Path], key: str = "") -> CompiledTheme:
+        """
+        Consolidates the QSS files of a theme and resolves its variables.
+
+        :param files: The ``.qss`` files of the theme, in load order.
+        :type files: list[:class:`~pathlib.Path`]
+        :param key: The fingerprint of the files.
+        :type key: str
+        :rtype: :class:`CompiledTheme`
+        """
+        qss, variables = ThemeVariables.compile("\n".join(load_style_sheet(f) for f in files))
+
+        return CompiledTheme(key, qss, variables)
+
+    @staticmethod
+    def fingerprint(theme_dir: Path, files: list[Path]) -> str:
+        """
+        Returns the hash of the metadata of the source files and the Fluvel version.
+
+        :rtype: str
+        """
+        header = f"{__version__}:{ThemeCache.FORMAT_VERSION};"
+        digest = hashlib.blake2b(header.encode(), digest_size=16)
+
+        for file in files:
+            stat = file.stat()
+            entry = f"{file.relative_to(theme_dir)}:{stat.st_size}:{stat.st_mtime_ns};"
+            digest.update(entry.encode())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read(cache_file: Path) -> dict | None:
+        if not cache_file.exists():
+            return None
+
+        # A corrupted cache is simply compiled again
+        try:
+            with open(cache_file, "rb") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _save(cache_file: Path, theme: CompiledTheme) -> None:
+        # The cache is an optimization, a read-only project must still run
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            dump_json(
+                cache_file,
+                {
+                    "key": theme.key,
+                    "qss": theme.qss,
+                    "variables": theme.variables,
+                },
+            )
+        except OSError:
+            pass
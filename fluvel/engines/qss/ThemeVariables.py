@@ -0,0 +1,126 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import re
+from re import Pattern
+
+# Fluvel
+from fluvel.utils.cache_registry import CacheRegistry
+
+
+class ThemeVariables:
+    """
+    Static registry of the design tokens (variables) of the current theme.
+
+    Variables are defined in the ``.qss`` files of a theme with ``@name: value;`` and can be
+    used both inside the theme (``color: @primary;``) and in the inline styles of the
+    widgets (``bg[$primary]``). Theme files are resolved when the theme is compiled and
+    inline styles when they are parsed, so there is no cost when rendering.
+    """
+
+    DEFINITION_PATTERN: Pattern[str] = re.compile(
+        r"^[ \t]*@(?P<name>\w+)[ \t]*:[ \t]*(?P<value>[^;{}\n]+?)[ \t]*;[ \t]*$", re.MULTILINE
+    )
+    """
+    RegEx to extract the variable definitions of a theme file.
+    Example: @primary: #2E94D8;
+    Capture: <primary> in the 'name' group and <#2E94D8> in the 'value' group.
+    """
+
+    THEME_REFERENCE_PATTERN: Pattern[str] = re.compile(r"@(?P<name>\w+)")
+    """RegEx for the references inside the theme files (``color: @primary;``)."""
+
+    INLINE_REFERENCE_PATTERN: Pattern[str] = re.compile(r"\$(?P<name>\w+)")
+    """RegEx for the references inside the inline styles (``bg[$primary]``)."""
+
+    _values: dict[str, str] = {}
+
+    @classmethod
+    def get(cls, name: str, default: str | None = None) -> str | None:
+        return cls._values.get(name, default)
+
+    @classmethod
+    def define(cls, name: str, value: str) -> set[str]:
+        """
+        Defines or overrides a single variable at runtime.
+
+        :returns: The names of the variables that changed.
+        :rtype: set[str]
+        """
+        return cls.update({name: value}, replace=False)
+
+    @classmethod
+    def update(cls, variables: dict[str, str], replace: bool = True) -> set[str]:
+        """
+        Loads the variables of a theme.
+
+        :param variables: The new ``{name: value}`` definitions.
+        :type variables: dict[str, str]
+        :param replace: If True, variables missing in ``variables`` are removed (theme switch).
+        :type replace: bool
+        :returns: The names of the variables whose value changed.
+        :rtype: set[str]
+        """
+        current = cls._values
+
+        changed = {name for name, value in variables.items() if current.get(name) != value}
+
+        if replace:
+            changed.update(current.keys() - variables.keys())
+            cls._values = dict(variables)
+        else:
+            current.update(variables)
+
+        if changed:
+            # Parsed inline styles embed the old values
+            from fluvel.engines.qss.qss import QSSProcessor
+
+            QSSProcessor._parse_styles.cache_clear()
+
+        return changed
+
+    @classmethod
+    def resolve(cls, value: str) -> str:
+        """
+        Replaces the ``$name`` references of an inline value (unknown names are kept).
+        """
+        values = cls._values
+        return cls.INLINE_REFERENCE_PATTERN.sub(lambda m: values.get(m[1], m[0]), value)
+
+    @staticmethod
+    @CacheRegistry.lru("qss_variable_refs", maxsize=2048)
+    def references(styles: str) -> frozenset[str]:
+        """
+        Returns the names of the variables used by an inline style string.
+
+        :rtype: frozenset[str]
+        """
+        if "$" not in styles:
+            return frozenset()
+
+        return frozenset(ThemeVariables.INLINE_REFERENCE_PATTERN.findall(styles))
+
+    @classmethod
+    def compile(cls, qss: str) -> tuple[str, dict[str, str]]:
+        """
+        Extracts the ``@name: value;`` definitions of a theme and resolves its references.
+
+        Definitions are processed in order, so a variable can reference the previous ones.
+
+        :param qss: The raw stylesheet of the theme.
+        :type qss: str
+        :returns: The resolved stylesheet and the variables of the theme.
+        :rtype: tuple[str, dict[str, str]]
+        """
+        variables: dict[str, str] = {}
+
+        def substitute(text: str) -> str:
+            return cls.THEME_REFERENCE_PATTERN.sub(lambda m: variables.get(m[1], m[0]), text)
+
+        for _match in cls.DEFINITION_PATTERN.finditer(qss):
+            variables[_match["name"]] = substitute(_match["value"])
+
+        if not variables:
+            return qss, variables
+
+        return substitute(cls.DEFINITION_PATTERN.sub("", qss)), variables
@@ -3,10 +3,11 @@
 
 import difflib
 import re
-from functools import lru_cache
 
 # Fluvel
+from fluvel.engines.qss.ThemeVariables import ThemeVariables
 from fluvel.user.UserSettings import Settings
+from fluvel.utils.cache_registry import CacheRegistry
 
 
 class QSSProcessor:
@@ -18,16 +19,23 @@ class QSSProcessor:
 
     It implements a system of tokens and regular expressions to parse standard properties,
     interactive pseudo-states (hover, pressed, etc.), and generate complex gradients.
+    Values can reference the variables of the current theme (e.g., ``bg[$primary]``),
+    see :class:`~fluvel.engines.qss.ThemeVariables.ThemeVariables`.
 
     .. note::
-        This class is heavily optimized using :func:`functools.lru_cache` on the
-        parsing methods to guarantee O(1) time complexity for repetitive style patterns,
-        significantly reducing startup and render latency in large UI applications.
+        This class is heavily optimized using caches (see
+        :class:`~fluvel.utils.cache_registry.CacheRegistry`) on the parsing methods to
+        guarantee O(1) time complexity for repetitive style patterns, significantly
+        reducing startup and render latency in large UI applications.
     """
 
     BASE_PATTERN = re.compile(
         r"""
         (?:^|\s)                      # Start of string or space (Non-capturing)
+        (?:                           # Start of Optional Breakpoint Prefix (Non-capturing)
+            (?P<breakpoint>sm|md|lg|xl) # ‘breakpoint’ group: Captures ‘md’, ‘lg’, etc.
+            ::                        # Literal ‘::’
+        )?                            # End of Optional Breakpoint Prefix
         (?:                           # Start of Optional Interactive Prefix (Non-capturing)
             (?P<state>[a-z])          # ‘state’ group: Captures ‘h’, ‘p’, ‘d’, etc.
             ::                        # Literal ‘::’
@@ -38,13 +46,33 @@ class QSSProcessor:
         re.VERBOSE,
     )
 
-    T_COMMON = "{class_name}#{id} {{\n\t{properties}\n}}\n"
-    T_HOVER = "{class_name}#{id}:hover {{\n\t{properties}\n}}\n"
-    T_PRESSED = "{class_name}#{id}:pressed {{\n\t{properties}\n}}\n"
-    T_DIS = "{class_name}#{id}:disabled {{\n\t{properties}\n}}\n"
-    T_CHECK = "{class_name}#{id}:checked {{\n\t{properties}\n}}\n"
+    T_RULE = "{selectors} {{\n\t{properties}\n}}\n"
+
+    T_WIDGET = "{class_name}#{id}"
+
+    # Selector of the rules shared by the widgets with the same style (see 'process')
+    SHARED_PROPERTY: str = "shared_style"
+    T_SHARED = '{class_name}[shared_style="{id}"]'
+
+    STATE_MAP: dict[str, str] = {
+        "common": "",
+        "h": ":hover",
+        "p": ":pressed",
+        "d": ":disabled",
+        "c": ":checked",
+    }
+
+    # The variants only match a page whose 'breakpoint' property includes the name,
+    # or the widgets inside it
+    T_BREAKPOINT = '[breakpoint~="{breakpoint}"]'
+
+    BREAKPOINT_ORDER: dict[str, int] = {"": 0, "sm": 1, "md": 2, "lg": 3, "xl": 4}
+    """Variants are emitted from the smallest breakpoint, so the largest active one wins."""
 
-    TEMPLATE_MAP = {"common": T_COMMON, "h": T_HOVER, "p": T_PRESSED, "d": T_DIS, "c": T_CHECK}
+    _reported: set[str] = set()
+
+    PALETTE_TOKENS: frozenset[str] = frozenset({"bg", "fg"})
+    """Tokens that can be applied through the widget's ``QPalette`` instead of a stylesheet."""
 
     STYLE_TOKENS: dict[str, str] = {
         # --- BACKGROUNDS ---
@@ -142,6 +170,9 @@ class QSSProcessor:
         Analyzes the style string for tokens that don't exist in STYLE_TOKENS.
         If it finds errors, it prints warnings to the console with suggestions.
 
+        The analysis is memoized per style string (see :meth:`check`), and the warnings
+        of a style string are printed only once, no matter how many widgets use it.
+
         :param styles: The style string to validate.
         :type styles: str
         :param class_name: Name of the widget to easily identify the error.
@@ -150,34 +181,78 @@ class QSSProcessor:
         :rtype: bool
         """
 
+        errors = cls.check(styles)
+
+        if errors and styles not in cls._reported:
+            cls._reported.add(styles)
+
+            for error in errors:
+                # TODO: Use print until you have
+                # a logging configuration
+                print(f"Fluvel [SyntaxError] on '{class_name}': {error}")
+
+        return not errors
+
+    @classmethod
+    def check(cls, styles: str, variables: frozenset[str] | None = None) -> tuple[str, ...]:
+        """
+        Returns the syntax errors of a style string, without printing them.
+
+        :param styles: The style string to validate.
+        :type styles: str
+        :param variables: The names of the defined theme variables.
+                          By default, the variables of the current theme.
+        :type variables: frozenset[str] | None
+        :return: The error messages (empty if the styles are valid).
+        :rtype: tuple[str, ...]
+        """
+        errors = cls._check_tokens(styles)
+
+        # Undefined theme variables are kept as is (and ignored by Qt)
+        if references := ThemeVariables.references(styles):
+            is_defined = (
+                variables.__contains__
+                if variables is not None
+                else lambda name: ThemeVariables.get(name) is not None
+            )
+
+            errors += tuple(
+                f"The variable '${name}' is not defined."
+                for name in sorted(references)
+                if not is_defined(name)
+            )
+
+        return errors
+
+    @classmethod
+    @CacheRegistry.lru("qss_lint", maxsize=2048)
+    def _check_tokens(cls, styles: str) -> tuple[str, ...]:
+        # Like '_parse_styles', the analysis only depends on the style string
         matches = cls.BASE_PATTERN.findall(styles)
+
         if not matches:
-            return True
+            return ()
 
-        valid_tokens = set(cls.STYLE_TOKENS.keys())
-        has_errors = False
+        valid_tokens = cls.STYLE_TOKENS
+        errors = []
 
         # We filter unknown tokens
-        for _state, token, _value in matches:
+        for _breakpoint, _state, token, _value in matches:
             if token not in valid_tokens:
-                has_errors = True
-                msg = f"Fluvel [SyntaxError] on '{class_name}': The token '{token}' does not exist."
+                msg = f"The token '{token}' does not exist."
 
-                
                 # We search for the closest matching token using difflib
                 # and add it as a suggestion
                 suggestions = difflib.get_close_matches(token, valid_tokens, n=1, cutoff=0.6)
                 if suggestions:
                     msg += f" Did you mean '{suggestions[0]}'?"
 
-                # TODO: Use print until you have
-                # a logging configuration
-                print(msg)
+                errors.append(msg)
 
-        return not has_errors
+        return tuple(errors)
 
     @classmethod
-    def process(cls, styles: str, class_name: str, widget_id: str) -> str:
+    def process(cls, styles: str, class_name: str, widget_id: str, shared: bool = False) -> str:
         """
         Processes a Fluvel style string and generates the final QSS code.
 
@@ -185,19 +260,27 @@ class QSSProcessor:
         resolves tokens using :attr:`STYLE_TOKENS`, and constructs the complete CSS style block
         applied to the specific widget ID.
 
+        With ``shared``, ``widget_id`` is the key of a rule shared by every widget of
+        ``class_name`` with the same style, which is matched through the dynamic
+        property :attr:`SHARED_PROPERTY` instead of the object name.
+
         :param styles: The style string in Fluvel syntax (e.g., ``"bg[#333] :h:bg[#555]"``).
         :type styles: str
         :param class_name: The name of the widget class (e.g., ``"QPushButton"``).
         :type class_name: str
-        :param widget_id: The unique ID of the object (e.g., ``"12345678"``) used as the ID selector in QSS.
+        :param widget_id: The unique ID of the object (e.g., ``"12345678"``) used as the ID
+                          selector in QSS, or the key of the shared rule.
         :type widget_id: str
+        :param shared: If True, the rule targets the widgets whose
+                       :attr:`SHARED_PROPERTY` is ``widget_id``.
+        :type shared: bool
         :return: The complete, formatted QSS code ready for use in ``setStyleSheet``.
         :rtype: str
         """
 
-        # We use difflib to validate the syntax before
-        # processing (validation is only performed in production)
-        if not Settings.get("fluvel.production", False):
+        # We use difflib to validate the syntax before processing (validation is only
+        # performed in development and can be replaced by the 'fluvel lint' command)
+        if not Settings.get("fluvel.production", False) and Settings.get("fluvel.lint", True):
             cls.lint(styles, class_name)
 
         parsed_blocks = cls._parse_styles(styles)
@@ -207,38 +290,91 @@ class QSSProcessor:
 
         final_parts = []
 
-        # Micro-optimization: Bring the .format method local
+        template = cls.T_SHARED if shared else cls.T_WIDGET
+        base = template.format(class_name=class_name, id=widget_id)
+
+        # Micro-optimization: Bring the .get method local
         # Avoid attribute lookups in the loop
-        get_template = cls.TEMPLATE_MAP.get
+        get_state = cls.STATE_MAP.get
+
+        for breakpoint, state, properties_block in parsed_blocks:
+            pseudo_state = get_state(state)
+            if pseudo_state is not None:
+                selectors = f"{base}{pseudo_state}"
+
+                if breakpoint:
+                    scope = cls.T_BREAKPOINT.format(breakpoint=breakpoint)
+                    selectors = f"*{scope} {selectors}, {base}{scope}{pseudo_state}"
 
-        for state, properties_block in parsed_blocks:
-            template = get_template(state)
-            if template:
                 final_parts.append(
-                    template.format(
-                        class_name=class_name, id=widget_id, properties=properties_block
-                    )
+                    cls.T_RULE.format(selectors=selectors, properties=properties_block)
                 )
 
         return "".join(final_parts)
 
     @classmethod
-    @lru_cache(maxsize=2048)
-    def _parse_styles(cls, styles: str) -> list[tuple[str, str]]:
+    def breakpoints(cls, styles: str) -> frozenset[str]:
+        """
+        Returns the breakpoints used by a style string (e.g., ``{"md", "lg"}``
+        for ``"p[8px] md::p[16px] lg::fs[18px]"``).
+
+        :rtype: frozenset[str]
+        """
+        if "::" not in styles:
+            return frozenset()
+
+        return frozenset(breakpoint for breakpoint, _, _ in cls._parse_styles(styles) if breakpoint)
+
+    @classmethod
+    @CacheRegistry.lru("qss_palette", maxsize=2048)
+    def palette_tokens(cls, styles: str) -> tuple[tuple[str, str], ...] | None:
+        """
+        Returns the ``(token, value)`` pairs of a style string that only uses
+        :attr:`PALETTE_TOKENS` without interactive states (e.g., ``"bg[#222] fg[white]"``).
+
+        Any other token, prefix (``h::bg[...]``, ``md::bg[...]``) or unrecognized text returns None,
+        and the style must be processed as QSS. Theme variables are not resolved here,
+        so the result doesn't depend on the current theme.
+
+        :param styles: The style string in Fluvel syntax.
+        :type styles: str
+        :rtype: tuple[tuple[str, str], ...] | None
+        """
+        matches = cls.BASE_PATTERN.findall(styles)
+
+        if not matches or cls.BASE_PATTERN.sub("", styles).strip():
+            return None
+
+        palette_tokens = cls.PALETTE_TOKENS
+
+        for breakpoint, state, token, _value in matches:
+            if breakpoint or state or token not in palette_tokens:
+                return None
+
+        return tuple((token, value.strip()) for _breakpoint, _state, token, value in matches)
+
+    @classmethod
+    @CacheRegistry.lru("qss_parse_styles", maxsize=2048)
+    def _parse_styles(cls, styles: str) -> list[tuple[str, str, str]]:
         """
         Performs the heavy lifting of Regex matching, token resolution, and property grouping.
 
-        This method is decorated with :func:`functools.lru_cache` to ensure that
+        This method is cached (``qss_parse_styles`` in ``[fluvel.cache]``) to ensure that
         the expensive parsing process is executed only once per unique style string.
+        Theme variables (``$primary``) are resolved here, so the cache is cleared
+        when their values change.
 
         The properties for each state are pre-joined to minimize string concatenation
         work in the main ``process`` method.
 
+        Breakpoint variants (``md::p[16px]``) are compiled here once, like the rest of
+        the blocks, and sorted after the base blocks from the smallest breakpoint.
+
         :param styles: The raw style string from the user.
         :type styles: str
-        :returns: A list of tuples, where each tuple is (state, properties_block).
-                  Example: ``[('common', 'color: #fff;\\n\\tfont-size: 12px;'), ('h', 'background-color: #333;')]``
-        :rtype: List[Tuple[str, str]]
+        :returns: A list of tuples, where each tuple is (breakpoint, state, properties_block).
+                  Example: ``[('', 'common', 'color: #fff;'), ('md', 'h', 'padding: 16px;')]``
+        :rtype: List[Tuple[str, str, str]]
         """
 
         matches = cls.BASE_PATTERN.findall(styles)
@@ -250,35 +386,45 @@ class QSSProcessor:
         temp_groups = {}
 
         tokens_map = cls.STYLE_TOKENS
+        resolve_variables = ThemeVariables.resolve
 
-        for state, token, value in matches:
+        for breakpoint, state, token, value in matches:
             state = state if state else "common"
 
             token_template = tokens_map.get(token)
             if not token_template:
                 continue
 
+            if "$" in value:
+                value = resolve_variables(value)
+
             # Gradient processing only if necessary
             if token.startswith(("bg-lgrad", "bg-rgrad")):
                 value = cls._generate_stops(value)
 
             qss_line = token_template.format(value=value)
 
-            if state not in temp_groups:
-                temp_groups[state] = []
+            group = (breakpoint, state)
+
+            if group not in temp_groups:
+                temp_groups[group] = []
+
+            temp_groups[group].append(qss_line)
+
+        # The sort is stable, so the order of the states is kept within each breakpoint
+        order = cls.BREAKPOINT_ORDER
+        groups = sorted(temp_groups.items(), key=lambda item: order[item[0][0]])
 
-            temp_groups[state].append(qss_line)
-        
         # We convert to an immutable structure (List of tuples)
         # and pre-join the properties with \n\t to save work in the rendering step
         result = []
-        for state, lines in temp_groups.items():
-            result.append((state, "\n\t".join(lines)))
+        for (breakpoint, state), lines in groups:
+            result.append((breakpoint, state, "\n\t".join(lines)))
 
         return result
 
     @staticmethod
-    @lru_cache(maxsize=128)
+    @CacheRegistry.lru("qss_gradient_stops", maxsize=128)
     def _generate_stops(colors: str) -> str:
         """
         Generates the QSS 'stop' string for a gradient.
@@ -3,49 +3,99 @@
 
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 # Expect Handler
 from fluvel.core.tools.expect_handler import expect
 
 
 class XMLMenuParser:
+    @classmethod
+    def parse(cls, file_path: Path | BinaryIO) -> dict[str, Any]:
+        return cls.compile(file_path)[0]
+
     @classmethod
     @expect.FileNotFound(stop=True)
-    def parse(cls, file_path: Path) -> dict[str, Any]:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+    def compile(cls, file_path: Path | BinaryIO) -> tuple[dict[str, Any], dict[str, str]]:
+        """
+        Builds the menu structure and the flat ``{id: text}`` map of a menu file
+        in a single streaming pass (``iterparse``), without building the whole tree.
+
+        Only the ``<menu>`` elements (with an ``id``) of the root are menus. Each child
+        is keyed by its ``id``, or by ``sep_<index>`` if it has none (separators).
+
+        :param file_path: The ``.xml`` file (or a binary stream of its content).
+        :type file_path: :class:`~pathlib.Path` | BinaryIO
+        :returns: The menu structure and the texts of its items (separators excluded).
+        :rtype: tuple[dict[str, Any], dict[str, str]]
+        """
         menu_structure: dict[str, Any] = {}
-        build_from_element = cls._build_dict_from_element
+        texts: dict[str, str] = {}
 
-        # Usamos enumerate para que los menús principales también tengan orden si fuera necesario
-        for menu_element in root.findall("menu"):
-            menu_id = menu_element.get("id")
-            if menu_id:
-                menu_structure[menu_id] = build_from_element(menu_element)
+        # Open elements: [key, node, number of children], None for the ignored ones
+        stack: list[list | None] = []
 
-        return menu_structure
+        for event, element in ET.iterparse(file_path, events=("start", "end")):
+            if event == "start":
+                stack.append(cls._open(element, stack, menu_structure))
+                continue
+
+            if (current := stack.pop()) is None or not stack:
+                continue
+
+            key, node, _ = current
+
+            if element.tag != "sep":
+                node["text"] = text = element.get("text", element.text)
+
+                if text != "---":
+                    texts[key] = text
+
+            # Its content is already in the node
+            element.clear()
+
+        return menu_structure, texts
+
+    @staticmethod
+    def _open(element: ET.Element, stack: list[list | None], menu_structure: dict) -> list | None:
+        # The root element
+        if not stack:
+            return [None, None, 0]
+
+        if (parent := stack[-1]) is None:
+            return None
+
+        _, parent_node, index = parent
+        parent[2] += 1
+
+        if parent_node is None:
+            # Menus of the root
+            if element.tag != "menu" or not (key := element.get("id")):
+                return None
+
+            elements = menu_structure
+
+        else:
+            # The children of a separator are ignored
+            if "elements" not in parent_node:
+                return None
+
+            # Si el hijo tiene ID lo usamos, si no (como el sep), usamos el índice
+            key = element.get("id") or f"sep_{index}"
+
+            if (elements := parent_node["elements"]) is None:
+                elements = parent_node["elements"] = {}
 
-    @classmethod
-    def _build_dict_from_element(cls, element: ET.Element) -> dict[str, Any]:
-        # El caso base del separador ya no necesita generar su propio ID aquí,
-        # lo hará el padre al iterar.
         if element.tag == "sep":
-            return {"text": "---"}
-
-        node_dict = {
-            "id": element.get("id"),
-            "text": element.get("text", element.text),
-            "icon": element.get("icon"),
-            "checkable": element.get("checkable") == "true",
-            "elements": {} if len(element) > 0 else None,
-        }
-
-        if node_dict["elements"] is not None:
-            # Aquí es donde ocurre la magia del ID predecible
-            for i, child in enumerate(element):
-                # Si el hijo tiene ID lo usamos, si no (como el sep), usamos el índice
-                child_id = child.get("id") or f"sep_{i}"
-                node_dict["elements"][child_id] = cls._build_dict_from_element(child)
-
-        return node_dict
+            node = {"text": "---"}
+        else:
+            node = {
+                "id": element.get("id"),
+                "text": None,
+                "icon": element.get("icon"),
+                "checkable": element.get("checkable") == "true",
+                "elements": None,
+            }
+
+        elements[key] = node
+        return [key, node, 0]
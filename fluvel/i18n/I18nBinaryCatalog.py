@@ -0,0 +1,142 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import mmap
+import struct
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+
+class I18nBinaryCatalog(Mapping[str, str]):
+    """
+    Read-only text catalog backed by a memory-mapped ``.flcat`` file (production).
+
+    Loading the ``<lang>.json`` catalog builds a dict with every HTML string of the
+    language. The binary catalog is only mapped into memory: opening it reads the
+    header, lookups are a binary search over the sorted key table, and each text is
+    decoded on demand. The pages are loaded by the OS as they are used and are
+    shared between the processes that map the same file.
+
+    Layout (little-endian)::
+
+        header   "FLCAT" + version (u8), number of entries (u32)
+        index    per entry, sorted by the UTF-8 key: key offset, key length,
+                 value offset, value length (4 x u32)
+        keys     UTF-8 blob
+        values   UTF-8 blob
+
+    The offsets are absolute positions in the file.
+    """
+
+    MAGIC: bytes = b"FLCAT"
+    VERSION: int = 1
+
+    HEADER = struct.Struct("<5sBI")
+    ENTRY = struct.Struct("<IIII")
+
+    __slots__ = ("_file", "_buffer", "_count")
+
+    def __init__(self, path: Path) -> None:
+        self._file = open(path, "rb")
+
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, self._count = self.HEADER.unpack_from(self._buffer)
+        except (ValueError, struct.error, OSError):
+            self._file.close()
+            raise ValueError(f"{path} is not a valid catalog.") from None
+
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a compatible catalog (version {version}).")
+
+    @classmethod
+    def open(cls, path: Path) -> "I18nBinaryCatalog | None":
+        """
+        Maps the catalog of ``path``, or returns None if it's missing or invalid.
+
+        :rtype: :class:`I18nBinaryCatalog` | None
+        """
+        try:
+            return cls(path)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def write(cls, path: Path, texts: Mapping[str, str]) -> None:
+        """
+        Writes ``texts`` as a binary catalog (used by ``fluvel build``).
+
+        :param path: The ``.flcat`` file to write.
+        :type path: :class:`~pathlib.Path`
+        :param texts: The ``{id: html}`` texts of a language.
+        :type texts: Mapping[str, str]
+        """
+        entries = sorted((key.encode(), value.encode()) for key, value in texts.items())
+
+        keys_offset = cls.HEADER.size + cls.ENTRY.size * len(entries)
+        values_offset = keys_offset + sum(len(key) for key, _ in entries)
+
+        index = bytearray(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(entries)))
+
+        for key, value in entries:
+            index += cls.ENTRY.pack(keys_offset, len(key), values_offset, len(value))
+            keys_offset += len(key)
+            values_offset += len(value)
+
+        with open(path, "wb") as f:
+            f.write(index)
+            f.writelines(key for key, _ in entries)
+            f.writelines(value for _, value in entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if (i := self._find(key)) < 0:
+            return default
+
+        _, _, offset, length = self.ENTRY.unpack_from(self._buffer, self._entry(i))
+        return self._buffer[offset : offset + length].decode()
+
+    def close(self) -> None:
+        self._buffer.close()
+        self._file.close()
+
+    def _entry(self, i: int) -> int:
+        return self.HEADER.size + i * self.ENTRY.size
+
+    def _key(self, i: int) -> bytes:
+        offset, length, _, _ = self.ENTRY.unpack_from(self._buffer, self._entry(i))
+        return self._buffer[offset : offset + length]
+
+    def _find(self, key: str) -> int:
+        target = key.encode()
+        low, high = 0, self._count
+
+        while low < high:
+            middle = (low + high) // 2
+            current = self._key(middle)
+
+            if current < target:
+                low = middle + 1
+            elif current > target:
+                high = middle
+            else:
+                return middle
+
+        return -1
+
+    def __getitem__(self, key: str) -> str:
+        if (text := self.get(key)) is None:
+            raise KeyError(key)
+
+        return text
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._key(i).decode()
+
+    def __len__(self) -> int:
+        return self._count
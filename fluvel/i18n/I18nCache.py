@@ -0,0 +1,116 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import hashlib
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Fluvel
+from fluvel import __version__
+from fluvel.core.tools import dump_json
+from fluvel.utils.paths import I18N_CACHE_DIR
+
+
+class I18nCache:
+    """
+    On-disk cache of the parsed ``.fluml`` and ``.xml`` files of a language (development).
+
+    Every ``fluvel run`` and every hot reload loads the whole language folder. The parsed
+    output of each file is stored in ``.fluvel/cache/i18n/<lang>.json``, keyed by its
+    relative path, so only the files that changed are parsed again:
+
+    1. If the size and modification time match, the cached output is used without reading the file.
+    2. Otherwise the file is read and hashed; if the content hash matches (e.g., the file was
+       only touched), the cached output is kept.
+    3. Only a new or modified file is parsed.
+
+    :param lang_dir: The folder of the language (e.g., ``static/i18n/en``).
+    :type lang_dir: :class:`~pathlib.Path`
+    """
+
+    FORMAT_VERSION: int = 2
+    """Version of the cache layout, discards the caches written by other versions."""
+
+    _memory: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def __init__(self, lang_dir: Path) -> None:
+        self.lang_dir = lang_dir
+        self.cache_file = I18N_CACHE_DIR / f"{lang_dir.name}.json"
+
+        # 'parsed' counts the files parsed in this load (the rest came from the cache)
+        self.parsed = 0
+
+        self._version = f"{__version__}:{self.FORMAT_VERSION}"
+        self._entries = self._memory.get(lang_dir.name) or self._read()
+        self._visited: dict[str, dict[str, Any]] = {}
+        self._changed = False
+
+    def get(self, file: Path, parse: Callable[[bytes], Any]) -> Any:
+        """
+        Returns the parsed output of ``file``, parsing it only if it changed.
+
+        :param file: A ``.fluml`` or ``.xml`` file of the language.
+        :type file: :class:`~pathlib.Path`
+        :param parse: Parses the content of the file, its output must be JSON serializable.
+        :type parse: Callable[[bytes], Any]
+        """
+        relative_path = file.relative_to(self.lang_dir).as_posix()
+        stat = file.stat()
+        entry = self._entries.get(relative_path)
+
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+            self._visited[relative_path] = entry
+            return entry["data"]
+
+        content = file.read_bytes()
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+
+        if entry and entry["hash"] == digest:
+            data = entry["data"]
+        else:
+            data = parse(content)
+            self.parsed += 1
+
+        self._visited[relative_path] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hash": digest,
+            "data": data,
+        }
+        self._changed = True
+
+        return data
+
+    def save(self) -> None:
+        """
+        Stores the entries of the files visited in this load (removed files are dropped).
+        """
+        self._memory[self.lang_dir.name] = self._visited
+
+        if not self._changed and self._visited.keys() == self._entries.keys():
+            return
+
+        # The cache is an optimization, a read-only project must still run
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            dump_json(self.cache_file, {"version": self._version, "files": self._visited})
+        except OSError:
+            pass
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if not self.cache_file.exists():
+            return {}
+
+        # A corrupted or outdated cache is simply parsed again
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = json.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self._version:
+            return {}
+
+        return data.get("files", {})
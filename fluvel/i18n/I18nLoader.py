@@ -1,17 +1,25 @@
 # Copyright (C) 2025-2026 J. F. Escobar
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from collections.abc import Callable
+import io
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 # Exceptions Handler
 from fluvel.core.exceptions.exceptions import ContentLoadingError
-from fluvel.core.tools import load_file, load_fluml
-from fluvel.engines import XMLMenuParser, convert_FLUML_to_HTML
+from fluvel.core.tools import load_file
+from fluvel.engines import FlumlParser, XMLMenuParser
 
 # Fluvel Utils
-from fluvel.i18n.data_structures import I18nRawContent
+from fluvel.i18n.data_structures import I18nLazyCatalog, I18nRawContent
+from fluvel.i18n.I18nBinaryCatalog import I18nBinaryCatalog
+from fluvel.i18n.I18nCache import I18nCache
+from fluvel.user.UserSettings import Settings
+from fluvel.utils.cache_registry import CacheRegistry
 
 # Fluvel Paths
 from fluvel.utils.paths import I18N_DIR, PROD_STATIC_DIR
@@ -20,6 +28,16 @@ from fluvel.utils.paths import I18N_DIR, PROD_STATIC_DIR
 class I18nLoader:
     current_language: str = None
 
+    # Loaded languages, the least recently used are discarded
+    _loaded: OrderedDict[str, I18nRawContent] = OrderedDict()
+    _loaded_counter = CacheRegistry.register_mapping("i18n_languages", _loaded, maxsize=3)
+
+    # Guards '_loaded' between the GUI thread and the preload thread (files are read unlocked)
+    _lock = threading.Lock()
+
+    # Incremented by clear(), so a read started before it is not stored
+    _generation: int = 0
+
     @classmethod
     def load(cls, lang: str, in_production: bool) -> I18nRawContent | None:
         # Si el lenguaje es el mismo de la aplicación actualmente
@@ -32,6 +50,117 @@ class I18nLoader:
         # parseo de los archivos de idioma.
         cls.current_language = lang
 
+        # Preloaded (or previously used) languages are swapped without reading anything
+        return cls._get(lang, in_production)
+
+    @classmethod
+    def preload(cls, languages: list[str], in_production: bool) -> None:
+        """
+        Loads the given languages in a background thread, so switching to them
+        only swaps the dictionaries of :class:`~fluvel.i18n.I18nProvider.I18nProvider`.
+
+        At most ``i18n_languages`` (in ``[fluvel.cache]``) languages, the current one
+        included, are kept in memory, the least recently used are discarded.
+
+        :param languages: The language codes, ``"*"`` preloads every available language.
+        :type languages: list[str]
+        :param in_production: Whether the compiled catalogs must be loaded.
+        :type in_production: bool
+        """
+        if "*" in languages:
+            root = PROD_STATIC_DIR if in_production else I18N_DIR
+
+            # In production, the themes are also compiled into 'rsrc/_themes'
+            languages = sorted(
+                d.name for d in root.iterdir() if d.is_dir() and not d.name.startswith("_")
+            ) if root.is_dir() else []
+
+        limit = cls._loaded_counter.maxsize
+        pending = [lang for lang in languages if lang != cls.current_language]
+
+        # The current language also takes a slot
+        if limit is not None:
+            pending = pending[: max(limit - 1, 0)]
+
+        if not pending:
+            return
+
+        def preload():
+            for lang in pending:
+                cls._get(lang, in_production, preloading=True)
+
+        threading.Thread(target=preload, name="fluvel-i18n-preload", daemon=True).start()
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Forgets the current and the preloaded languages, so the next load reads
+        the files again (e.g., on hot reload).
+        """
+        with cls._lock:
+            cls.current_language = None
+            cls._loaded.clear()
+            cls._generation += 1
+
+    @classmethod
+    def _get(
+        cls, lang: str, in_production: bool, preloading: bool = False
+    ) -> I18nRawContent | None:
+        with cls._lock:
+            if (content := cls._lookup(lang, preloading)) is not None:
+                return content
+
+            if not preloading:
+                cls._loaded_counter.misses += 1
+
+            generation = cls._generation
+
+        # The files are read without the lock, so a switch to a loaded language never
+        # waits for the preload thread (both threads may read the same language)
+        if (content := cls.read(lang, in_production)) is None:
+            return None
+
+        with cls._lock:
+            # The first read stored is kept
+            if (loaded := cls._loaded.get(lang)) is not None:
+                return loaded
+
+            # The languages were cleared during the read (e.g., hot reload)
+            if generation != cls._generation:
+                return content
+
+            cls._loaded[lang] = content
+
+            # The language in use is never the first to be discarded
+            if cls.current_language in cls._loaded:
+                cls._loaded.move_to_end(cls.current_language)
+
+            if (limit := cls._loaded_counter.maxsize) is None:
+                return content
+
+            while len(cls._loaded) > max(limit, 1):
+                cls._loaded.popitem(last=False)
+                cls._loaded_counter.evictions += 1
+
+            return content
+
+    @classmethod
+    def _lookup(cls, lang: str, preloading: bool) -> I18nRawContent | None:
+        # Must be called with the lock held
+        if (content := cls._loaded.get(lang)) is not None and not preloading:
+            cls._loaded_counter.hits += 1
+            cls._loaded.move_to_end(lang)
+
+        return content
+
+    @classmethod
+    def read(cls, lang: str, in_production: bool) -> I18nRawContent | None:
+        """
+        Reads and parses the files of a language, without changing the current language.
+
+        :rtype: :class:`~fluvel.i18n.data_structures.I18nRawContent` | None
+        """
+
         # Se define la ruta a la carpeta del idioma objetivo y las
         # extensiones de los mismos.
         folder_path: Path = (PROD_STATIC_DIR if in_production else I18N_DIR) / lang
@@ -44,34 +173,86 @@ class I18nLoader:
         # Getting the list of files
         menu_files, text_files = cls.get_files(folder_path, file_extensions)
 
+        # In development, only the files changed since the last load are parsed again
+        cache = None if in_production else I18nCache(folder_path)
+
         # Obtaining the functions responsible for loading
         # the files and delivering the content dictionary
-        process_menus, process_texts = cls.get_file_processors(in_production)
+        process_menus, process_texts = cls.get_file_processors(in_production, cache)
 
-        menus_dict = process_menus(menu_files)
+        menus_dict, menu_texts = process_menus(menu_files)
         text_dict = process_texts(text_files)
 
-        return I18nRawContent(menus_dict, text_dict)
+        if cache is not None:
+            cache.save()
+
+        return I18nRawContent(menus_dict, text_dict, menu_texts)
 
     @classmethod
-    def get_file_processors(cls, in_production: bool) -> tuple[Callable, Callable]:
+    def get_file_processors(
+        cls, in_production: bool, cache: I18nCache | None = None
+    ) -> tuple[Callable, Callable]:
         if in_production:
-            return cls._load_from_json, cls._load_from_json
+            return cls._load_menus, cls._load_catalog
 
-        return cls._process_menus, cls._process_texts
+        return partial(cls._process_menus, cache=cache), partial(cls._process_texts, cache=cache)
 
     @staticmethod
-    def _process_menus(files: list[Path]) -> dict[str, Any]:
-        return {f.stem: XMLMenuParser.parse(f) for f in files}
+    def _process_menus(
+        files: list[Path], cache: I18nCache
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        # The structure and the texts of each file are built in one pass and cached together
+        def parse(content: bytes) -> dict[str, Any]:
+            structure, texts = XMLMenuParser.compile(io.BytesIO(content))
+            return {"structure": structure, "texts": texts}
+
+        menus: dict[str, Any] = {}
+        texts: dict[str, str] = {}
+
+        for f in files:
+            compiled = cache.get(f, parse)
+            menus[f.stem] = compiled["structure"]
+            texts.update(compiled["texts"])
+
+        return menus, texts
 
     @staticmethod
-    def _process_texts(files: list[Path]) -> dict[str, Any]:
-        return convert_FLUML_to_HTML("\n".join(load_fluml(f) for f in files))
+    def _process_texts(files: list[Path], cache: I18nCache) -> Mapping[str, str]:
+        # Each file is cached as its index of raw blocks
+        raw: dict[str, str] = {}
+
+        for f in files:
+            raw.update(cache.get(f, lambda content: FlumlParser.index(content.decode("utf-8"))))
+
+        # The texts are formatted by I18nMessage
+        render = partial(FlumlParser.render, icu=True)
+
+        if not Settings.get("fluvel.lazy_i18n", True):
+            return {block_id: render(text) for block_id, text in raw.items()}
+
+        # Each text is rendered on its first access
+        return I18nLazyCatalog(raw, render)
 
     @staticmethod
     def _load_from_json(files: list[Path]) -> dict[str, Any]:
         return load_file(files[0])
 
+    @classmethod
+    def _load_menus(cls, files: list[Path]) -> tuple[dict[str, Any], None]:
+        # The texts are taken from the structure by I18nProvider
+        return (cls._load_from_json(files) if files else {}), None
+
+    @classmethod
+    def _load_catalog(cls, files: list[Path]) -> Mapping[str, str]:
+        # The binary catalog is memory-mapped, the JSON catalog is the fallback
+        if files:
+            catalog = I18nBinaryCatalog.open(files[0].with_suffix(".flcat"))
+
+            if catalog is not None:
+                return catalog
+
+        return cls._load_from_json(files)
+
     @staticmethod
     def get_files(
         content_folder: Path, extensions: tuple[str, str]
@@ -0,0 +1,379 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import re
+from collections.abc import Callable, Mapping
+from typing import Any
+
+# Fluvel
+from fluvel.utils.cache_registry import CacheRegistry
+
+# A compiled part is a literal or a function of (values, number of the enclosing plural)
+Part = str | Callable[[Mapping[str, Any], str], str]
+
+
+def _few_many(n: int) -> str:
+    return "few" if 2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14 else "many"
+
+
+def _east_slavic(n: float) -> str:
+    if n != int(n):
+        return "other"
+
+    n = int(n)
+    return "one" if n % 10 == 1 and n % 100 != 11 else _few_many(n)
+
+
+def _polish(n: float) -> str:
+    if n != int(n):
+        return "other"
+
+    return "one" if n == 1 else _few_many(int(n))
+
+
+def _arabic(n: float) -> str:
+    if n != int(n):
+        return "other"
+
+    n = int(n)
+    if n in (0, 1, 2):
+        return ("zero", "one", "two")[n]
+    if 3 <= n % 100 <= 10:
+        return "few"
+    if 11 <= n % 100 <= 99:
+        return "many"
+    return "other"
+
+
+PLURAL_RULES: dict[str, Callable[[float], str]] = {
+    # one: 1, other: everything else
+    "default": lambda n: "one" if n == 1 else "other",
+    # one: 0 and 1
+    "fr": lambda n: "one" if 0 <= n < 2 else "other",
+    "pt": lambda n: "one" if 0 <= n < 2 else "other",
+    # one: 1, few: 2-4
+    "cs": lambda n: "one" if n == 1 else "few" if n in (2, 3, 4) else "other",
+    "sk": lambda n: "one" if n == 1 else "few" if n in (2, 3, 4) else "other",
+    # one: 1, 21, 31..., few: 2-4, 22-24..., many: the rest of integers
+    "ru": _east_slavic,
+    "uk": _east_slavic,
+    "pl": _polish,
+    "ar": _arabic,
+    # No plural forms
+    "ja": lambda n: "other",
+    "ko": lambda n: "other",
+    "zh": lambda n: "other",
+    "vi": lambda n: "other",
+    "th": lambda n: "other",
+    "id": lambda n: "other",
+}
+"""
+CLDR plural categories (cardinals) of each language. Regional codes use the rules of their
+language (``pt-BR`` → ``pt``), and the languages that are not listed use ``default``.
+"""
+
+
+class I18nMessage:
+    """
+    A text compiled into a formatter, with ICU-style arguments:
+
+    - ``{name}``: the value of the placeholder.
+    - ``{price:.2f}``: the value formatted with a Python format spec.
+    - ``{user.name}``, ``{items[0]}``, ``{name!r}``: attributes, items and conversions,
+      as in :meth:`str.format`.
+    - ``{count, plural, =0 {No items} one {# item} other {# items}}``: the branch of
+      the exact value (``=N``) or of the plural category of the language
+      (``zero``, ``one``, ``two``, ``few``, ``many``, ``other``). ``#`` is the number.
+    - ``{gender, select, female {She} male {He} other {They}}``: the branch of the value.
+
+    The text is parsed once (see :meth:`compile`), formatting only joins the parts.
+    Missing placeholders (or attributes and items) are kept as they are written, and
+    malformed arguments are kept as literal text. Escaped braces (``\\{`` in FLUML, rendered
+    as ``&#123;``) are turned back into literal braces.
+    """
+
+    __slots__ = ("_parts",)
+
+    # name, .attribute and [item] accessors, and !conversion
+    NAME_PATTERN = re.compile(
+        r"\s*([A-Za-z_]\w*)((?:\.[A-Za-z_]\w*|\[[^\[\]{}]+\])*)(?:!([rsa]))?\s*"
+    )
+    ACCESSOR_PATTERN = re.compile(r"\.(\w+)|\[([^\]]+)\]")
+    TYPE_PATTERN = re.compile(r",\s*(plural|select)\s*,")
+    SELECTOR_PATTERN = re.compile(r"\s*(=-?\d+(?:\.\d+)?|[A-Za-z_]\w*)\s*\{")
+    END_PATTERN = re.compile(r"\s*\}")
+
+    # Tags and entities (e.g., "color:#fff" or "&amp;") are copied verbatim
+    SPECIAL_PATTERN = re.compile(r"[{}#<&]")
+    ENTITY_PATTERN = re.compile(r"&#?\w+;")
+
+    # Escaped braces (see FlumlParser.ICU_ESCAPES) are literal braces
+    BRACE_ENTITIES: dict[str, str] = {"&#123;": "{", "&#125;": "}"}
+
+    def __init__(self, parts: list[Part]) -> None:
+        self._parts = parts
+
+    @staticmethod
+    @CacheRegistry.lru("i18n_messages", maxsize=4096)
+    def compile(text: str, lang: str | None = None) -> "I18nMessage":
+        """
+        Compiles a text of a language (memoized per text and language).
+
+        :param text: The rendered text (e.g., ``"{n, plural, one {# file} other {# files}}"``).
+        :type text: str
+        :param lang: The language code, it selects the plural rules.
+        :type lang: str | None
+        :rtype: :class:`I18nMessage`
+        """
+        if "{" not in text:
+            return I18nMessage([I18nMessage._unescape(text) if "&#12" in text else text])
+
+        base = (lang or "").replace("_", "-").split("-")[0].lower()
+        rule = PLURAL_RULES.get(base, PLURAL_RULES["default"])
+
+        parts, _ = I18nMessage._parse(text, 0, rule, in_plural=False, nested=False)
+        return I18nMessage(parts)
+
+    def format(self, values: Mapping[str, Any]) -> str:
+        """
+        Formats the message with the values of the placeholders.
+
+        :rtype: str
+        """
+        parts = self._parts
+
+        if len(parts) == 1 and parts[0].__class__ is str:
+            return parts[0]
+
+        return _join(parts, values, "")
+
+    @classmethod
+    def _parse(
+        cls,
+        text: str,
+        position: int,
+        rule: Callable[[float], str],
+        in_plural: bool,
+        nested: bool,
+    ) -> tuple[list[Part], int]:
+        """
+        Parses the text from ``position`` up to the end or, in a branch, up to its
+        closing ``}``, returning the parts and the position where it stopped.
+        """
+        parts: list[Part] = []
+        literal: list[str] = []
+        length = len(text)
+
+        while position < length:
+            if (special := cls.SPECIAL_PATTERN.search(text, position)) is None:
+                literal.append(text[position:])
+                position = length
+                break
+
+            start = special.start()
+            literal.append(text[position:start])
+            char = text[start]
+
+            if char == "}":
+                if nested:
+                    position = start
+                    break
+
+                literal.append("}")
+                position = start + 1
+
+            elif char == "<":
+                end = text.find(">", start)
+                end = length if end < 0 else end + 1
+                literal.append(text[start:end])
+                position = end
+
+            elif char == "&":
+                entity = cls.ENTITY_PATTERN.match(text, start)
+                end = entity.end() if entity else start + 1
+                literal.append(cls._unescape(text[start:end]))
+                position = end
+
+            elif char == "#":
+                if in_plural:
+                    cls._flush(parts, literal)
+                    parts.append(_number)
+                else:
+                    literal.append("#")
+                position = start + 1
+
+            else:
+                try:
+                    argument, position = cls._argument(text, start, rule, in_plural)
+                except ValueError:
+                    # Malformed arguments are literal text
+                    literal.append("{")
+                    position = start + 1
+                else:
+                    cls._flush(parts, literal)
+                    parts.append(argument)
+
+        cls._flush(parts, literal)
+        return parts, position
+
+    @classmethod
+    def _argument(
+        cls, text: str, start: int, rule: Callable[[float], str], in_plural: bool
+    ) -> tuple[Part, int]:
+        if (name_match := cls.NAME_PATTERN.match(text, start + 1)) is None:
+            raise ValueError
+
+        name, position = name_match[1], name_match.end()
+        field = _field(name, cls._accessors(name_match[2]), name_match[3])
+
+        # {name}
+        if text.startswith("}", position):
+            return _placeholder(field, text[start : position + 1]), position + 1
+
+        # {name:spec}
+        if text.startswith(":", position):
+            end = text.find("}", position)
+
+            if end < 0 or "{" in text[position:end]:
+                raise ValueError
+
+            return _formatted(field, text[position + 1 : end], text[start : end + 1]), end + 1
+
+        # {name, plural|select, selector {branch} ...}
+        if (type_match := cls.TYPE_PATTERN.match(text, position)) is None:
+            raise ValueError
+
+        kind, position = type_match[1], type_match.end()
+        branches: dict[str, list[Part]] = {}
+
+        while (end := cls.END_PATTERN.match(text, position)) is None:
+            if (selector := cls.SELECTOR_PATTERN.match(text, position)) is None:
+                raise ValueError
+
+            branch, position = cls._parse(
+                text, selector.end(), rule, in_plural or kind == "plural", nested=True
+            )
+
+            if not text.startswith("}", position):
+                raise ValueError
+
+            branches[selector[1]] = branch
+            position += 1
+
+        if "other" not in branches:
+            raise ValueError
+
+        source = text[start : end.end()]
+
+        if kind == "plural":
+            return _plural(field, branches, rule, source), end.end()
+
+        return _select(field, branches, source), end.end()
+
+    @classmethod
+    def _accessors(cls, path: str) -> list[tuple[bool, Any]]:
+        # ".name[0][key]" -> [(True, "name"), (False, 0), (False, "key")], as str.format does
+        return [
+            (True, attribute) if attribute else (False, int(item) if item.isdigit() else item)
+            for attribute, item in cls.ACCESSOR_PATTERN.findall(path)
+        ]
+
+    @classmethod
+    def _unescape(cls, text: str) -> str:
+        for entity, brace in cls.BRACE_ENTITIES.items():
+            text = text.replace(entity, brace)
+
+        return text
+
+    @staticmethod
+    def _flush(parts: list[Part], literal: list[str]) -> None:
+        if text := "".join(literal):
+            parts.append(text)
+        literal.clear()
+
+
+def _join(parts: list[Part], values: Mapping[str, Any], number: str) -> str:
+    return "".join([part if part.__class__ is str else part(values, number) for part in parts])
+
+
+def _number(values: Mapping[str, Any], number: str) -> str:
+    return number
+
+
+# The value of a field that is missing from the placeholders
+_MISSING = object()
+
+CONVERSIONS: dict[str, Callable[[Any], str]] = {"r": repr, "s": str, "a": ascii}
+
+Field = Callable[[Mapping[str, Any]], Any]
+
+
+def _field(name: str, accessors: list[tuple[bool, Any]], conversion: str | None) -> Field:
+    # Plain names (most of the placeholders) skip the accessors
+    if not accessors and conversion is None:
+        return lambda values: values.get(name, _MISSING)
+
+    convert = CONVERSIONS.get(conversion)
+
+    def field(values: Mapping[str, Any]) -> Any:
+        if (value := values.get(name, _MISSING)) is _MISSING:
+            return _MISSING
+
+        try:
+            for is_attribute, key in accessors:
+                value = getattr(value, key) if is_attribute else value[key]
+        except (AttributeError, LookupError, TypeError):
+            return _MISSING
+
+        return convert(value) if convert else value
+
+    return field
+
+
+def _placeholder(field: Field, source: str) -> Part:
+    def placeholder(values: Mapping[str, Any], number: str) -> str:
+        return source if (value := field(values)) is _MISSING else str(value)
+
+    return placeholder
+
+
+def _formatted(field: Field, spec: str, source: str) -> Part:
+    def formatted(values: Mapping[str, Any], number: str) -> str:
+        return source if (value := field(values)) is _MISSING else format(value, spec)
+
+    return formatted
+
+
+def _plural(
+    field: Field, branches: dict[str, list[Part]], rule: Callable[[float], str], source: str
+) -> Part:
+    exact = {float(key[1:]): branch for key, branch in branches.items() if key[0] == "="}
+    other = branches["other"]
+
+    def plural(values: Mapping[str, Any], number: str) -> str:
+        if (value := field(values)) is _MISSING:
+            return source
+
+        try:
+            amount = float(value)
+        except (TypeError, ValueError):
+            return _join(other, values, str(value))
+
+        if (branch := exact.get(amount)) is None:
+            branch = branches.get(rule(amount), other)
+
+        return _join(branch, values, str(value))
+
+    return plural
+
+
+def _select(field: Field, branches: dict[str, list[Part]], source: str) -> Part:
+    other = branches["other"]
+
+    def select(values: Mapping[str, Any], number: str) -> str:
+        if (value := field(values)) is _MISSING:
+            return source
+
+        return _join(branches.get(str(value), other), values, number)
+
+    return select
@@ -1,7 +1,7 @@
 # Copyright (C) 2025-2026 J. F. Escobar
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import Any
 
 # Fluvel
@@ -9,7 +9,8 @@ from fluvel.i18n.data_structures import I18nRawContent
 
 
 class I18nProvider:
-    texts: dict[str, str] = {}
+    language: str | None = None
+    texts: Mapping[str, str] = {}
     menus: dict[str, str] = {}
     raw_menus: dict[str, dict[str, Any]] = {}
 
@@ -17,9 +18,10 @@ class I18nProvider:
     get_menu: Callable[[str, str], str] = None
 
     @classmethod
-    def save_content(cls, raw: I18nRawContent) -> None:
+    def save_content(cls, raw: I18nRawContent, language: str | None = None) -> None:
+        cls.language = language
         cls.texts = raw.TEXTS
-        cls.menus = cls._flatten_menus(raw.MENUS)
+        cls.menus = raw.MENU_TEXTS if raw.MENU_TEXTS is not None else cls._flatten_menus(raw.MENUS)
         cls.raw_menus = raw.MENUS
 
         cls.get_text = cls.texts.get
@@ -0,0 +1,207 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import TYPE_CHECKING, Any
+from weakref import WeakSet, WeakValueDictionary
+
+# PySide6
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QWidget
+
+if TYPE_CHECKING:
+    from fluvel.i18n.I18nTextVar import I18nBaseTextBar
+
+# (id of the widget, name of the setter)
+Binding = tuple[int, str]
+
+
+class I18nTextRegistry:
+    """
+    Interns the text vars returned by ``er(...)`` and ``er[...]``, and refreshes them
+    when the language changes.
+
+    Calls with the same ID and placeholders share a single text var, which keeps the
+    setters of the widgets that display it. The bindings are its reference count: the
+    var is released when its last widget is destroyed. Vars that are never bound are
+    tracked weakly, so they are freed once the application no longer references them.
+
+    A language change is dispatched by one loop over the unique text vars: each text
+    is formatted once and passed to the setters of its widgets. The widgets of the
+    pages excluded with :meth:`defer` are updated when the page is flushed (see
+    :meth:`~fluvel.core.Router.Router.show`), and the vars with no visible widget (nor
+    ``valueChanged`` listener) are only marked as stale, to be formatted when read.
+    """
+
+    _interned: "WeakValueDictionary[tuple, I18nBaseTextBar]" = WeakValueDictionary()
+
+    # Every text var, including the ones with unhashable placeholders
+    _vars: "WeakSet[I18nBaseTextBar]" = WeakSet()
+
+    _hidden: list[QWidget] = []
+
+    # {id of the page: {binding: (setter, text var)}}, dropped with the page
+    _pending: dict[int, dict[Binding, tuple[Callable[[str], None], "I18nBaseTextBar"]]] = {}
+    _watched: set[int] = set()
+
+    @classmethod
+    def intern(
+        cls, var_class: type["I18nBaseTextBar"], id: str, placeholders: dict[str, Any]
+    ) -> "I18nBaseTextBar":
+        """
+        Returns the text var of ``id`` with ``placeholders``, creating it if needed.
+
+        Placeholders with unhashable values (e.g., lists) get a text var of their own.
+
+        :rtype: :class:`~fluvel.i18n.I18nTextVar.I18nBaseTextBar`
+        """
+        key = cls._key(var_class, id, placeholders)
+
+        if key is not None and (text_var := cls._interned.get(key)) is not None:
+            return text_var
+
+        text_var = var_class(id, placeholders)
+        cls._vars.add(text_var)
+
+        if key is not None:
+            text_var.key = key
+            cls._interned[key] = text_var
+
+        return text_var
+
+    @classmethod
+    def rekey(cls, text_var: "I18nBaseTextBar", placeholders: dict[str, Any]) -> None:
+        """
+        Interns a text var with its new placeholders (see ``replace()``). If another
+        var already has them, the var is no longer interned.
+        """
+        cls._forget(text_var)
+
+        key = cls._key(text_var.__class__, text_var._id, placeholders)
+
+        if key is not None and key not in cls._interned:
+            text_var.key = key
+            cls._interned[key] = text_var
+
+    @classmethod
+    def bind(cls, text_var: "I18nBaseTextBar", widget: QObject, method: str) -> str:
+        """
+        Displays the text var in ``widget`` through its setter ``method`` (e.g.,
+        ``"setText"``) and returns the current text.
+
+        :rtype: str
+        """
+        binding = (id(widget), method)
+        text_var._bindings[binding] = getattr(widget, method)
+
+        # A released var can be bound again
+        cls._vars.add(text_var)
+
+        # The connection keeps the var alive while the widget exists
+        widget.destroyed.connect(partial(cls._release, text_var, binding))
+
+        return text_var.value
+
+    @classmethod
+    def defer(cls, pages: Iterable[QWidget]) -> None:
+        """
+        Excludes the widgets of ``pages`` from the next :meth:`refresh`.
+
+        :param pages: The pages that are not visible.
+        :type pages: Iterable[:class:`~PySide6.QtWidgets.QWidget`]
+        """
+        cls._hidden = list(pages)
+
+    @classmethod
+    def refresh(cls) -> None:
+        """
+        Refreshes the text vars with the texts of the current language.
+        """
+        hidden: dict[int, QWidget] = {}
+
+        for page in cls._hidden:
+            hidden[id(page)] = page
+
+            for child in page.findChildren(QWidget):
+                hidden[id(child)] = page
+
+        cls._hidden = []
+
+        for text_var in list(cls._vars):
+            setters = []
+
+            for binding, setter in text_var._bindings.items():
+                if (page := hidden.get(binding[0])) is None:
+                    setters.append(setter)
+                else:
+                    cls._defer_binding(page, binding, setter, text_var)
+
+            # Nothing displays the text now, it is formatted when it is read
+            if not setters and not text_var.has_listeners():
+                text_var.stale = True
+                continue
+
+            text_var.evaluate()
+            value = text_var.value
+            text_var.valueChanged.emit(value)
+
+            for setter in setters:
+                setter(value)
+
+    @classmethod
+    def flush(cls, page: QWidget) -> None:
+        """
+        Applies the texts deferred for ``page``.
+        """
+        for binding, (setter, text_var) in cls._pending.pop(id(page), {}).items():
+            # The widget may have been destroyed (or bound again) since then
+            if text_var._bindings.get(binding) is setter:
+                setter(text_var.value)
+
+    @classmethod
+    def _defer_binding(
+        cls,
+        page: QWidget,
+        binding: Binding,
+        setter: Callable[[str], None],
+        text_var: "I18nBaseTextBar",
+    ) -> None:
+        key = id(page)
+        cls._pending.setdefault(key, {})[binding] = (setter, text_var)
+
+        # The deferred texts are dropped if the page is destroyed before being shown
+        if key not in cls._watched:
+            cls._watched.add(key)
+            page.destroyed.connect(partial(cls._drop_page, key))
+
+    @classmethod
+    def _drop_page(cls, key: int, *_) -> None:
+        cls._pending.pop(key, None)
+        cls._watched.discard(key)
+
+    @classmethod
+    def _release(cls, text_var: "I18nBaseTextBar", binding: Binding, *_) -> None:
+        text_var._bindings.pop(binding, None)
+
+        if text_var._bindings:
+            return
+
+        # Its last widget was destroyed, the var is freed once it is no longer referenced
+        cls._forget(text_var)
+        cls._vars.discard(text_var)
+
+    @classmethod
+    def _forget(cls, text_var: "I18nBaseTextBar") -> None:
+        # Removes the var from the interned ones
+        if text_var.key is not None and cls._interned.get(text_var.key) is text_var:
+            del cls._interned[text_var.key]
+
+        text_var.key = None
+
+    @staticmethod
+    def _key(var_class: type, id: str, placeholders: dict[str, Any]) -> tuple | None:
+        try:
+            return (var_class, id, frozenset(placeholders.items()))
+        except TypeError:
+            return None
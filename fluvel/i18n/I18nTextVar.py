@@ -1,13 +1,16 @@
 # Copyright (C) 2025-2026 J. F. Escobar
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from collections.abc import Callable
 from typing import Any
 
 # PySide6
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QMetaMethod, QObject, Signal
 
 # Fluvel I18n
+from fluvel.i18n.I18nMessage import I18nMessage
 from fluvel.i18n.I18nProvider import I18nProvider
+from fluvel.i18n.I18nTextRegistry import I18nTextRegistry
 
 
 class I18nBaseTextBar(QObject):
@@ -17,18 +20,55 @@ class I18nBaseTextBar(QObject):
         super().__init__()
         self._id = id
         self._placeholders = placeholders
-        self.refresh()
+        self.key: tuple | None = None
+
+        # Setters of the widgets that display the var (see I18nTextRegistry.bind)
+        self._bindings: dict[tuple[int, str], Callable[[str], None]] = {}
+
+        # True if a language change was not applied yet (see I18nTextRegistry.refresh)
+        self.stale: bool = False
+
+        self.evaluate()
+
+    @property
+    def value(self) -> str:
+        if self.stale:
+            self.evaluate()
+
+        return self._value
+
+    def evaluate(self) -> None:
+        # The text is compiled once per language, placeholder updates only format it
+        self._message = I18nMessage.compile(self.get_by_id(), I18nProvider.language)
+        self._value = self._message.format(self._placeholders or {})
+        self.stale = False
+
+    def has_listeners(self) -> bool:
+        return self.isSignalConnected(QMetaMethod.fromSignal(self.valueChanged))
 
     def refresh(self) -> None:
-        new_value = self.get_by_id()
-        if self._placeholders:
-            new_value = new_value.format_map(self._placeholders)
-        self.value = new_value
-        self.valueChanged.emit(new_value)
+        self.evaluate()
+        self._update()
 
     def replace(self, **placeholders) -> None:
+        # The var is interned again with its new placeholders
+        I18nTextRegistry.rekey(self, placeholders)
+
         self._placeholders = placeholders
-        self.refresh()
+
+        if self.stale:
+            self.evaluate()
+        else:
+            self._value = self._message.format(placeholders)
+
+        self._update()
+
+    def _update(self) -> None:
+        value = self._value
+        self.valueChanged.emit(value)
+
+        for setter in self._bindings.values():
+            setter(value)
 
 
 class I18nTextVar(I18nBaseTextBar):
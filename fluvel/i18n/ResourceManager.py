@@ -1,20 +1,24 @@
 # Copyright (C) 2025-2026 J. F. Escobar
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import threading
+from collections.abc import Callable
 from functools import partial
 from typing import TYPE_CHECKING
-from collections.abc import Callable
 
 # PySide6
 from PySide6.QtCore import QObject, Signal
 
 # Fluvel Utils
-from fluvel.core.tools import load_style_sheet, load_theme
-from fluvel.i18n.data_structures import I18nSafeDict
+from fluvel.core.tools import load_file, load_style_sheet
+from fluvel.engines.qss.StyleManager import StyleManager
+from fluvel.engines.qss.ThemeCache import ThemeCache
+from fluvel.engines.qss.ThemeVariables import ThemeVariables
 
 # Fluvel I18n
 from fluvel.i18n.I18nLoader import I18nLoader
 from fluvel.i18n.I18nProvider import I18nProvider
+from fluvel.i18n.I18nTextRegistry import I18nTextRegistry
 from fluvel.i18n.I18nTextVar import I18nMenuTextVar, I18nTextVar
 from fluvel.user.UserSettings import Settings
 from fluvel.utils.paths import PROD_THEMES_DIR, THEMES_DIR
@@ -32,6 +36,7 @@ class ResourceManager:
 
     def __init__(self):
         self.lang_emitter = LanguageEmitter()
+        self._prepared_themes: dict[str, tuple[str, dict[str, str]]] = {}
 
     def _load_static(self, lang: str):
         """
@@ -47,31 +52,92 @@ class ResourceManager:
         raw = I18nLoader.load(lang, Settings.get("fluvel.production", False))
 
         if raw:
-            I18nProvider.save_content(raw)
+            I18nProvider.save_content(raw, lang)
+
+            # One loop over the unique text vars (the hidden pages are deferred)
+            I18nTextRegistry.refresh()
             self.lang_emitter.languageChanged.emit()
 
-    @staticmethod
-    def _load_theme() -> str:
+    def _load_theme(self) -> str:
+        qss, variables = "", {}
+
         if theme := Settings.get("ui.theme"):
+            prepared = None
+
+            # Prepared themes are only reused in production (in development the
+            # ThemeCache already keeps them in memory and checks their sources)
             if Settings.get("fluvel.production", False):
-                return load_style_sheet(PROD_THEMES_DIR / f"{theme}.qss")
+                prepared = self._prepared_themes.get(theme)
 
-            return load_theme(THEMES_DIR, theme)
-        return ""
+            qss, variables = prepared or self._read_theme(theme)
+
+        # Only the inline styles that use the changed variables are re-emitted
+        StyleManager.refresh(ThemeVariables.update(variables))
+
+        return qss
+
+    @staticmethod
+    def _read_theme(theme: str) -> tuple[str, dict[str, str]]:
+        """
+        Reads the resolved stylesheet and the variables of a theme (thread-safe).
+        """
+        if Settings.get("fluvel.production", False):
+            qss = load_style_sheet(PROD_THEMES_DIR / f"{theme}.qss")
+            variables = {}
+
+            if (variables_file := PROD_THEMES_DIR / f"{theme}.json").exists():
+                variables = load_file(variables_file) or {}
+
+            return qss, variables
+
+        # Unchanged themes are loaded from the compiled cache with a single read
+        if (theme_dir := THEMES_DIR / theme).is_dir():
+            compiled = ThemeCache.load(theme_dir)
+            return compiled.qss, compiled.variables
+
+        return "", {}
+
+    def prewarm_themes(self, themes: list[str]) -> None:
+        """
+        Loads and resolves the alternative themes in a background thread, so switching
+        to them doesn't need to read (or compile) anything from disk.
+
+        :param themes: The names of the themes (e.g., ``Settings["ui.prewarm_themes"]``).
+        :type themes: list[str]
+        """
+        current = Settings.get("ui.theme")
+        pending = [theme for theme in themes if theme != current]
+
+        if not pending:
+            return
+
+        def prewarm():
+            for theme in pending:
+                self._prepared_themes[theme] = self._read_theme(theme)
+
+        threading.Thread(target=prewarm, name="fluvel-theme-prewarm", daemon=True).start()
+
+    def prewarm_languages(self, languages: list[str]) -> None:
+        """
+        Loads the alternative languages in a background thread, so switching to
+        them doesn't need to read (or parse) anything from disk.
+
+        :param languages: The language codes (e.g., ``Settings["ui.prewarm_languages"]``),
+                          ``"*"`` loads every available language.
+        :type languages: list[str]
+        """
+        I18nLoader.preload(languages, Settings.get("fluvel.production", False))
 
     def __call__(self, id: str, **placeholders) -> I18nTextVar | str:
         if id in I18nProvider.texts:
-            text_var = I18nTextVar(id, I18nSafeDict(placeholders))
-            self.lang_emitter.languageChanged.connect(text_var.refresh)
-            return text_var
+            # Calls with the same ID and placeholders share the text var
+            return I18nTextRegistry.intern(I18nTextVar, id, placeholders)
 
         return ""
 
     def __getitem__(self, id: str) -> I18nMenuTextVar | str:
         if id in I18nProvider.menus:
-            menu_text_var = I18nMenuTextVar(id)
-            self.lang_emitter.languageChanged.connect(menu_text_var.refresh)
-            return menu_text_var
+            return I18nTextRegistry.intern(I18nMenuTextVar, id, {})
 
         return ""
 
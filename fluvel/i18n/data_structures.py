@@ -1,6 +1,7 @@
 # Copyright (C) 2025-2026 J. F. Escobar
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -8,9 +9,54 @@ from typing import Any
 @dataclass(slots=True, frozen=True)
 class I18nRawContent:
     MENUS: dict[str, dict[str, Any]]
-    TEXTS: dict[str, str]
+    TEXTS: Mapping[str, str]
+    # The {id: text} map of the menu items, if it was built with the structure
+    MENU_TEXTS: dict[str, str] | None = None
 
 
-class I18nSafeDict(dict):
-    def __missing__(self, key: str) -> str:
-        return f"{{{key}}}"
+class I18nLazyCatalog(Mapping[str, str]):
+    """
+    Text catalog that keeps the raw content of each block and renders it
+    on its first access, memoizing the result.
+
+    Loading a language only indexes the blocks, so its cost depends on the number
+    of keys instead of the amount of markup, and the texts that are never shown
+    are never rendered.
+
+    :param raw: The raw content of each block ID.
+    :type raw: dict[str, str]
+    :param render: The function that renders a raw block (e.g., :meth:`FlumlParser.render`).
+    :type render: Callable[[str], str]
+    """
+
+    __slots__ = ("_raw", "_rendered", "_render")
+
+    def __init__(self, raw: dict[str, str], render: Callable[[str], str]) -> None:
+        self._raw = raw
+        self._rendered: dict[str, str] = {}
+        self._render = render
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self._rendered[key]
+        except KeyError:
+            if (raw := self._raw.get(key)) is None:
+                return default
+
+            text = self._rendered[key] = self._render(raw)
+            return text
+
+    def __getitem__(self, key: str) -> str:
+        if (text := self.get(key)) is None:
+            raise KeyError(key)
+
+        return text
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
@@ -0,0 +1,198 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+from time import perf_counter_ns
+from typing import Any
+
+# PySide6
+from PySide6.QtWidgets import QWidget
+
+_UNSET = object()
+
+
+@dataclass(slots=True)
+class BindingStats:
+    """
+    Counters collected for a single binding while the inspector is enabled.
+
+    Times are accumulated in nanoseconds.
+    """
+
+    bind_string: str
+    widget_name: str
+    prop_name: str
+
+    updates: int = 0
+    """Number of 'Model -> View' updates applied to the widget."""
+
+    redundant: int = 0
+    """Updates that wrote the same value the binding had already written."""
+
+    transform_ns: int = 0
+    """Time spent in the filter/template of the binding."""
+
+    setter_ns: int = 0
+    """Time spent writing the property into the widget."""
+
+    model_writes: int = 0
+    """Number of 'View -> Model' values received from the widget signal."""
+
+    last_value: Any = field(default=_UNSET, repr=False)
+
+    @property
+    def total_ns(self) -> int:
+        return self.transform_ns + self.setter_ns
+
+    @property
+    def redundant_ratio(self) -> float:
+        return self.redundant / self.updates if self.updates else 0.0
+
+
+class BindingInspector:
+    """
+    Static debug class that records how often each binding fires
+    and how much of its work is wasted.
+
+    Instrumentation is decided **when the binding is created**: bindings made while the
+    inspector is disabled run the regular slots with no overhead at all. For that reason,
+    it must be enabled before the views are built.
+
+    .. code-block:: python
+
+        from fluvel.reactive import BindingInspector
+
+        BindingInspector.enable()
+        ...
+        BindingInspector.dump(limit=10)
+
+    It can also be enabled from the CLI with ``fluvel run --inspect-bindings``, the report
+    is printed when the application quits.
+    """
+
+    enabled: bool = False
+
+    # Keyed by the id of the counters, they are removed when their widget is destroyed
+    _stats: dict[int, BindingStats] = {}
+
+    @classmethod
+    def enable(cls) -> None:
+        """
+        Enables the instrumentation of the bindings created from now on.
+        """
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Disables the instrumentation of new bindings (existing ones keep their counters).
+        """
+        cls.enabled = False
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Clears the counters of every instrumented binding.
+        """
+        for stats in cls._stats.values():
+            stats.updates = stats.redundant = stats.model_writes = 0
+            stats.transform_ns = stats.setter_ns = 0
+
+    @classmethod
+    def register(cls, widget: QWidget, bind_string: str, prop_name: str) -> BindingStats:
+        """
+        Creates the counters of a new binding, they are discarded with the widget.
+
+        :param widget: The bound widget.
+        :type widget: :class:`~PySide6.QtWidgets.QWidget`
+        :param bind_string: The original binding string (e.g., ``"text:@um.name"``).
+        :type bind_string: str
+        :param prop_name: The widget property updated by the binding.
+        :type prop_name: str
+        :rtype: :class:`BindingStats`
+        """
+        stats = BindingStats(bind_string, widget.objectName() or type(widget).__name__, prop_name)
+        cls._stats[id(stats)] = stats
+
+        widget.destroyed.connect(partial(cls._forget, id(stats)))
+
+        return stats
+
+    @classmethod
+    def _forget(cls, key: int, *_) -> None:
+        cls._stats.pop(key, None)
+
+    @staticmethod
+    def instrument(
+        stats: BindingStats, widget: QWidget, prop_name: str, transform: Callable[[Any], Any]
+    ) -> Callable[[Any], None]:
+        """
+        Returns the 'Model -> View' setter of a binding wrapped with timers and counters.
+
+        :rtype: :class:`~typing.Callable`
+        """
+
+        def apply(value):
+            start = perf_counter_ns()
+            output = transform(value)
+            transformed = perf_counter_ns()
+
+            widget[prop_name] = output
+
+            stats.setter_ns += perf_counter_ns() - transformed
+            stats.transform_ns += transformed - start
+            stats.updates += 1
+
+            if output == stats.last_value:
+                stats.redundant += 1
+
+            stats.last_value = output
+
+        return apply
+
+    @classmethod
+    def report(cls, sort_by: str = "total_ns", limit: int | None = None) -> list[BindingStats]:
+        """
+        Returns the instrumented bindings, the hottest first.
+
+        :param sort_by: The :class:`BindingStats` attribute used to sort (e.g., ``"updates"``).
+        :type sort_by: str
+        :param limit: Maximum number of bindings to return.
+        :type limit: int | None
+        :rtype: list[:class:`BindingStats`]
+        """
+        stats = sorted(cls._stats.values(), key=lambda s: getattr(s, sort_by), reverse=True)
+        return stats[:limit]
+
+    @classmethod
+    def format_report(cls, sort_by: str = "total_ns", limit: int | None = 20) -> str:
+        """
+        Renders :meth:`report` as a plain text table.
+
+        :rtype: str
+        """
+        header = (
+            f"{'Binding':<40} {'Widget':<24} {'Updates':>8} {'Redundant':>10} "
+            f"{'Transform':>11} {'Setter':>11} {'Writes':>7}"
+        )
+        lines = [header, "─" * len(header)]
+
+        for s in cls.report(sort_by, limit):
+            lines.append(
+                f"{s.bind_string[:40]:<40} {s.widget_name[:24]:<24} {s.updates:>8} "
+                f"{s.redundant:>10} {s.transform_ns / 1e6:>9.2f}ms "
+                f"{s.setter_ns / 1e6:>9.2f}ms {s.model_writes:>7}"
+            )
+
+        lines.append(f"{len(cls._stats)} instrumented bindings.")
+
+        return "\n".join(lines)
+
+    @classmethod
+    def dump(cls, sort_by: str = "total_ns", limit: int | None = 20) -> None:
+        """
+        Prints :meth:`format_report` to the console.
+        """
+        print(cls.format_report(sort_by, limit))
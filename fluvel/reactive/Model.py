@@ -54,6 +54,16 @@ class ModelEmitter(QObject):
 class Model(Origin, is_base=True):
     ref: str
 
+    __frame_sync__: bool = False
+
+    def __init_subclass__(cls, frame_sync: bool | None = None, **kwargs):
+        # Opt-in: every binding of this model is applied
+        # once per display frame through the RenderScheduler
+        if frame_sync is not None:
+            cls.__frame_sync__ = frame_sync
+
+        super().__init_subclass__(**kwargs)
+
     def __awake__(self):
         self.qt_emitter = ModelEmitter()
         ModelStore.add_model(self, self.__ref__)
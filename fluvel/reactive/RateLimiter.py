@@ -0,0 +1,111 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from collections.abc import Callable
+from typing import Any
+
+# PySide6
+from PySide6.QtCore import QObject, QTimer
+
+
+class RateLimiter(QObject):
+    """
+    Base class for the rate-limit modifiers of the binding syntax
+    (``|debounce(ms)`` and ``|throttle(ms)``).
+
+    Each binding owns **one** reusable single-shot :class:`~PySide6.QtCore.QTimer`
+    that is restarted as values arrive, instead of creating a timer per event.
+    The limiter is parented to the bound widget, so it is destroyed with it.
+
+    :param callback: The function that finally propagates the value.
+    :type callback: :class:`~typing.Callable`
+    :param interval: The rate-limit window in milliseconds.
+    :type interval: int
+    :param parent: The owner of the limiter (usually the bound widget).
+    :type parent: :class:`~PySide6.QtCore.QObject`
+    """
+
+    def __init__(self, callback: Callable[[Any], None], interval: int, parent: QObject) -> None:
+        super().__init__(parent)
+
+        self._callback = callback
+        self._value: Any = None
+        self._pending: bool = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._on_timeout)
+
+    @classmethod
+    def create(
+        cls, kind: str, interval: int, callback: Callable[[Any], None], parent: QObject
+    ) -> "RateLimiter":
+        """
+        Instantiates the rate limiter registered for ``kind`` (e.g., ``"debounce"``).
+        """
+        return RATE_LIMITERS[kind](callback, interval, parent)
+
+    def push(self, value: Any) -> None:
+        """
+        Receives a new value of the binding (implemented by each rate limiter).
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """
+        Propagates the pending value immediately (if any) and stops the timer.
+        """
+        self._timer.stop()
+        self._emit_pending()
+
+    def _emit_pending(self) -> None:
+        if self._pending:
+            self._pending = False
+            self._callback(self._value)
+
+    def _on_timeout(self) -> None:
+        self._emit_pending()
+
+
+class Debouncer(RateLimiter):
+    """
+    Propagates only the last value received once no new values
+    have arrived during the whole interval.
+    """
+
+    def push(self, value: Any) -> None:
+        self._value = value
+        self._pending = True
+
+        # Restart the same timer on every new value
+        self._timer.start()
+
+
+class Throttler(RateLimiter):
+    """
+    Propagates the first value immediately and then, at most,
+    one value (the latest) per interval.
+    """
+
+    def push(self, value: Any) -> None:
+        if self._timer.isActive():
+            self._value = value
+            self._pending = True
+            return
+
+        self._callback(value)
+        self._timer.start()
+
+    def _on_timeout(self) -> None:
+        if self._pending:
+            self._emit_pending()
+
+            # A new window starts after the trailing value
+            self._timer.start()
+
+
+RATE_LIMITERS: dict[str, type[RateLimiter]] = {
+    "debounce": Debouncer,
+    "throttle": Throttler,
+}
@@ -0,0 +1,118 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from collections.abc import Callable
+from typing import Any
+
+# PySide6
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QWidget
+from shiboken6 import isValid
+
+# Fluvel
+from fluvel.user.UserSettings import Settings
+
+
+class RenderScheduler:
+    """
+    Static Core class that coalesces *Model -> View* updates into display frames.
+
+    High-frequency models (sensor feeds, progress streams, etc.) can change
+    hundreds of times between two screen refreshes. Instead of writing every
+    value into the widget, frame-synchronized bindings push their updates here.
+    Only the **latest** value per ``(widget, property)`` is kept, and all pending
+    updates are applied together once per frame.
+
+    The frame budget (in milliseconds) is read from ``config.toml``:
+
+    .. code-block:: toml
+
+        [fluvel]
+        frame_budget = 16 # ~60 FPS
+
+    Frame synchronization is opt-in, either for every binding of a model
+    (``class Sensor(Model, frame_sync=True)``) or for a single binding
+    (``bind="@sensor.value|frame"``).
+    """
+
+    DEFAULT_FRAME_BUDGET: int = 16
+    """Frame budget (ms) used when ``fluvel.frame_budget`` is not configured."""
+
+    _pending: dict[tuple[int, str], tuple[QWidget, Callable[[Any], None], Any]] = {}
+    _timer: QTimer | None = None
+
+    @classmethod
+    def schedule(
+        cls, widget: QWidget, prop_name: str, apply: Callable[[Any], None], value: Any
+    ) -> None:
+        """
+        Registers a pending update for the next frame.
+
+        If the same ``(widget, property)`` pair is scheduled more than once within
+        a frame, the previous value is discarded and only the last one is applied.
+
+        :param widget: The widget whose property will be updated.
+        :type widget: :class:`~PySide6.QtWidgets.QWidget`
+        :param prop_name: The name of the property to update (e.g., 'text', 'value').
+        :type prop_name: str
+        :param apply: The callable that transforms and writes the value into the widget.
+        :type apply: :class:`~typing.Callable`
+        :param value: The raw value emitted by the model.
+        :type value: Any
+        :rtype: None
+        """
+        cls._pending[(id(widget), prop_name)] = (widget, apply, value)
+
+        timer = cls._timer or cls._create_timer()
+
+        if not timer.isActive():
+            timer.start()
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Applies every pending update immediately.
+
+        This is called automatically at the end of each frame, but it can also
+        be invoked manually when the UI must reflect the model synchronously
+        (e.g., before taking a screenshot or closing a dialog).
+
+        :rtype: None
+        """
+        pending, cls._pending = cls._pending, {}
+
+        for widget, apply, value in pending.values():
+            # The widget may have been destroyed between
+            # the schedule and the frame (e.g., Hot Reload)
+            if isValid(widget):
+                apply(value)
+
+    @classmethod
+    def set_frame_budget(cls, milliseconds: int) -> None:
+        """
+        Changes the frame budget at runtime.
+
+        :param milliseconds: The interval between two flushes (e.g., ``16`` for ~60 FPS).
+        :type milliseconds: int
+        :rtype: None
+        """
+        if milliseconds < 0:
+            raise ValueError(f"The frame budget must be a positive integer, got '{milliseconds}'.")
+
+        Settings.set("fluvel.frame_budget", milliseconds)
+
+        if cls._timer is not None:
+            cls._timer.setInterval(milliseconds)
+
+    @classmethod
+    def _create_timer(cls) -> QTimer:
+        # A single reusable timer for the whole application.
+        # It is created lazily because a QApplication must exist first.
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.setTimerType(Qt.TimerType.PreciseTimer)
+        timer.setInterval(Settings.get("fluvel.frame_budget", cls.DEFAULT_FRAME_BUDGET))
+        timer.timeout.connect(cls.flush)
+
+        cls._timer = timer
+        return timer
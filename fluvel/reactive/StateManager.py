@@ -1,9 +1,11 @@
 # Copyright (C) 2025-2026 J. F. Escobar
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import operator
 import re
 from collections.abc import Callable
 from re import Pattern
+from typing import Any
 
 from PySide6.QtCore import Slot
 
@@ -15,6 +17,11 @@ from fluvel.core.exceptions.state_manager import FluvelBindingError, FluvelState
 
 # Fluvel
 from fluvel.reactive import Model, ModelStore
+from fluvel.reactive.BindingInspector import BindingInspector, BindingStats
+from fluvel.reactive.pyro.Origin import PyroCollection
+from fluvel.reactive.RateLimiter import RateLimiter
+from fluvel.reactive.RenderScheduler import RenderScheduler
+from fluvel.utils.cache_registry import CacheRegistry
 
 
 class Formatter:
@@ -98,6 +105,123 @@ class Formatter:
         raise FluvelBindingError(f"Unknown formatter filter: '{filter_name}'")
 
 
+class BindingPath:
+    """
+    Compiled accessor for the deep path of a binding (``.address.city``, ``[3].name``).
+
+    The path is parsed **once** into a tuple of getters, so resolving it on every
+    model update is a plain loop of item/attribute accesses, without string splitting.
+    Missing keys, indexes or attributes resolve to ``None``.
+
+    Instances are cached per path string, use :meth:`compile` to create them.
+    """
+
+    STEP_PATTERN: Pattern[str] = re.compile(r"\.(?P<attr>\w+)|\[(?P<item>[^\]]+)\]")
+    """
+    RegEx to split a deep path into steps.
+    Example: .items[3].name
+    Capture: <items> (attr), <3> (item) and <name> (attr).
+    """
+
+    _MISSING = (KeyError, IndexError, TypeError, AttributeError)
+
+    # Types whose equality means "nothing changed". Mutable leaves
+    # (list, dict, set) are always propagated because they may be mutated in place.
+    IMMUTABLE_TYPES: frozenset[type] = frozenset(
+        {str, int, float, bool, complex, bytes, tuple, frozenset, type(None)}
+    )
+
+    __slots__ = ("path", "steps", "_getters")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.steps: tuple[tuple[bool, Any], ...] = tuple(self._parse(path))
+        self._getters: tuple[Callable[[Any], Any], ...] = tuple(
+            operator.itemgetter(step) if is_item else self._attr_getter(step)
+            for is_item, step in self.steps
+        )
+
+    @classmethod
+    @CacheRegistry.lru("binding_paths", maxsize=256)
+    def compile(cls, path: str) -> "BindingPath":
+        """
+        Returns the compiled accessor for ``path`` (cached per path string).
+        """
+        return cls(path)
+
+    @classmethod
+    def _parse(cls, path: str):
+        position = 0
+
+        for _match in cls.STEP_PATTERN.finditer(path):
+            if _match.start() != position:
+                break
+
+            position = _match.end()
+
+            if attr := _match.group("attr"):
+                yield False, attr
+                continue
+
+            item = _match.group("item").strip()
+
+            if item.lstrip("-").isdigit():
+                yield True, int(item)
+            else:
+                yield True, item.strip("'\"")
+
+        if position != len(path):
+            raise FluvelBindingError(f"Invalid binding path: '{path}'.")
+
+    @staticmethod
+    def _attr_getter(name: str) -> Callable[[Any], Any]:
+        # Like 'rgetattr', dictionaries are accessed by key and objects by attribute
+        def getter(obj):
+            if isinstance(obj, dict):
+                return obj[name]
+            return getattr(obj, name)
+
+        return getter
+
+    def get(self, root: Any) -> Any:
+        """
+        Resolves the path starting from the value of the root atom.
+        """
+        try:
+            for getter in self._getters:
+                root = getter(root)
+            return root
+        except self._MISSING:
+            return None
+
+    def set(self, model: Model, key: str, value: Any) -> None:
+        """
+        Writes ``value`` at the end of the path and notifies the root atom ``key``.
+        """
+        root = getattr(model, key)
+        container = root
+
+        try:
+            for getter in self._getters[:-1]:
+                container = getter(container)
+        except self._MISSING:
+            raise FluvelStateError(
+                f"The path '{key}{self.path}' of the model '@{model.__ref__}' does not exist."
+            ) from None
+
+        is_item, step = self.steps[-1]
+
+        if is_item or isinstance(container, dict):
+            container[step] = value
+        else:
+            setattr(container, step, value)
+
+        # Reactive collections notify their own mutations (only root atoms are wrapped),
+        # nested plain containers need an explicit notification of the root atom
+        if not isinstance(container, PyroCollection):
+            model.notify(key, root)
+
+
 class StateManager:
     """
     Static Core class that manages the binding
@@ -116,6 +240,8 @@ class StateManager:
         @(?P<ref>[\w]+)              # Model ref (@vm)
         \.                           # Dot separator
         (?P<key>[\w]+)               # Model key (volume)
+        (?P<path>(?:\.\w+|\[[^\]]+\])*) # Optional deep path (.address.city or [3].name)
+        (?P<modifiers>(?:\|\w+(?:\([^)]*\))?)*) # Optional modifiers (|frame, |debounce(250))
         (?P<formatter>.*?)?          # Optional formatter
         $                            
         """,
@@ -125,7 +251,7 @@ class StateManager:
     Regular expression for analyzing Fluvel *binding* syntax.
     
     **Expected Format**
-        [widget_property][:widget_signal]:@model_alias.status_key
+        [widget_property][:widget_signal]:@model_alias.status_key[.deep.path]
 
     **Examples**
     * ``@testmodel.username`` (**Level 1**: Default unidirectional/bidirectional binding. Depends on the Widget)
@@ -133,9 +259,31 @@ class StateManager:
     * ``text:textChanged:@testmodel.username`` (**Level 3**: Explicit Bidirectional binding 'Model <-> View')
     * ``~text:textChanged:@testmodel.username`` (**Level 4**: Inverted unidirectional binding 'View -> Model')
 
+    **Deep Paths**
+    * ``@um.user.address.city`` (Nested attribute or dictionary key)
+    * ``@um.items[3].name`` (Collection index)
+
+    **Modifiers**
+    * ``@sensor.value|frame`` (Model -> View updates are applied once per display frame)
+    * ``@search.query|debounce(250)`` (Propagates the last value after 250 ms without changes)
+    * ``@slider.value|throttle(16)`` (Propagates, at most, one value every 16 ms)
+
     :type: :class:`~typing.Pattern`
     """
 
+    MODIFIER_PATTERN: Pattern[str] = re.compile(r"\|(?P<name>\w+)(?:\((?P<arg>[^)]*)\))?")
+    """
+    RegEx to split the modifiers suffix of a binding.
+    Example: |debounce(250)
+    Capture: <frame> in the 'name' group and the optional parenthesized value in the 'arg' group.
+    """
+
+    MODIFIERS: frozenset[str] = frozenset({"frame", "debounce", "throttle"})
+    """Names of the modifiers accepted in the binding syntax."""
+
+    RATE_LIMIT_MODIFIERS: frozenset[str] = frozenset({"debounce", "throttle"})
+    """Modifiers that require an interval in milliseconds (e.g., ``|throttle(16)``)."""
+
     @classmethod
     def bind(cls, widget: QWidget, bind_string: str) -> None:
         """
@@ -155,7 +303,6 @@ class StateManager:
         """
 
         _match = cls.BIND_PATTERN.match(bind_string)
-        parsed_binding = _match.groupdict()
 
         if not _match:
             raise FluvelBindingError(
@@ -164,17 +311,45 @@ class StateManager:
                 "Ex: '@vm.volume' or 'text:@h.username' or 'value:rangeChanged:@global.theme'."
             )
 
+        parsed_binding = _match.groupdict()
+
         ref = parsed_binding.get("ref")
         key = parsed_binding.get("key")
         model = ModelStore.get_model(ref)
 
         filter_fn, template = cls.decode_formatter(parsed_binding)
         prop_name, signal_name, to_model_only = cls.decode_level(parsed_binding, widget)
+        path = BindingPath.compile(p) if (p := parsed_binding["path"]) else None
+
+        # Debug instrumentation is decided here, so regular bindings have no overhead
+        stats = (
+            BindingInspector.register(widget, bind_string, prop_name)
+            if BindingInspector.enabled
+            else None
+        )
+        modifiers = cls.decode_modifiers(parsed_binding)
+        rate_limit = cls.decode_rate_limit(modifiers)
+
+        # Frame synchronization can be requested by the model or by the binding itself
+        frame_sync = type(model).__frame_sync__ or "frame" in modifiers
 
         # Only use one-way binding if it's not a level 4 binding
         # (where the widget isn't required to listen to the model, but rather the other way around)
         if not to_model_only:
-            cls.set_unidirectional_binding(widget, model, key, prop_name, filter_fn, template)
+            cls.set_unidirectional_binding(
+                widget,
+                model,
+                key,
+                prop_name,
+                filter_fn,
+                template,
+                frame_sync,
+                # The rate limit protects the write side of the binding:
+                # 'View -> Model' if there is a signal, otherwise 'Model -> View'
+                rate_limit if not signal_name else None,
+                path,
+                stats,
+            )
 
         # Perform bidirectional binding only if signal_name is provided
         if signal_name:
@@ -184,7 +359,9 @@ class StateManager:
                     "Two-way binding cannot be used (requires signal_name)."
                 )
 
-            cls.set_bidirectional_binding(widget, model, key, signal_name, prop_name)
+            cls.set_bidirectional_binding(
+                widget, model, key, signal_name, prop_name, rate_limit, path, stats
+            )
 
     @classmethod
     def decode_formatter(cls, parsed_binding: dict[str, str]) -> tuple[Callable | None, str | None]:
@@ -194,6 +371,64 @@ class StateManager:
 
         return Formatter.decode(parsed_binding["formatter"])
 
+    @classmethod
+    def decode_modifiers(cls, parsed_binding: dict[str, str]) -> dict[str, str | None]:
+        """
+        Decodes the modifiers suffix (``|name`` or ``|name(arg)``) of a binding.
+
+        :returns: A dictionary mapping each modifier name to its argument (or None).
+        :rtype: dict[str, str | None]
+        :raises FluvelBindingError: If a modifier is not supported.
+        """
+        # As with the formatter, most bindings don't have modifiers.
+        if not parsed_binding["modifiers"]:
+            return {}
+
+        modifiers = {}
+
+        for _match in cls.MODIFIER_PATTERN.finditer(parsed_binding["modifiers"]):
+            name = _match.group("name")
+
+            if name not in cls.MODIFIERS:
+                raise FluvelBindingError(
+                    f"Unknown binding modifier: '|{name}'. "
+                    f"Available modifiers: {', '.join(sorted(cls.MODIFIERS))}."
+                )
+
+            modifiers[name] = _match.group("arg")
+
+        return modifiers
+
+    @classmethod
+    def decode_rate_limit(cls, modifiers: dict[str, str | None]) -> tuple[str, int] | None:
+        """
+        Extracts the rate-limit modifier (``|debounce(ms)`` or ``|throttle(ms)``).
+
+        :returns: A tuple ``(kind, interval)`` or None if the binding isn't rate-limited.
+        :rtype: tuple[str, int] | None
+        :raises FluvelBindingError: If both modifiers are used or the interval is invalid.
+        """
+        kinds = modifiers.keys() & cls.RATE_LIMIT_MODIFIERS
+
+        if not kinds:
+            return None
+
+        if len(kinds) > 1:
+            raise FluvelBindingError(
+                "The modifiers '|debounce' and '|throttle' cannot be combined in the same binding."
+            )
+
+        kind = kinds.pop()
+        interval = (modifiers[kind] or "").strip()
+
+        if not interval.isdigit():
+            raise FluvelBindingError(
+                f"The modifier '|{kind}' requires an interval in milliseconds. "
+                f"Ex: '|{kind}(250)'."
+            )
+
+        return kind, int(interval)
+
     @classmethod
     def decode_level(
         self, parsed_binding: dict[str, str], widget: QWidget
@@ -232,6 +467,10 @@ class StateManager:
         prop_name: str,
         filter_fn: Callable | None,
         template: str | None,
+        frame_sync: bool = False,
+        rate_limit: tuple[str, int] | None = None,
+        path: BindingPath | None = None,
+        stats: BindingStats | None = None,
     ) -> None:
         """
         Establishes a unidirectional data link (Model -> View).
@@ -259,6 +498,23 @@ class StateManager:
                         The placeholder '%v' is replaced with the filtered value.
         :type template: str | None
 
+        :param frame_sync: If True, updates are deferred to the
+                           :class:`~fluvel.reactive.RenderScheduler.RenderScheduler` and only
+                           the latest value is applied once per display frame.
+        :type frame_sync: bool
+
+        :param rate_limit: A tuple ``(kind, interval)`` to debounce or throttle the updates
+                           with a reusable :class:`~fluvel.reactive.RateLimiter.RateLimiter`,
+                           or None.
+        :type rate_limit: tuple[str, int] | None
+
+        :param path: The compiled deep path inside the atom ``key``, or None. The widget is
+                     only updated when the value at the end of the path changes.
+        :type path: :class:`BindingPath` | None
+
+        :param stats: The counters of the binding if the :class:`BindingInspector` is enabled.
+        :type stats: :class:`BindingStats` | None
+
         :rtype: None
         """
 
@@ -284,20 +540,86 @@ class StateManager:
         transform = make_slot()
 
         # Inicial value
-        widget[prop_name] = transform(getattr(model, key))
+        initial_value = getattr(model, key)
+
+        if path is not None:
+            initial_value = path.get(initial_value)
+
+        widget[prop_name] = initial_output = transform(initial_value)
+
+        # The initial write is the reference of the first redundant update
+        if stats is not None:
+            stats.last_value = initial_output
 
         # Reactive Update, the unique ‘modelChanged’ signal for each model is used
-        @Slot(dict)
-        def update_widget(changes):
-            """Slot that updates the widget only if the key matches."""
-            if key in changes:
-                widget[prop_name] = transform(changes[key])
+        if frame_sync or rate_limit or path is not None or stats is not None:
+            if stats is not None:
+                apply = BindingInspector.instrument(stats, widget, prop_name, transform)
+
+            else:
+
+                def apply(value):
+                    widget[prop_name] = transform(value)
+
+            push = apply
+
+            if frame_sync:
+                schedule = RenderScheduler.schedule
+
+                def push(value):
+                    schedule(widget, prop_name, apply, value)
+
+            if rate_limit:
+                push = RateLimiter.create(*rate_limit, push, widget).push
+
+            if path is not None:
+                resolve = path.get
+                immutable_types = BindingPath.IMMUTABLE_TYPES
+                last_value = initial_value
+
+                @Slot(dict)
+                def update_widget(changes):
+                    """Slot that updates the widget only if the value of the path changed."""
+                    nonlocal last_value
+
+                    if key in changes:
+                        value = resolve(changes[key])
+
+                        if type(value) in immutable_types and value == last_value:
+                            return
+
+                        last_value = value
+                        push(value)
+
+            else:
+
+                @Slot(dict)
+                def update_widget(changes):
+                    """Slot that defers the update (frame or rate limit) only if the key matches."""
+                    if key in changes:
+                        push(changes[key])
+
+        else:
+
+            @Slot(dict)
+            def update_widget(changes):
+                """Slot that updates the widget only if the key matches."""
+                if key in changes:
+                    widget[prop_name] = transform(changes[key])
 
         model.qt_emitter.modelChanged.connect(update_widget)
 
     @classmethod
     def set_bidirectional_binding(
-        cls, widget: QWidget, model: "Model", key: str, signal_name: str, prop_name: str
+        cls,
+        widget: QWidget,
+        model: "Model",
+        key: str,
+        signal_name: str,
+        prop_name: str,
+        rate_limit: tuple[str, int] | None = None,
+        path: BindingPath | None = None,
+        stats: BindingStats | None = None,
     ):
         """
         Establishes a bidirectional data link (Widget -> Model).
@@ -327,6 +649,16 @@ class StateManager:
         :param prop_name: The name of the widget property from which the value will be read (e.g., 'text', 'value').
         :type prop_name: str
 
+        :param rate_limit: A tuple ``(kind, interval)`` to debounce or throttle the writes
+                           into the model (e.g., ``("debounce", 250)``), or None.
+        :type rate_limit: tuple[str, int] | None
+
+        :param path: The compiled deep path inside ``key`` where the value is written, or None.
+        :type path: :class:`BindingPath` | None
+
+        :param stats: The counters of the binding if the :class:`BindingInspector` is enabled.
+        :type stats: :class:`BindingStats` | None
+
         :raises FluvelStateError: If the widget does not have the specified signal.
         :rtype: None
         """
@@ -341,13 +673,37 @@ class StateManager:
 
         origin_key = f"_origin_{key}"
 
+        if path is None:
+
+            def write_model(widget_value):
+                if widget_value != getattr(model, origin_key):
+                    setattr(model, key, widget_value)
+
+        else:
+
+            def write_model(widget_value):
+                if widget_value != path.get(getattr(model, origin_key)):
+                    path.set(model, key, widget_value)
+
+        if stats is not None:
+            model_write = write_model
+
+            def write_model(widget_value):
+                stats.model_writes += 1
+                model_write(widget_value)
+
+        write = write_model
+
+        # A single reusable timer per binding, owned by the widget
+        if rate_limit:
+            write = RateLimiter.create(*rate_limit, write_model, widget).push
+
         def update_model(*args):
             if args:
                 widget_value = args[0]
             else:
                 widget_value = widget.property(prop_name)
 
-            if widget_value != getattr(model, origin_key):
-                setattr(model, key, widget_value)
+            write(widget_value)
 
         widget_signal.connect(update_model)
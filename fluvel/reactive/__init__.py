@@ -3,6 +3,9 @@
 
 from fluvel.reactive.Model import Model, ModelStore
 from fluvel.reactive.pyro.Origin import computed, reaction, effect
+from fluvel.reactive.BindingInspector import BindingInspector
+from fluvel.reactive.RateLimiter import RateLimiter
+from fluvel.reactive.RenderScheduler import RenderScheduler
 from fluvel.reactive.StateManager import StateManager
 from fluvel.reactive.pyro.rules import If, Is, Var, To, Rule
 
@@ -10,6 +13,9 @@ __all__ = [
     "Model", 
     "ModelStore", 
     "StateManager", 
+    "RenderScheduler", 
+    "RateLimiter", 
+    "BindingInspector", 
     "computed", 
     "reaction", 
     "effect", 
@@ -0,0 +1,324 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache, update_wrapper
+from typing import Any
+
+# Approximate cost of an entry in the internal linked list of functools.lru_cache
+_LRU_ENTRY_OVERHEAD = 100
+
+
+def estimate_size(obj: Any, depth: int = 3) -> int:
+    """
+    Returns an approximation of the memory (in bytes) used by ``obj`` and its contents.
+    Classes (e.g., the ``cls`` argument of cached classmethods) are shared, so they count as 0.
+    """
+    if isinstance(obj, type):
+        return 0
+
+    size = sys.getsizeof(obj)
+
+    if depth <= 0:
+        return size
+
+    if isinstance(obj, dict):
+        size += sum(
+            estimate_size(key, depth - 1) + estimate_size(value, depth - 1)
+            for key, value in obj.items()
+        )
+
+    elif isinstance(obj, list | tuple | set | frozenset):
+        size += sum(estimate_size(item, depth - 1) for item in obj)
+
+    return size
+
+
+class CachedFunction:
+    """
+    A resizable and observable replacement of :func:`functools.lru_cache`.
+
+    It keeps the C implementation of ``lru_cache`` for the lookups, while recording
+    the size of each entry when it is computed (only on misses), and accumulates
+    the statistics across :meth:`cache_clear` and :meth:`resize`.
+
+    Evictions are the entries inserted that are no longer in the cache, so calls
+    that raise (misses without an entry) are not counted.
+    """
+
+    def __init__(self, name: str, function: Callable, maxsize: int | None) -> None:
+        self.name = name
+        self.__wrapped__ = function
+
+        self._entry_bytes = 0
+        self._entries = 0
+
+        # Entries inserted in the current cache
+        self._inserts = 0
+
+        # Statistics of the previous (cleared) caches
+        self._hits = self._misses = self._evictions = 0
+        self.clears = 0
+
+        self._cached = lru_cache(maxsize=maxsize)(self._measure)
+        update_wrapper(self, function)
+
+    def __call__(self, *args, **kwargs):
+        return self._cached(*args, **kwargs)
+
+    def _measure(self, *args, **kwargs):
+        result = self.__wrapped__(*args, **kwargs)
+
+        self._entries += 1
+        self._inserts += 1
+        self._entry_bytes += estimate_size(args) + estimate_size(result) + _LRU_ENTRY_OVERHEAD
+
+        return result
+
+    @property
+    def maxsize(self) -> int | None:
+        return self._cached.cache_info().maxsize
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+    def cache_clear(self) -> None:
+        self._accumulate()
+        self.clears += 1
+        self._cached.cache_clear()
+
+    def resize(self, maxsize: int | None) -> None:
+        """
+        Replaces the cache with a new one of ``maxsize`` entries (the entries are discarded).
+        """
+        if maxsize == self.maxsize:
+            return
+
+        self._accumulate()
+        self._cached = lru_cache(maxsize=maxsize)(self._measure)
+
+    def _accumulate(self) -> None:
+        info = self._cached.cache_info()
+
+        self._hits += info.hits
+        self._misses += info.misses
+        self._evictions += self._evicted(info.currsize)
+        self._inserts = 0
+
+    def _evicted(self, currsize: int) -> int:
+        # Only the evictions remove inserted entries before a clear
+        return max(self._inserts - currsize, 0)
+
+    def stats(self) -> "CacheStats":
+        info = self._cached.cache_info()
+        average = self._entry_bytes / self._entries if self._entries else 0
+
+        return CacheStats(
+            name=self.name,
+            maxsize=info.maxsize,
+            currsize=info.currsize,
+            hits=self._hits + info.hits,
+            misses=self._misses + info.misses,
+            evictions=self._evictions + self._evicted(info.currsize),
+            memory=int(info.currsize * average),
+        )
+
+
+@dataclass(slots=True)
+class MappingCounter:
+    """
+    Counters of a dictionary cache, incremented by its owner.
+
+    Resizable mappings are bounded by their owner to ``maxsize`` entries (None is unbounded).
+    """
+
+    mapping: Mapping
+    maxsize: int | None = None
+    resizable: bool = False
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass(slots=True)
+class CacheStats:
+    name: str
+    maxsize: int | None
+    currsize: int
+    hits: int
+    misses: int
+    evictions: int
+    memory: int
+    # False if the cache is bounded by its contents (it cannot be sized in [fluvel.cache])
+    configurable: bool = True
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheRegistry:
+    """
+    Static registry of the internal caches of Fluvel.
+
+    Every cache is registered with a name, which is also its key in the
+    ``[fluvel.cache]`` section of ``config.toml``:
+
+    .. code-block:: toml
+
+        [fluvel.cache]
+        qss_parse_styles = 16384 # Apps with tens of thousands of distinct style strings
+
+    The statistics (hits, misses, evictions and estimated memory) can be printed with
+    ``fluvel run --cache-report`` or :meth:`CacheRegistry.dump`.
+    """
+
+    _functions: dict[str, CachedFunction] = {}
+    _mappings: dict[str, MappingCounter] = {}
+
+    @classmethod
+    def lru(cls, name: str, maxsize: int | None = 128) -> Callable[[Callable], CachedFunction]:
+        """
+        Decorator equivalent to ``functools.lru_cache(maxsize)`` that registers the cache.
+
+        :param name: The name of the cache (e.g., ``"qss_parse_styles"``).
+        :type name: str
+        :param maxsize: The default size, it can be overridden in ``[fluvel.cache]``.
+        :type maxsize: int | None
+        """
+
+        def decorator(function: Callable) -> CachedFunction:
+            cached = CachedFunction(name, function, maxsize)
+            cls._functions[name] = cached
+            return cached
+
+        return decorator
+
+    @classmethod
+    def register_mapping(
+        cls, name: str, mapping: Mapping, maxsize: int | None = None
+    ) -> MappingCounter:
+        """
+        Registers a dictionary cache (e.g., the imported widget classes).
+
+        Without ``maxsize``, the cache is bounded by its contents (e.g., the number of
+        classes), so it is not resizable. With ``maxsize``, the owner must discard the
+        entries over ``counter.maxsize``, which can be overridden in ``[fluvel.cache]``.
+        The owner increments the ``hits``, ``misses`` and ``evictions`` of the counter.
+
+        :rtype: :class:`MappingCounter`
+        """
+        counter = cls._mappings[name] = MappingCounter(mapping, maxsize, maxsize is not None)
+        return counter
+
+    @classmethod
+    def configure(cls, sizes: Mapping[str, int]) -> list[str]:
+        """
+        Applies the sizes of the ``[fluvel.cache]`` section.
+
+        Unknown caches, caches bounded by their contents (e.g., ``factory_stock``) and
+        sizes that are not integers are ignored, and returned as warnings.
+
+        :param sizes: ``{cache_name: maxsize}``, a negative size means unbounded.
+        :type sizes: Mapping[str, int]
+        :returns: The warnings of the entries that were not applied.
+        :rtype: list[str]
+        """
+        resizable = {name for name, counter in cls._mappings.items() if counter.resizable}
+        warnings = []
+
+        for name, maxsize in sizes.items():
+            if name not in cls._functions and name not in resizable:
+                if name in cls._mappings:
+                    warnings.append(
+                        f"The cache '{name}' is bounded by its contents, "
+                        "it cannot be sized in [fluvel.cache]."
+                    )
+                else:
+                    available = sorted(resizable.union(cls._functions))
+                    warnings.append(
+                        f"Unknown cache '{name}' in [fluvel.cache]. "
+                        f"Available caches: {', '.join(available)}."
+                    )
+                continue
+
+            if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+                warnings.append(f"The size of the cache '{name}' must be an integer.")
+                continue
+
+            maxsize = None if maxsize < 0 else maxsize
+
+            if name in cls._functions:
+                cls._functions[name].resize(maxsize)
+            else:
+                cls._mappings[name].maxsize = maxsize
+
+        return warnings
+
+    @classmethod
+    def report(cls) -> list[CacheStats]:
+        """
+        Returns the statistics of every registered cache.
+
+        :rtype: list[:class:`CacheStats`]
+        """
+        stats = [cached.stats() for cached in cls._functions.values()]
+
+        for name, counter in cls._mappings.items():
+            mapping = counter.mapping
+            stats.append(
+                CacheStats(
+                    name=name,
+                    maxsize=counter.maxsize,
+                    currsize=len(mapping),
+                    hits=counter.hits,
+                    misses=counter.misses,
+                    evictions=counter.evictions,
+                    memory=estimate_size(mapping, 1),
+                    configurable=counter.resizable,
+                )
+            )
+
+        return stats
+
+    @classmethod
+    def format_report(cls) -> str:
+        """
+        Renders :meth:`report` as a plain text table.
+
+        :rtype: str
+        """
+
+        header = (
+            f"{'Cache':<22} {'Size':>13} {'Hits':>9} {'Misses':>9} "
+            f"{'Ratio':>6} {'Evictions':>9} {'Memory':>10}"
+        )
+        lines = [header, "─" * len(header)]
+        fixed = False
+
+        for s in cls.report():
+            if not s.configurable:
+                size = f"{s.currsize} (fixed)"
+                fixed = True
+            else:
+                size = f"{s.currsize}/{'∞' if s.maxsize is None else s.maxsize}"
+
+            lines.append(
+                f"{s.name:<22} {size:>13} {s.hits:>9} {s.misses:>9} "
+                f"{s.hit_ratio:>6.0%} {s.evictions:>9} {s.memory / 1024:>8.1f}KB"
+            )
+
+        if fixed:
+            lines.append("\n(fixed) Bounded by its contents, not configurable in [fluvel.cache].")
+
+        return "\n".join(lines)
+
+    @classmethod
+    def dump(cls) -> None:
+        """
+        Prints :meth:`format_report` to the console.
+        """
+        print(cls.format_report())
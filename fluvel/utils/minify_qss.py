@@ -2,15 +2,277 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import re
+from collections.abc import Iterator
+from dataclasses import dataclass
 
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<comment>/\*.*?(?:\*/|$))                         # /* ... */
+    | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')  # "Segoe UI" or url('a b.png')
+    | (?P<space>\s+)
+    | (?P<punct>[{}:;,>()])
+    | (?P<text>[^\s{}:;,>()"'/]+|.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+"""RegEx that splits a stylesheet into tokens (comments, strings, spaces, punctuation and text)."""
 
-def minify_qss(qss: str) -> str:
+# The whitespace around these tokens is never significant
+NO_SPACE_AFTER = frozenset("{}:;,>(")
+NO_SPACE_BEFORE = frozenset("{}:;,>)")
+
+
+@dataclass(slots=True)
+class QSSRule:
+    selector: str
+    declarations: dict[str, str]
+    """``{property: "property:value"}`` in order of (last) appearance."""
+
+    @property
+    def block(self) -> str:
+        return ";".join(self.declarations.values())
+
+
+def tokenize(qss: str) -> Iterator[tuple[str, str]]:
+    """
+    Yields the ``(kind, text)`` tokens of a stylesheet.
+
+    Strings are returned verbatim, so ``url("...")`` paths and quoted font
+    names are never modified. Comments are returned as whitespace.
+    """
+    for _match in TOKEN_PATTERN.finditer(qss):
+        kind = _match.lastgroup
+
+        if kind == "comment":
+            yield "space", " "
+        else:
+            yield kind, _match.group()
+
+
+def join_tokens(tokens: list[tuple[str, str]]) -> str:
     """
-    This function is used only in :func:`fluvel.cli.commands.build.generate_themes`.
+    Joins tokens collapsing whitespace, which is only kept where it is significant
+    (e.g., descendant selectors or ``1px solid red``).
+    """
+    parts: list[str] = []
+    pending_space = False
+
+    for kind, text in tokens:
+        if kind == "space":
+            pending_space = bool(parts)
+            continue
+
+        if pending_space and parts[-1] not in NO_SPACE_AFTER and text not in NO_SPACE_BEFORE:
+            parts.append(" ")
+
+        pending_space = False
+        parts.append(text)
+
+    return "".join(parts)
+
+
+def parse_qss(qss: str) -> list[QSSRule] | None:
+    """
+    Parses a stylesheet into rules, or returns None if it is malformed (unbalanced braces).
+    """
+    rules: list[QSSRule] = []
+    selector: list[tuple[str, str]] = []
+    declaration: list[tuple[str, str]] = []
+    declarations: list[list[tuple[str, str]]] = []
+    in_block = False
+    depth = 0
+
+    for kind, text in tokenize(qss):
+        if not in_block:
+            if text == "{" and kind == "punct":
+                in_block = True
+            elif text == "}" and kind == "punct":
+                return None
+            else:
+                selector.append((kind, text))
+            continue
+
+        if kind == "punct":
+            if text == "{":
+                return None
+
+            if text == "}":
+                declarations.append(declaration)
+                rules.append(_build_rule(join_tokens(selector), declarations))
+                selector, declaration, declarations = [], [], []
+                in_block = False
+                continue
+
+            # Semicolons inside parentheses do not end the declaration
+            if text == "(":
+                depth += 1
+            elif text == ")":
+                depth = max(depth - 1, 0)
+            elif text == ";" and depth == 0:
+                declarations.append(declaration)
+                declaration = []
+                continue
+
+        declaration.append((kind, text))
+
+    if in_block or join_tokens(selector):
+        return None
+
+    return rules
+
+
+def _build_rule(selector: str, declarations: list[list[tuple[str, str]]]) -> QSSRule:
+    rule = QSSRule(selector, {})
+
+    for tokens in declarations:
+        if not (text := join_tokens(tokens)):
+            continue
+
+        prop, separator, _ = text.partition(":")
+
+        # Declarations without value are kept as they are
+        key = prop.strip().lower() if separator else text
+
+        _set_declaration(rule.declarations, key, text)
+
+    return rule
+
+
+def _is_important(declaration: str) -> bool:
+    return declaration.replace(" ", "").lower().endswith("!important")
+
+
+def _set_declaration(declarations: dict[str, str], key: str, text: str) -> None:
+    # A later declaration overrides the previous one, unless only the previous one is !important
+    if (previous := declarations.get(key)) is not None:
+        if _is_important(previous) and not _is_important(text):
+            return
+
+        del declarations[key]
+
+    declarations[key] = text
+
+
+SHORTHAND_FAMILIES = frozenset({"padding", "margin", "border", "background", "font", "outline"})
+"""Shorthands whose longhands (``padding-left``, ``border-top-color``...) set the same values."""
+
+
+def property_family(key: str) -> str:
+    """
+    Returns the shorthand family of a property (``padding-left`` → ``padding``),
+    or the property itself.
+    """
+    family = key.partition("-")[0]
+    return family if family in SHORTHAND_FAMILIES else key
+
+
+def drop_overridden(rules: list[QSSRule]) -> None:
+    """
+    Removes the declarations that a later rule with the same selector sets again.
+
+    The later rule always wins (same elements, same specificity, later position),
+    so this is safe regardless of the rules in between.
+    """
+    overridden: dict[str, dict[str, bool]] = {}
+
+    for rule in reversed(rules):
+        later = overridden.setdefault(rule.selector, {})
+
+        for key, text in list(rule.declarations.items()):
+            is_important = _is_important(text)
+
+            if key in later and (later[key] or not is_important):
+                del rule.declarations[key]
+            else:
+                later[key] = is_important
+
+
+def optimize_rules(rules: list[QSSRule]) -> list[QSSRule]:
+    """
+    Removes redundant rules without changing the result of the cascade.
+
+    * Declarations overridden later in the same rule (or by a later rule
+      with the same selector) are dropped.
+    * Rules with the same selector are merged.
+    * Rules with the same declarations are folded into a selector list.
+
+    Both merges move the declarations of a rule to the position of a previous one,
+    so they are only applied if no rule in between sets any of those properties.
+    A shorthand and its longhands (``padding`` and ``padding-left``) count as the
+    same property, since either one overrides the other.
+    """
+    drop_overridden(rules)
+
+    output: list[QSSRule] = []
+    by_selector: dict[str, int] = {}
+    by_block: dict[str, int] = {}
+    last_touch: dict[str, int] = {}
+
+    for rule in rules:
+        if not rule.declarations:
+            continue
+
+        # The last position in the output that sets any of the properties of the rule
+        families = {property_family(key) for key in rule.declarations}
+        barrier = max((last_touch.get(family, -1) for family in families), default=-1)
+
+        target = by_selector.get(rule.selector)
+
+        if target is not None and target >= barrier:
+            merged = output[target]
+
+            if by_block.get(merged.block) == target:
+                del by_block[merged.block]
+
+            for key, text in rule.declarations.items():
+                _set_declaration(merged.declarations, key, text)
+
+            by_block[merged.block] = target
+
+        elif (target := by_block.get(rule.block)) is not None and target >= barrier:
+            folded = output[target]
+
+            if by_selector.get(folded.selector) == target:
+                del by_selector[folded.selector]
+
+            folded.selector = f"{folded.selector},{rule.selector}"
+
+            by_selector[folded.selector] = target
+
+        else:
+            target = len(output)
+            output.append(rule)
+            by_selector[rule.selector] = target
+            by_block[rule.block] = target
+
+        for family in families:
+            last_touch[family] = max(last_touch.get(family, -1), target)
+
+    return output
+
+
+def minify_qss(qss: str, optimize: bool = True) -> str:
+    """
+    This function is used by ``fluvel build`` to write the production themes.
     It removes comments, unnecessary whitespace, and line breaks
     to reduce file size and speed up parsing in Qt.
+
+    The stylesheet is tokenized, so strings (``url("...")``, quoted font names) are
+    preserved. With ``optimize``, redundant rules and declarations are also removed
+    (see :func:`optimize_rules`). A malformed stylesheet is only minified.
+
+    :param qss: The stylesheet to minify.
+    :type qss: str
+    :param optimize: If True, merges and folds redundant rules.
+    :type optimize: bool
+    :rtype: str
     """
-    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.DOTALL)
-    qss = re.sub(r"\s*([\{\}\:\;\,\>])\s*", r"\1", qss)
-    qss = re.sub(r"\s+", " ", qss)
-    return qss.strip()
+    rules = parse_qss(qss)
+
+    if rules is None:
+        return join_tokens(list(tokenize(qss)))
+
+    if optimize:
+        rules = optimize_rules(rules)
+
+    return "".join(f"{rule.selector}{{{rule.block}}}" for rule in rules if rule.declarations)
@@ -33,6 +33,9 @@ STUBS_DIR = FLUVEL_DIR / "stubs"
 SCHEMA_DIR = FLUVEL_DIR / "schema"
 CONFIG_SCHEMA_PATH = SCHEMA_DIR / "config.schema.json"
 XML_SCHEMA_PATH = SCHEMA_DIR / "menu.schema.xsd"
+CACHE_DIR = FLUVEL_DIR / "cache"
+THEME_CACHE_DIR = CACHE_DIR / "themes"
+I18N_CACHE_DIR = CACHE_DIR / "i18n"
 
 # Resource Directories (Development)
 STATIC_DIR = PROJECT_ROOT / "static"
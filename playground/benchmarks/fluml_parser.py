@@ -0,0 +1,146 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+"""
+Compares the previous 14-pass regex pipeline of FLUML with the single-pass renderer.
+
+Usage: python playground/benchmarks/fluml_parser.py [--entries N]
+
+A synthetic catalog of N entries (most of them plain text, like real catalogs) is
+parsed with both implementations. The output is checked to be identical on the
+well-formed cases before measuring.
+"""
+
+import argparse
+import html
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from fluvel.engines.fluml import FlumlParser  # noqa: E402
+
+# The implementation replaced by the single-pass renderer
+LEGACY_RULES = [
+    (r"\[\s*([#a-zA-Z0-9(),\.\s%]+)\s*\|\s*([^\]]+)\s*\]", r"<span style='color:\1;'>\2</span>"),
+    (r"(?<!\\)\{\s*([^\s|{}](?:[^|{}]*[^\s|{}])?)\s*\|\s*([^\s|{}]+)\s*\}", r"<a href='\2'>\1</a>"),
+    (r"\*\*\*(.+?)\*\*\*", r"<b><i>\1</i></b>"),
+    (r"\*\*(.+?)\*\*", r"<b>\1</b>"),
+    (r"\*(.+?)\*", r"<i>\1</i>"),
+    (r"__(.+?)__", r"<u>\1</u>"),
+    (r"(?<!-)--([^\s-].*?[^\s-])--(?!-)", r"<s>\1</s>"),
+    (r"\^\^(.+?)\^\^", r"<sup>\1</sup>"),
+    (r"~~(.+?)~~", r"<sub>\1</sub>"),
+    (r"\\n", r"<br>"),
+    (r"\\\{", "{"),
+    (r"\\\}", "}"),
+    (r"\\\[", "["),
+    (r"\\\]", "]"),
+]
+LEGACY_COMPILED = [(re.compile(p), r) for p, r in LEGACY_RULES]
+
+
+def legacy_apply_styles(text: str) -> str:
+    text = html.escape(text, quote=False)
+    for pattern, replacement in LEGACY_COMPILED:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+CASES = [
+    "Title of the Home Page",
+    "**Hi!** {name}, this is *a* __demonstration__.",
+    "Check our *{ Youtube | https://www.youtube.com }* channel.",
+    "This is the first line. \\n But this marker forces a real break in the UI.",
+    "***Important*** and **bold *nested* text** with ^^sup^^ and ~~sub~~",
+    "[red|Alert] or [rgba(0,0,0,0.5)|Ghost] and [ #FF0000 | **Error** ]",
+    "--struck text-- but not -- this -- nor ---this--- or a-b",
+    "--a--b-- and 2 * 3 * 4",
+    "Escapes: \\[brackets\\] with <tags> & entities",
+    "snake_case_name and __init__ with {placeholder} and {count:02d}",
+    "[blue|{ docs | https://example.com/a_b }] **after**",
+    "***bold* text**",
+    "*italic **bold***",
+    "\\{not a link | x\\}",
+]
+
+# Cases fixed by the single-pass renderer (the legacy pipeline produced broken HTML)
+FIXED = {
+    "{ docs | https://example.com/a--b--c }": "<a href='https://example.com/a--b--c'>docs</a>",
+    "{ docs | https://example.com/**x** }": "<a href='https://example.com/**x**'>docs</a>",
+    "**a *b** c*": "<b>a *b</b> c*",
+    "**bold *and italic***": "<b>bold <i>and italic</i></b>",
+    "***a** b*": "<i><b>a</b> b</i>",
+}
+
+
+def synthetic_catalog(entries: int) -> str:
+    random.seed(0)
+    words = "the quick brown fox jumps over lazy dog settings profile account".split()
+    lines = []
+
+    for i in range(entries):
+        text = " ".join(random.choices(words, k=8))
+
+        # One in five entries uses inline syntax
+        if i % 5 == 0:
+            text = random.choice(CASES)
+
+        lines.append(f".. entry.{i}: {text}")
+
+    return "\n".join(lines)
+
+
+def measure(function, *args, repeat: int = 3):
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+
+    return result, best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for case in CASES:
+        expected, actual = legacy_apply_styles(case), FlumlParser._apply_styles(case)
+        assert expected == actual, f"\n{case}\n  legacy: {expected}\n  single: {actual}"
+
+    for case, expected in FIXED.items():
+        assert FlumlParser._apply_styles(case) == expected, case
+
+    catalog = synthetic_catalog(args.entries)
+    blocks = {}
+
+    # Same block extraction for both, only the inline rendering is compared
+    for line in catalog.splitlines():
+        block_id, _, content = line[3:].partition(": ")
+        blocks[block_id] = content
+
+    def legacy() -> dict[str, str]:
+        return {key: legacy_apply_styles(value) for key, value in blocks.items()}
+
+    def single_pass() -> dict[str, str]:
+        return {key: FlumlParser._apply_styles(value) for key, value in blocks.items()}
+
+    old, old_ms = measure(legacy)
+    new, new_ms = measure(single_pass)
+
+    assert old == new
+
+    print(f"Entries      : {args.entries:>10,}")
+    print(f"14-pass regex: {old_ms:10.1f} ms")
+    print(f"Single pass  : {new_ms:10.1f} ms ({old_ms / new_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+"""
+Compares the previous regex minification with the tokenizer-based optimizer.
+
+Usage: python playground/benchmarks/qss_optimizer.py [theme_dir] [--copies N]
+
+The theme is replicated N times (as large themes usually repeat the same widget rules
+with small changes) and, if PySide6 is available, the time Qt needs to parse the
+sheet and polish a tree of widgets is measured for both outputs.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from fluvel.utils.minify_qss import minify_qss  # noqa: E402
+
+
+def regex_minify(qss: str) -> str:
+    # The implementation replaced by the optimizer
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.DOTALL)
+    qss = re.sub(r"\s*([\{\}\:\;\,\>])\s*", r"\1", qss)
+    qss = re.sub(r"\s+", " ", qss)
+    return qss.strip()
+
+
+# Rules that must not be merged, because a rule in between sets the same property family
+CASCADE = {
+    "QFrame QLabel{padding-left:4px} QWidget QLabel{padding:0} QDialog QLabel{padding-left:4px}": (
+        "QFrame QLabel{padding-left:4px}QWidget QLabel{padding:0}QDialog QLabel{padding-left:4px}"
+    ),
+    "A{border-color:red} B{border:0} A{border-width:1px}": (
+        "A{border-color:red}B{border:0}A{border-width:1px}"
+    ),
+    "A{color:red} B{padding:0} C{color:red}": "A,C{color:red}B{padding:0}",
+}
+
+
+def measure(function, *args, repeat: int = 5):
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+
+    return result, best * 1000
+
+
+def qt_parse_time(qss: str) -> float | None:
+    try:
+        from PySide6.QtWidgets import QApplication, QCheckBox, QLabel, QPushButton, QWidget
+    except ImportError:
+        return None
+
+    app = QApplication.instance() or QApplication([])
+
+    root = QWidget()
+    for i in range(300):
+        for widget_class in (QLabel, QPushButton, QCheckBox):
+            widget = widget_class(str(i), root)
+            widget.setProperty("class", "rounded-md p-2")
+
+    start = time.perf_counter()
+    app.setStyleSheet(qss)
+    for child in root.findChildren(QWidget):
+        child.ensurePolished()
+    elapsed = time.perf_counter() - start
+
+    app.setStyleSheet("")
+    root.deleteLater()
+
+    return elapsed * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "theme_dir",
+        nargs="?",
+        default=ROOT / "playground" / "example_app" / "static" / "themes" / "bootstrap",
+        type=Path,
+    )
+    parser.add_argument("--copies", type=int, default=10)
+    args = parser.parse_args()
+
+    for source, expected in CASCADE.items():
+        actual = minify_qss(source)
+        assert actual == expected, f"\n{source}\n  expected: {expected}\n  actual:   {actual}"
+
+    theme = "\n".join(f.read_text(encoding="utf-8") for f in sorted(args.theme_dir.rglob("*.qss")))
+    source = "\n".join([theme] * args.copies)
+
+    old, old_ms = measure(regex_minify, source)
+    new, new_ms = measure(minify_qss, source)
+
+    print(f"Source            : {len(source):>10,} bytes ({args.copies} copies)")
+    print(f"Regex minify      : {len(old):>10,} bytes in {old_ms:8.2f} ms")
+    print(f"Tokenizer+optimize: {len(new):>10,} bytes in {new_ms:8.2f} ms")
+
+    if (old_qt := qt_parse_time(old)) is not None:
+        new_qt = qt_parse_time(new)
+        print(f"Qt parse + polish : {old_qt:8.2f} ms (regex) vs {new_qt:8.2f} ms (optimized)")
+    else:
+        print("Qt parse + polish : skipped (PySide6 is not installed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+"""
+Compares the page stylesheet of one rule per widget with the shared rules of
+``shared_styles = true`` (one rule per unique style).
+
+Usage: python playground/benchmarks/shared_styles.py [--widgets N] [--styles K]
+
+N buttons are styled with K distinct style strings, and the size of the page sheet and
+the time Qt needs to apply it (``setStyleSheet``) and to polish the widgets are measured.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QPushButton, QWidget  # noqa: E402
+
+from fluvel.engines.qss.qss import QSSProcessor  # noqa: E402
+from fluvel.engines.qss.StyleManager import StyleManager  # noqa: E402
+
+
+def build_page(count: int, styles: list[str], shared: bool) -> tuple[QWidget, str]:
+    page = QWidget()
+    rules = {}
+
+    for i in range(count):
+        style = styles[i % len(styles)]
+        button = QPushButton(str(i), page)
+        button.setObjectName(f"QPushButton_{i}")
+
+        if shared:
+            key = StyleManager._shared_key("QPushButton", style)
+            button.setProperty(QSSProcessor.SHARED_PROPERTY, key)
+            rules[i] = QSSProcessor.process(style, "QPushButton", key, shared=True)
+        else:
+            selector = StyleManager.PAGE_SELECTOR.format(id=button.objectName())
+            button.setProperty(StyleManager.PAGE_PROPERTY, True)
+            rules[i] = QSSProcessor.process(style, "QPushButton", selector)
+
+    # The same join as StyleManager.commit
+    return page, "".join(dict.fromkeys(rules.values()))
+
+
+def measure(
+    count: int, styles: list[str], shared: bool, repeat: int = 3
+) -> tuple[int, float, float]:
+    best_apply = best_polish = float("inf")
+
+    for _ in range(repeat):
+        page, sheet = build_page(count, styles, shared)
+
+        start = time.perf_counter()
+        page.setStyleSheet(sheet)
+        applied = time.perf_counter()
+
+        for child in page.findChildren(QWidget):
+            child.ensurePolished()
+
+        polished = time.perf_counter()
+        page.deleteLater()
+
+        best_apply = min(best_apply, applied - start)
+        best_polish = min(best_polish, polished - applied)
+
+    return len(sheet), best_apply * 1000, best_polish * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--widgets", type=int, default=3000)
+    parser.add_argument("--styles", type=int, default=10)
+    args = parser.parse_args()
+
+    QApplication.instance() or QApplication([])
+
+    styles = [
+        f"bg[#{i:03x}] fg[white] br[{i % 8}px] p[4px] h::bg[#555]" for i in range(args.styles)
+    ]
+
+    # The shared sheet is identical for every widget count above the number of styles
+    _page, sheet = build_page(len(styles) * 2, styles, shared=True)
+    assert sheet.count("{") == len(styles) * 2, sheet
+
+    for shared in (False, True):
+        size, apply_ms, polish_ms = measure(args.widgets, styles, shared)
+        label = "Shared rules " if shared else "Rule per widget"
+        print(f"{label:<16}: {size:>10,} bytes, setStyleSheet {apply_ms:8.2f} ms, "
+              f"polish {polish_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from types import SimpleNamespace
+
+import pytest
+
+from fluvel.components.widgets.FInput import FInput
+from fluvel.components.widgets.FLabel import FLabel
+from fluvel.core.exceptions.state_manager import FluvelBindingError, FluvelStateError
+from fluvel.reactive.Model import Model
+from fluvel.reactive.StateManager import BindingPath, StateManager
+
+
+class Profile(Model):
+    user: dict = {}
+    items: list = []
+
+
+@pytest.fixture
+def profile(qapp):
+    model = Profile(
+        ref="test_profile",
+        user={"address": {"city": "Lima"}},
+        items=[{"name": "first"}, SimpleNamespace(name="second")],
+    )
+    yield model
+    model.destroy()
+
+
+@pytest.mark.parametrize(
+    ("path", "steps"),
+    [
+        (".address.city", ((False, "address"), (False, "city"))),
+        ("[3].name", ((True, 3), (False, "name"))),
+        ("[-1]", ((True, -1),)),
+        ("['key'][\"other\"]", ((True, "key"), (True, "other"))),
+    ],
+)
+def test_paths_are_parsed_into_steps(path, steps):
+    assert BindingPath(path).steps == steps
+
+
+def test_invalid_paths_raise():
+    with pytest.raises(FluvelBindingError):
+        BindingPath(".address..city")
+
+
+def test_compile_is_cached_per_path():
+    assert BindingPath.compile(".a.b") is BindingPath.compile(".a.b")
+
+
+def test_get_accesses_keys_indexes_and_attributes():
+    root = {"items": [{"name": "a"}, SimpleNamespace(name="b")]}
+
+    assert BindingPath(".items[0].name").get(root) == "a"
+    assert BindingPath(".items[1].name").get(root) == "b"
+    assert BindingPath(".items[-1].name").get(root) == "b"
+
+
+def test_missing_steps_resolve_to_none():
+    root = {"items": []}
+
+    assert BindingPath(".items[0].name").get(root) is None
+    assert BindingPath(".missing.name").get(root) is None
+    assert BindingPath("[0]").get(None) is None
+
+
+def test_set_writes_the_leaf_and_notifies_the_root(profile):
+    BindingPath(".address.city").set(profile, "user", "Quito")
+    assert profile.user["address"]["city"] == "Quito"
+
+    with pytest.raises(FluvelStateError):
+        BindingPath(".missing.city").set(profile, "user", "Quito")
+
+
+def test_deep_binding_follows_the_model(profile):
+    city, name, missing = FLabel(), FLabel(), FLabel()
+
+    StateManager.bind(city, "text:@test_profile.user.address.city")
+    StateManager.bind(name, "text:@test_profile.items[1].name")
+    StateManager.bind(missing, "text:@test_profile.user.missing.city")
+
+    assert (city.text(), name.text(), missing.text()) == ("Lima", "second", "")
+
+    profile.user = {"address": {"city": "Quito"}}
+    profile.items[1] = {"name": "replaced"}
+
+    assert (city.text(), name.text()) == ("Quito", "replaced")
+
+
+def test_two_way_deep_binding_writes_the_path(profile):
+    city, field = FLabel(), FInput()
+
+    StateManager.bind(city, "text:@test_profile.user.address.city")
+    StateManager.bind(field, "text:textChanged:@test_profile.user.address.city")
+    assert field.text() == "Lima"
+
+    field.setText("Cusco")
+
+    assert profile.user["address"]["city"] == "Cusco"
+    assert city.text() == "Cusco"
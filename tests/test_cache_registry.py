@@ -0,0 +1,80 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+
+from fluvel.utils.cache_registry import CacheRegistry
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    # Test caches only, the caches of Fluvel are left untouched
+    monkeypatch.setattr(CacheRegistry, "_functions", {})
+    monkeypatch.setattr(CacheRegistry, "_mappings", {})
+
+    @CacheRegistry.lru("test_square", maxsize=2)
+    def square(n: int) -> int:
+        return n * n
+
+    languages: dict[str, str] = {}
+    classes: dict[str, type] = {"Button": object}
+
+    CacheRegistry.register_mapping("test_languages", languages, maxsize=3)
+    CacheRegistry.register_mapping("test_classes", classes)
+
+    return square
+
+
+def stats(name: str):
+    return next(s for s in CacheRegistry.report() if s.name == name)
+
+
+def test_lru_counts_hits_misses_and_evictions(caches):
+    for n in (1, 2, 1, 3):
+        caches(n)
+
+    s = stats("test_square")
+    assert (s.maxsize, s.currsize, s.hits, s.misses, s.evictions) == (2, 2, 1, 3, 1)
+    assert s.hit_ratio == 0.25
+
+
+def test_configure_resizes_functions_and_mappings(caches):
+    assert CacheRegistry.configure({"test_square": 8, "test_languages": -1}) == []
+
+    assert stats("test_square").maxsize == 8
+    assert stats("test_languages").maxsize is None
+
+
+def test_resize_keeps_the_statistics(caches):
+    caches(1)
+    caches(1)
+    CacheRegistry.configure({"test_square": 4})
+
+    s = stats("test_square")
+    assert (s.currsize, s.hits, s.misses) == (0, 1, 1)
+
+
+def test_configure_warns_instead_of_raising(caches):
+    warnings = CacheRegistry.configure(
+        {"test_classes": 10, "unknown": 10, "test_square": "big", "test_languages": 5}
+    )
+
+    assert len(warnings) == 3
+    assert "'test_classes' is bounded by its contents" in warnings[0]
+    assert "Unknown cache 'unknown'" in warnings[1]
+    assert "test_classes" not in warnings[1]
+    assert "must be an integer" in warnings[2]
+
+    # The valid entries are still applied
+    assert stats("test_languages").maxsize == 5
+    assert stats("test_classes").maxsize is None
+
+
+def test_report_marks_the_fixed_caches(caches):
+    assert stats("test_classes").configurable is False
+    assert stats("test_languages").configurable is True
+
+    report = CacheRegistry.format_report()
+    assert "1 (fixed)" in report
+    assert "0/3" in report
+    assert "not configurable in [fluvel.cache]" in report
@@ -0,0 +1,55 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+
+from fluvel.engines.fluml import FlumlParser, convert_FLUML_to_HTML
+from fluvel.i18n.I18nMessage import I18nMessage
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Title of the Home Page", "Title of the Home Page"),
+        ("**Hi!** *a* __b__", "<b>Hi!</b> <i>a</i> <u>b</u>"),
+        ("***Important***", "<b><i>Important</i></b>"),
+        ("^^sup^^ and ~~sub~~", "<sup>sup</sup> and <sub>sub</sub>"),
+        ("--struck text-- but not ---this---", "<s>struck text</s> but not ---this---"),
+        ("first \\n second", "first <br> second"),
+        ("[red|Alert]", "<span style='color:red;'>Alert</span>"),
+        ("[#FF0000|**Error**]", "<span style='color:#FF0000;'><b>Error</b></span>"),
+        ("{ docs | https://example.com }", "<a href='https://example.com'>docs</a>"),
+        ("<tags> & entities", "&lt;tags&gt; &amp; entities"),
+        ("{name} and {count:02d}", "{name} and {count:02d}"),
+        # Fixed by the single-pass renderer
+        ("{ docs | https://example.com/a--b--c }", "<a href='https://example.com/a--b--c'>docs</a>"),
+        ("**a *b** c*", "<b>a *b</b> c*"),
+        ("**bold *and italic***", "<b>bold <i>and italic</i></b>"),
+        ("***a** b*", "<i><b>a</b> b</i>"),
+    ],
+)
+def test_render(text, expected):
+    assert FlumlParser.render(text) == expected
+
+
+def test_escapes_are_literal_as_before_the_single_pass_renderer():
+    # Same output as the previous regex pipeline
+    assert FlumlParser.render("\\{not a link | x\\}") == "{not a link | x}"
+    assert FlumlParser.render("\\[brackets\\]") == "[brackets]"
+    assert FlumlParser.render("[blue|\\{x\\}]") == "<span style='color:blue;'>{x}</span>"
+
+
+def test_escaped_braces_are_literal_in_every_output():
+    fluml = ".. title: \\{not a link | x\\} **{name}**"
+    expected = "{not a link | x} <b>{name}</b>"
+
+    assert FlumlParser.parse(fluml) == {"title": expected}
+    assert convert_FLUML_to_HTML(fluml) == {"title": expected}
+
+
+def test_escaped_braces_are_not_placeholders_when_formatted():
+    text = FlumlParser.render("\\{name\\} is {name}", icu=True)
+    assert I18nMessage.compile(text, "en").format({"name": "Ana"}) == "{name} is Ana"
+
+    text = FlumlParser.render("\\{literal\\}", icu=True)
+    assert I18nMessage.compile(text, "en").format({}) == "{literal}"
@@ -0,0 +1,98 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import threading
+
+import pytest
+
+from fluvel.i18n.data_structures import I18nRawContent
+from fluvel.i18n.I18nLoader import I18nLoader
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    # Languages read from disk, each read returns new content
+    reads: list[str] = []
+
+    def read(lang, in_production):
+        reads.append(lang)
+        return I18nRawContent({}, {"lang": lang})
+
+    monkeypatch.setattr(I18nLoader, "read", read)
+    monkeypatch.setattr(I18nLoader._loaded_counter, "maxsize", 3)
+    I18nLoader.clear()
+    yield reads
+    I18nLoader.clear()
+
+
+def test_loaded_languages_are_not_read_again(reads):
+    first = I18nLoader.load("en", False)
+    I18nLoader.load("es", False)
+
+    assert I18nLoader.load("en", False) is first
+    assert reads == ["en", "es"]
+
+
+def test_least_recently_used_languages_are_discarded(reads):
+    I18nLoader._loaded_counter.maxsize = 2
+
+    for lang in ("en", "es", "fr"):
+        I18nLoader.load(lang, False)
+
+    assert list(I18nLoader._loaded) == ["es", "fr"]
+
+    I18nLoader.load("en", False)
+    assert reads == ["en", "es", "fr", "en"]
+
+
+def test_files_are_read_without_the_lock(monkeypatch, reads):
+    en = I18nLoader.load("en", False)
+
+    started, release = threading.Event(), threading.Event()
+    read = I18nLoader.read
+
+    def slow_read(lang, in_production):
+        started.set()
+        release.wait(5)
+        return read(lang, in_production)
+
+    monkeypatch.setattr(I18nLoader, "read", slow_read)
+    thread = threading.Thread(target=I18nLoader._get, args=("es", False, True))
+    thread.start()
+    started.wait(5)
+
+    # A loaded language is returned while the other thread reads its files
+    assert I18nLoader._lock.acquire(timeout=1)
+    I18nLoader._lock.release()
+    assert I18nLoader._get("en", False) is en
+
+    release.set()
+    thread.join(5)
+    assert "es" in I18nLoader._loaded
+
+
+def test_first_stored_read_is_kept(monkeypatch, reads):
+    read = I18nLoader.read
+    other = I18nRawContent({}, {})
+
+    def racing_read(lang, in_production):
+        # Another thread stores the language during this read
+        I18nLoader._loaded[lang] = other
+        return read(lang, in_production)
+
+    monkeypatch.setattr(I18nLoader, "read", racing_read)
+
+    assert I18nLoader.load("en", False) is other
+
+
+def test_reads_started_before_clear_are_not_stored(monkeypatch, reads):
+    read = I18nLoader.read
+
+    def cleared_read(lang, in_production):
+        I18nLoader.clear()
+        return read(lang, in_production)
+
+    monkeypatch.setattr(I18nLoader, "read", cleared_read)
+
+    assert I18nLoader._get("en", False).TEXTS == {"lang": "en"}
+    assert "en" not in I18nLoader._loaded
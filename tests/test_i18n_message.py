@@ -0,0 +1,85 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from types import SimpleNamespace
+
+import pytest
+
+from fluvel.i18n.I18nMessage import I18nMessage
+
+FILES = "{n, plural, =0 {No files} one {# file} other {# files}}"
+
+
+def format(text: str, lang: str = "en", **values) -> str:
+    return I18nMessage.compile(text, lang).format(values)
+
+
+@pytest.mark.parametrize(("n", "expected"), [(0, "No files"), (1, "1 file"), (5, "5 files")])
+def test_plural(n, expected):
+    assert format(FILES, n=n) == expected
+
+
+@pytest.mark.parametrize(
+    ("lang", "n", "expected"),
+    [
+        ("en", 0, "0 items"),
+        ("pt_BR", 0, "0 item"),
+        ("fr", 1, "1 item"),
+        ("pl", 3, "3 few"),
+        ("pl", 5, "5 many"),
+        ("ja", 1, "1 items"),
+    ],
+)
+def test_plural_rules_of_the_language(lang, n, expected):
+    text = "{n, plural, one {# item} few {# few} many {# many} other {# items}}"
+    assert format(text, lang, n=n) == expected
+
+
+def test_select():
+    text = "{gender, select, female {She} male {He} other {They}} left"
+
+    assert format(text, gender="female") == "She left"
+    assert format(text, gender="unknown") == "They left"
+
+
+def test_nested_plural_in_select():
+    text = "{g, select, female {{n, plural, one {Her # file} other {Her # files}}} other {}}"
+    assert format(text, g="female", n=2) == "Her 2 files"
+
+
+def test_field_access_conversion_and_spec():
+    text = "{user.name} {items[0]} {data[key]} {value!r} {count:03d}"
+    values = {
+        "user": SimpleNamespace(name="Ana"),
+        "items": ["a"],
+        "data": {"key": 1},
+        "value": "s",
+        "count": 7,
+    }
+
+    assert I18nMessage.compile(text).format(values) == "Ana a 1 's' 007"
+
+
+def test_missing_placeholders_are_kept():
+    assert format("Hi {name} {user.name}") == "Hi {name} {user.name}"
+
+
+def test_malformed_arguments_are_literal():
+    assert format("{n, plural, one {# file}") == "{n, plural, one {# file}"
+
+
+def test_tags_and_entities_are_verbatim():
+    text = "<span style='color:#fff;'>{n, plural, one {# file} other {# files}}</span> &amp;"
+    assert format(text, n=2) == "<span style='color:#fff;'>2 files</span> &amp;"
+
+
+def test_escaped_braces_are_literal():
+    assert format("&#123;name&#125; is {name}", name="Ana") == "{name} is Ana"
+    assert format("&#123;literal&#125;") == "{literal}"
+
+    # An escaped entity is not a brace
+    assert format("&amp;#123;") == "&amp;#123;"
+
+
+def test_compile_is_memoized():
+    assert I18nMessage.compile(FILES, "en") is I18nMessage.compile(FILES, "en")
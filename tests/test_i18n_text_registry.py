@@ -0,0 +1,167 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import gc
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QLabel, QWidget
+
+from fluvel.i18n.I18nProvider import I18nProvider
+from fluvel.i18n.I18nTextRegistry import I18nTextRegistry
+from fluvel.i18n.I18nTextVar import I18nTextVar
+
+TEXTS = {
+    "en": {"count": "{n, plural, one {# item} other {# items}}", "title": "Title"},
+    "es": {"count": "{n, plural, one {# elemento} other {# elementos}}", "title": "Título"},
+}
+
+
+def set_language(lang: str) -> None:
+    I18nProvider.language = lang
+    I18nProvider.texts = TEXTS[lang]
+    I18nProvider.get_text = I18nProvider.texts.get
+
+
+def delete(widget: QWidget) -> None:
+    widget.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    gc.collect()
+
+
+def er(id: str, **placeholders) -> I18nTextVar:
+    return I18nTextRegistry.intern(I18nTextVar, id, placeholders)
+
+
+def label(parent: QWidget, text_var: I18nTextVar) -> QLabel:
+    widget = QLabel(parent)
+    widget.setText(I18nTextRegistry.bind(text_var, widget, "setText"))
+    return widget
+
+
+@pytest.fixture(autouse=True)
+def language(qapp):
+    state = (I18nProvider.language, I18nProvider.texts, I18nProvider.get_text)
+    set_language("en")
+    yield
+    I18nProvider.language, I18nProvider.texts, I18nProvider.get_text = state
+
+
+def test_equal_calls_share_one_var(qapp):
+    page = QWidget()
+    first, second = label(page, er("count", n=1)), label(page, er("count", n=1))
+
+    assert er("count", n=1) is er("count", n=1)
+    assert er("count", n=1) is not er("count", n=2)
+    assert first.text() == second.text() == "1 item"
+
+    delete(page)
+
+
+def test_unhashable_placeholders_get_their_own_var(qapp):
+    assert er("count", n=[1]) is not er("count", n=[1])
+
+
+def test_var_is_released_with_its_last_binding(qapp):
+    page = QWidget()
+    text_var = er("count", n=7)
+    first, second = label(page, text_var), label(page, text_var)
+
+    delete(first)
+    assert er("count", n=7) is text_var
+
+    delete(second)
+    assert er("count", n=7) is not text_var
+
+    delete(page)
+
+
+def test_unbound_vars_are_not_kept(qapp):
+    for n in range(100):
+        assert er("count", n=n).value
+
+    gc.collect()
+    assert not any(key[1] == "count" for key in I18nTextRegistry._interned)
+
+
+def test_replace_interns_the_var_with_its_new_placeholders(qapp):
+    page = QWidget()
+    widget = label(page, text_var := er("count", n=1))
+
+    text_var.replace(n=3)
+
+    assert widget.text() == "3 items"
+    assert er("count", n=3) is text_var
+    assert er("count", n=1) is not text_var
+
+    delete(page)
+
+
+def test_refresh_updates_visible_widgets(qapp):
+    page = QWidget()
+    widget = label(page, er("title"))
+
+    set_language("es")
+    I18nTextRegistry.refresh()
+
+    assert widget.text() == "Título"
+
+    delete(page)
+
+
+def test_hidden_pages_are_flushed_when_shown(qapp):
+    visible, hidden = QWidget(), QWidget()
+    shown = label(visible, er("count", n=2))
+    deferred = label(hidden, er("count", n=5))
+
+    set_language("es")
+    I18nTextRegistry.defer([hidden])
+    I18nTextRegistry.refresh()
+
+    assert shown.text() == "2 elementos"
+    assert deferred.text() == "5 items"
+
+    # The text only displayed in the hidden page is not formatted until it is shown
+    assert er("count", n=5).stale
+
+    I18nTextRegistry.flush(hidden)
+    assert deferred.text() == "5 elementos"
+
+    delete(visible)
+    delete(hidden)
+
+
+def test_unbound_vars_are_formatted_when_read(qapp):
+    text_var = er("title")
+
+    set_language("es")
+    I18nTextRegistry.refresh()
+
+    assert text_var.stale
+    assert text_var.value == "Título"
+
+
+def test_listeners_are_notified_on_refresh(qapp):
+    received = []
+    text_var = er("title")
+    text_var.valueChanged.connect(received.append)
+
+    set_language("es")
+    I18nTextRegistry.refresh()
+
+    assert received == ["Título"]
+
+
+def test_pending_texts_are_dropped_with_their_page(qapp):
+    hidden = QWidget()
+    label(hidden, er("title"))
+
+    set_language("es")
+    I18nTextRegistry.defer([hidden])
+    I18nTextRegistry.refresh()
+
+    key = id(hidden)
+    assert key in I18nTextRegistry._pending
+
+    delete(hidden)
+    assert key not in I18nTextRegistry._pending
@@ -0,0 +1,63 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from click.testing import CliRunner
+
+from fluvel.cli.commands import lint as lint_command
+from fluvel.cli.commands.lint import lint, lint_module
+
+
+def test_invalid_styles_are_reported(tmp_path):
+    module = tmp_path / "page.py"
+    module.write_text('v.Button(style="color: $accent")\nv.Label(style="color: red")\n')
+
+    [(_, line, style, errors)] = lint_module(module, frozenset())
+
+    assert (line, style) == (1, "color: $accent")
+    assert errors == ("The variable '$accent' is not defined.",)
+
+
+def test_syntax_errors_are_reported(tmp_path):
+    module = tmp_path / "page.py"
+    module.write_text("x = 1\ndef broken(:\n")
+
+    [(file, line, style, errors)] = lint_module(module, frozenset())
+
+    assert file.endswith("page.py")
+    assert (line, style) == (2, "")
+    assert errors[0].startswith("SyntaxError")
+
+
+def test_undecodable_modules_are_reported(tmp_path):
+    module = tmp_path / "page.py"
+    module.write_bytes(b"x = 1\ny = '\xff'\n")
+
+    [(_, line, _, errors)] = lint_module(module, frozenset())
+
+    assert line == 2
+    assert errors[0].startswith("UnicodeDecodeError")
+
+
+def test_unreadable_modules_are_reported(tmp_path):
+    # A directory cannot be read as a file
+    module = tmp_path / "page.py"
+    module.mkdir()
+
+    [(_, line, _, errors)] = lint_module(module, frozenset())
+
+    assert line == 1
+    assert errors[0].startswith("IsADirectoryError")
+
+
+def test_unanalyzable_modules_fail_the_command(monkeypatch, tmp_path):
+    (tmp_path / "valid.py").write_text('v.Label(style="color: red")\n')
+    (tmp_path / "broken.py").write_text("def broken(:\n")
+
+    monkeypatch.setattr(lint_command, "UI_DIR", tmp_path)
+    monkeypatch.setattr(lint_command, "_theme_variables", frozenset)
+
+    result = CliRunner().invoke(lint, ["--workers", "1"])
+
+    assert result.exit_code == 1
+    assert "broken.py:1" in result.output
+    assert "SyntaxError" in result.output
@@ -0,0 +1,59 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from PySide6.QtCore import QObject
+
+from fluvel.reactive.RateLimiter import Debouncer, RateLimiter, Throttler
+
+
+@pytest.fixture
+def owner(qapp):
+    return QObject()
+
+
+def test_base_class_cannot_be_pushed_to(owner):
+    limiter = RateLimiter(lambda value: None, 10, owner)
+
+    with pytest.raises(NotImplementedError):
+        limiter.push(1)
+
+
+def test_create_uses_the_registered_kind(owner):
+    assert isinstance(RateLimiter.create("debounce", 10, print, owner), Debouncer)
+    assert isinstance(RateLimiter.create("throttle", 10, print, owner), Throttler)
+
+
+def test_debouncer_propagates_only_the_last_value(owner):
+    received = []
+    limiter = Debouncer(received.append, 1000, owner)
+
+    for value in range(5):
+        limiter.push(value)
+
+    assert received == []
+
+    limiter.flush()
+    assert received == [4]
+
+    # Nothing is pending after a flush
+    limiter.flush()
+    assert received == [4]
+
+
+def test_throttler_propagates_the_first_value_and_the_latest_per_window(owner):
+    received = []
+    limiter = Throttler(received.append, 1000, owner)
+
+    limiter.push(1)
+    limiter.push(2)
+    limiter.push(3)
+    assert received == [1]
+
+    # The trailing value of the window
+    limiter._on_timeout()
+    assert received == [1, 3]
+
+    # The window without new values ends without propagating anything
+    limiter._on_timeout()
+    assert received == [1, 3]
@@ -0,0 +1,97 @@
+# Copyright (C) 2025-2026 J. F. Escobar
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import itertools
+
+import pytest
+from PySide6.QtWidgets import QLabel, QWidget
+
+from fluvel.engines.qss.PageStyles import PageStyles
+from fluvel.engines.qss.qss import QSSProcessor
+from fluvel.engines.qss.StyleManager import StyleManager
+from fluvel.user.UserSettings import Settings
+
+COUNTER = itertools.count(1)
+
+
+class Label(QLabel):
+    # The attributes set by FWidget
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        self.class_name = "Label"
+        self.obj_name = f"Label_{next(COUNTER)}"
+        self.setObjectName(self.obj_name)
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    values = {"fluvel.lint": False}
+    monkeypatch.setattr(Settings, "get", lambda key, default=None: values.get(key, default))
+    return values
+
+
+def build(count: int, styles: list[str]) -> tuple[QWidget, list[Label], str]:
+    page = QWidget()
+    PageStyles.begin()
+
+    try:
+        labels = [Label(page) for _ in range(count)]
+
+        for label, style in zip(labels, itertools.cycle(styles)):
+            StyleManager.apply(label, style)
+
+        sheet = StyleManager.commit(page)
+    finally:
+        PageStyles.end()
+
+    page.setStyleSheet(sheet)
+    return page, labels, sheet
+
+
+def test_rule_per_widget_by_default(qapp, settings):
+    page, labels, sheet = build(4, ["fg[red]"])
+
+    assert sheet.count("{") == 4
+    assert all(label.objectName() in sheet for label in labels)
+
+
+def test_shared_styles_emit_one_rule_per_unique_style(qapp, settings):
+    settings["fluvel.shared_styles"] = True
+    page, labels, sheet = build(6, ["fg[red]", "fg[blue] h::fg[green]"])
+
+    # 'fg[red]' and the two states of the second style
+    assert sheet.count("{") == 3
+    assert not any(label.objectName() in sheet for label in labels)
+
+    keys = {label.property(QSSProcessor.SHARED_PROPERTY) for label in labels}
+    assert len(keys) == 2
+
+    for label in labels:
+        label.ensurePolished()
+
+    assert labels[0].palette().windowText().color().name() == "#ff0000"
+    assert labels[1].palette().windowText().color().name() == "#0000ff"
+
+
+def test_patching_a_shared_widget_only_changes_that_widget(qapp, settings):
+    settings["fluvel.shared_styles"] = True
+    page, labels, _sheet = build(2, ["fg[red]"])
+
+    StyleManager.apply(labels[0], "fg[blue]")
+
+    for label in labels:
+        label.ensurePolished()
+
+    assert not labels[0].property(QSSProcessor.SHARED_PROPERTY)
+    assert labels[1].property(QSSProcessor.SHARED_PROPERTY)
+    assert labels[0].palette().windowText().color().name() == "#0000ff"
+    assert labels[1].palette().windowText().color().name() == "#ff0000"
+
+
+def test_shared_rules_keep_the_selector_of_the_widget_rules(qapp):
+    per_widget = QSSProcessor.process("bg[red] h::bg[blue] md::p[4px]", "Label", "Label_1")
+    shared = QSSProcessor.process("bg[red] h::bg[blue] md::p[4px]", "Label", "s0", shared=True)
+
+    assert per_widget.replace("Label#Label_1", "X") == shared.replace(
+        'Label[shared_style="s0"]', "X"
+    )